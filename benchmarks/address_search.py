@@ -0,0 +1,56 @@
+"""Measures the hashes per second of the CREATE2 salt search and the keys
+per second of the account search, compared with calling
+:func:`cheb3.utils.calc_create2_address` per salt and creating accounts one
+by one.
+
+    python benchmarks/address_search.py [--salts 200000] [--workers N]
+"""
+
+import argparse
+import os
+import time
+
+import eth_account
+
+from cheb3.search import keccak_256, search_keys
+from cheb3.utils import calc_create2_address, find_create2_salt
+
+SENDER = "0x518C2143bDd79d3bc060BC4883d92D545D3E3bb0"
+INITCODE = "0x6019600c60003960196000f36f06bc8d9e5e9d436617b88de704a9f30760005260206000f3"
+
+
+def never(address: bytes) -> bool:
+    return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--salts", type=int, default=200000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    print(f"keccak backend: {keccak_256.__module__}")
+
+    n = args.salts // 20
+    start = time.perf_counter()
+    for salt in range(n):
+        calc_create2_address(SENDER, salt, INITCODE)
+    print(f"{'calc_create2_address per salt':<40} {n / (time.perf_counter() - start):>12.0f} hashes/s")
+
+    for workers in sorted({1, args.workers}):
+        result = find_create2_salt(SENDER, INITCODE, never, stop=args.salts, workers=workers)
+        print(f"{f'find_create2_salt, {workers} workers':<40} {result.rate:>12.0f} hashes/s")
+
+    n = args.salts // 200
+    start = time.perf_counter()
+    for _ in range(n):
+        eth_account.Account.create()
+    print(f"{'eth_account.Account.create':<40} {n / (time.perf_counter() - start):>12.0f} keys/s")
+
+    n = args.salts // 2
+    start = time.perf_counter()
+    search_keys(2**255, n, never)
+    print(f"{'search_keys, 1 worker':<40} {n / (time.perf_counter() - start):>12.0f} keys/s")
+
+
+if __name__ == "__main__":
+    main()
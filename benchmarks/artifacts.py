@@ -0,0 +1,55 @@
+"""Measures loading the ABI and bytecode of Foundry artifacts with a large
+AST, with `json.load` of the whole artifact and with `ArtifactStore`.
+
+    python benchmarks/artifacts.py [--artifacts 50] [--ast-size 2000000]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from cheb3.artifacts import ArtifactStore
+
+
+def write_artifacts(out: str, count: int, ast_size: int) -> None:
+    abi = [{"type": "function", "name": f"f{i}", "inputs": [], "outputs": []} for i in range(20)]
+    ast = {"nodes": [{"id": i, "nodeType": "Identifier", "src": "0:0:0"} for i in range(ast_size // 50)]}
+    for i in range(count):
+        os.makedirs(os.path.join(out, f"C{i}.sol"))
+        artifact = {"abi": abi, "bytecode": {"object": "0x" + "60" * 4000}, "methodIdentifiers": {}, "ast": ast}
+        with open(os.path.join(out, f"C{i}.sol", f"C{i}.json"), "w") as f:
+            json.dump(artifact, f)
+
+
+def measure(name: str, run) -> None:
+    start = time.perf_counter()
+    run()
+    print(f"{name:<50} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--artifacts", type=int, default=50)
+    parser.add_argument("--ast-size", type=int, default=2000000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as out:
+        write_artifacts(out, args.artifacts, args.ast_size)
+        names = [f"C{i}" for i in range(args.artifacts)]
+
+        def load_all():
+            for name in names:
+                with open(os.path.join(out, f"{name}.sol", f"{name}.json")) as f:
+                    compiled = json.load(f)
+                    (compiled["abi"], compiled["bytecode"]["object"])
+
+        measure("json.load", load_all)
+        store = ArtifactStore(out)
+        measure("ArtifactStore, first load", lambda: [store.get(name) for name in names])
+        measure("ArtifactStore, cached", lambda: [store.get(name) for name in names])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Measures the construction time and memory of the function wrappers of a
+contract with a large ABI.
+
+    python benchmarks/contract_functions.py [--functions 500] [--rounds 20]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from web3 import EthereumTesterProvider
+from web3.contract.contract import ContractCaller, ContractFunctions
+
+from cheb3 import Connection
+from cheb3.contract import ContractCallerWrapper, ContractFunctionsWrapper
+from cheb3.helper import Web3Helper
+
+ADDRESS = "0x" + "11" * 20
+
+
+class BenchmarkConnection(Connection):
+    def __init__(self) -> None:
+        self.w3 = Web3Helper(EthereumTesterProvider())
+
+
+def make_abi(size: int) -> list:
+    return [
+        {
+            "type": "function",
+            "name": f"function{i}",
+            "inputs": [{"type": "address", "name": "account"}, {"type": "uint256", "name": "amount"}],
+            "outputs": [{"type": "uint256", "name": ""}],
+            "stateMutability": "nonpayable",
+        }
+        for i in range(size)
+    ]
+
+
+def measure(name: str, build, rounds: int) -> None:
+    build()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        build()
+    elapsed = (time.perf_counter() - start) / rounds
+
+    tracemalloc.start()
+    obj = build()  # noqa: F841
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<50} {elapsed * 1000:>10.2f} ms {memory / 1024:>10.1f} KiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--functions", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    conn = BenchmarkConnection()
+    w3 = conn.w3
+    abi = make_abi(args.functions)
+    print(f"ABI with {args.functions} functions, mean of {args.rounds} rounds")
+
+    # web3.py builds every function eagerly, as cheb3 did before
+    measure("web3 ContractFunctions + ContractCaller", lambda: ContractCaller(abi, w3, ADDRESS), args.rounds)
+    measure("ContractFunctionsWrapper", lambda: ContractFunctionsWrapper(None, abi, w3, ADDRESS), args.rounds)
+    measure("ContractCallerWrapper", lambda: ContractCallerWrapper(abi, w3, ADDRESS), args.rounds)
+
+    def access_all():
+        functions = ContractFunctionsWrapper(None, abi, w3, ADDRESS)
+        for i in range(args.functions):
+            getattr(functions, f"function{i}")
+        return functions
+
+    measure("ContractFunctionsWrapper, all functions accessed", access_all, args.rounds)
+    measure("Contract", lambda: conn.contract(address=ADDRESS, abi=abi), args.rounds)
+
+    # the ABI-derived data is shared, each contract only binds its address
+    measure("1000 Contracts with the same ABI", lambda: [conn.contract(address=ADDRESS, abi=abi) for _ in range(1000)], 1)
+
+    def call_functions():
+        contracts = [conn.contract(address=ADDRESS, abi=abi) for _ in range(100)]
+        for contract in contracts:
+            contract.functions.function0(ADDRESS, 1)
+        return contracts
+
+    measure("100 Contracts with the same ABI, function built", call_functions, 1)
+
+
+if __name__ == "__main__":
+    main()
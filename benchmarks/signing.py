@@ -0,0 +1,60 @@
+"""Measures the signatures per second of signing and recovering raw message
+hashes in bulk, compared with signing them one by one with the private key.
+
+    python benchmarks/signing.py [--hashes 2000] [--workers N]
+"""
+
+import argparse
+import os
+import time
+
+import eth_account
+from web3 import EthereumTesterProvider
+
+from cheb3 import Connection
+from cheb3.helper import Web3Helper
+from cheb3.utils import recover_many
+
+
+class BenchmarkConnection(Connection):
+    def __init__(self) -> None:
+        self.w3 = Web3Helper(EthereumTesterProvider())
+
+
+def measure(name: str, run, n: int) -> None:
+    start = time.perf_counter()
+    run()
+    print(f"{name:<50} {n / (time.perf_counter() - start):>10.0f} /s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hashes", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    account = BenchmarkConnection().account()
+    hashes = [os.urandom(32) for _ in range(args.hashes)]
+    measure(
+        "eth_account _sign_hash with the private key",
+        lambda: [eth_account.Account._sign_hash(h, account.private_key) for h in hashes],
+        args.hashes,
+    )
+    for workers in sorted({1, args.workers}):
+        measure(
+            f"sign_raw_message_hashes, {workers} workers",
+            lambda: account.sign_raw_message_hashes(hashes, workers=workers, chunk_size=250),
+            args.hashes,
+        )
+
+    signatures = [sig.signature for sig in account.sign_raw_message_hashes(hashes)]
+    for workers in sorted({1, args.workers}):
+        measure(
+            f"recover_many, {workers} workers",
+            lambda: recover_many(hashes, signatures, workers=workers, chunk_size=250),
+            args.hashes,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
 from importlib.metadata import version
 
-from cheb3.connection import Connection
+from cheb3.connection import Connection, AsyncConnection
 
 __version__ = version("cheb3")
 
 __all__ = [
     "__version__",
     "Connection",
+    "AsyncConnection",
 ]
@@ -1,21 +1,123 @@
-from typing import cast, Union
+from typing import cast, Any, Awaitable, Callable, Dict, List, Sequence, Tuple, Union
+from collections import Counter
 from hexbytes import HexBytes
 import random
 import string
+import time
 
 from web3 import Web3
 from web3._utils.datatypes import PropertyCheckingFactory
+from web3.exceptions import TimeExhausted
 from web3.types import TxReceipt, AccessList
 from eth_typing import HexStr
 import eth_account
 from eth_account.datastructures import SignedMessage, SignedSetCodeAuthorization
 
-from cheb3.constants import GAS_BUFFER
-from cheb3.helper import Web3Helper
+from cheb3.helper import Web3Helper, AsyncWeb3Helper, is_nonce_error
+from cheb3.signing import map_chunks, sign_hashes, signed_message
+from cheb3.stats import instrument
 
 from loguru import logger
 
 
+class TransactionResult:
+    """The result of a transaction sent by :meth:`Account.send_transactions`
+    or :class:`TransactionScheduler <cheb3.scheduler.TransactionScheduler>`.
+
+    :ivar tx_hash: The transaction hash, :const:`None` if it failed to be broadcast.
+    :ivar receipt: The transaction receipt, :const:`None` if it is not mined.
+    :ivar error: The error raised while broadcasting or waiting for the receipt,
+        or if the transaction reverted.
+    :ivar sender: The address of the account that sent the transaction.
+    :ivar attempts: The number of attempts to send the transaction.
+    """
+
+    def __init__(
+        self, tx_hash: HexStr = None, receipt: TxReceipt = None, error: Exception = None, sender: str = None
+    ) -> None:
+        self.tx_hash = tx_hash
+        self.receipt = receipt
+        self.error = error
+        self.sender = sender
+        self.attempts = 1
+
+    def __repr__(self) -> str:
+        if self.success:
+            return f"<TransactionResult {self.tx_hash} block={self.receipt.blockNumber}>"
+        if self.error is None:
+            return f"<TransactionResult {self.tx_hash} pending>"
+        return f"<TransactionResult {self.tx_hash} error={self.error!r}>"
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.receipt is not None and self.receipt.status == 1
+
+
+class SendTransactionsReport:
+    """The report of :meth:`Account.send_transactions`. It can be iterated
+    and indexed like the list of :class:`TransactionResult` in the order
+    of the given transactions.
+
+    :ivar results: The results of the transactions.
+    :ivar elapsed: The wall time in seconds from building the first
+        transaction to receiving the last receipt.
+    :ivar txs_per_block: The number of transactions mined in each block.
+    """
+
+    def __init__(self, results: List[TransactionResult], elapsed: float) -> None:
+        self.results = results
+        self.elapsed = elapsed
+        self.txs_per_block: Dict[int, int] = dict(
+            sorted(Counter(r.receipt.blockNumber for r in results if r.receipt is not None).items())
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SendTransactionsReport {self.succeeded}/{len(self.results)} succeeded "
+            f"in {len(self.txs_per_block)} blocks, {self.elapsed:.2f}s>"
+        )
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> TransactionResult:
+        return self.results[index]
+
+    def __iter__(self):
+        return iter(self.results)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(r.success for r in self.results)
+
+    @property
+    def tx_per_second(self) -> float:
+        """The number of succeeded transactions per second of wall time."""
+        return self.succeeded / self.elapsed if self.elapsed else 0.0
+
+
+def _parse_transaction_item(item: Any) -> Tuple[HexStr, int, HexStr, Dict]:
+    """Returns `(to, value, data, kwargs)` for an item of :meth:`Account.send_transactions`."""
+    kwargs = dict()
+    if isinstance(item, tuple):
+        item, kwargs = item
+        kwargs = dict(kwargs)
+    if isinstance(item, dict):
+        kwargs = {**item, **kwargs}
+        return kwargs.pop("to", None), kwargs.pop("value", 0), kwargs.pop("data", "0x"), kwargs
+    # a contract function with arguments, e.g. `contract.functions.fn(*args)`
+    return item.address, kwargs.pop("value", 0), item._encode_transaction_data(), kwargs
+
+
+def _set_receipts(results: List[TransactionResult], receipts: List[TxReceipt], timeout: float) -> None:
+    for result, receipt in zip(results, receipts):
+        result.receipt = receipt
+        if receipt is None:
+            result.error = TimeExhausted(f"Transaction {result.tx_hash} is not in the chain after {timeout} seconds")
+        elif not receipt.status:
+            result.error = Exception(f"Transaction {result.tx_hash} failed.")
+
+
 class Account:
     """Please use :func:`cheb3.Connection.account` interface to
     create an account instance associated with the connection.
@@ -25,6 +127,10 @@ class Account:
        >>> account = conn.account("0xpr1vateK3y")
 
     If no private key is provided, a randomly generated private key will be used to create an account instance.
+
+    The account tracks its next nonce locally, so transactions can be sent back-to-back
+    (e.g. with ``wait_for_receipt=False``) or from multiple threads. The nonce is fetched
+    again from the node if a transaction is rejected for using an already used nonce.
     """
 
     w3: Web3Helper = None
@@ -51,6 +157,41 @@ class Account:
         eth_acct = cast(Account, PropertyCheckingFactory(cls.__name__, (cls,), {"w3": w3}))
         return eth_acct
 
+    def reset_nonce(self) -> None:
+        """Drops the locally tracked nonce. It will be fetched from the node
+        before sending the next transaction, e.g. after transactions of
+        this account were dropped from the mempool.
+        """
+        self.w3._get_nonce_manager(self.address).reset()
+
+    def _sign_and_send(self, build: Callable[[int], dict], nonce: int = None) -> HexStr:
+        """Builds the transaction with the given or the next nonce, signs and
+        broadcasts it. Threads sharing the account broadcast one at a time so
+        that nonces are handed out in order.
+        """
+        manager = self.w3._get_nonce_manager(self.address)
+        with manager.lock:
+            for resynced in (False, True):
+                with self.w3.stats.phase("build"):
+                    if nonce is None and manager.nonce is None:
+                        manager.nonce = self.w3.eth.get_transaction_count(self.address, "pending")
+                    tx = build(manager.nonce if nonce is None else nonce)
+                with self.w3.stats.phase("sign"):
+                    raw_tx = self.eth_acct.sign_transaction(tx).raw_transaction
+                try:
+                    with self.w3.stats.phase("broadcast"):
+                        tx_hash = self.w3.eth.send_raw_transaction(raw_tx).hex()
+                except Exception as e:
+                    if nonce is not None or resynced or not is_nonce_error(e):
+                        raise
+                    logger.debug(f"Nonce {tx['nonce']} of {self.address} has been used, resyncing ...")
+                    manager.reset()
+                    continue
+                manager.use(tx["nonce"])
+                if self.w3.gas_estimate_cache.enabled:
+                    self.w3.gas_estimate_cache.track(tx_hash, tx)
+                return tx_hash
+
     def sign_raw_message_hash(self, message_hash: HexStr) -> SignedMessage:
         """Signs a raw message hash with the account's private key.
 
@@ -77,7 +218,39 @@ class Account:
           importantly the fields: v, r, and s
         :rtype: ~eth_account.datastructures.SignedMessage
         """
-        return eth_account.Account._sign_hash(message_hash, self.private_key)
+        # the key object of the account is reused instead of parsing the private key again
+        return signed_message(bytes(HexBytes(message_hash)), self.eth_acct._key_obj)
+
+    def sign_raw_message_hashes(
+        self, message_hashes: Sequence[HexStr], workers: int = None, chunk_size: int = 1000
+    ) -> List[SignedMessage]:
+        """Signs many raw message hashes with the account's private key, in
+        chunks across worker processes.
+
+        Examples:
+
+            >>> msg_hashes = [Web3.solidity_keccak(["uint256", "address"], [i, account.address]) for i in range(10000)]
+            >>> sigs = account.sign_raw_message_hashes(msg_hashes)
+            >>> sigs[0].signature.hex()
+            'd79f7b6a5c832d450820a60ad7a99c2df98708c417c7c5cb52d0ee270cf7888f03702da2e2862f0d30386d32610c3f833d7dbd8d0ea06b7db2beb83d3656316d1c'
+
+        :param message_hashes: The hashes of the messages to sign.
+        :type message_hashes: Sequence[HexStr]
+        :param workers: The number of worker processes, defaults to the number
+            of CPUs. If 1 or there is only one chunk, the hashes are signed in
+            the current process.
+        :type workers: int
+        :param chunk_size: The number of hashes signed by a worker at a time,
+            defaults to 1000.
+        :type chunk_size: int
+
+        :returns: The signed messages in the order of the hashes.
+        :rtype: List[~eth_account.datastructures.SignedMessage]
+        """
+        message_hashes = [bytes(HexBytes(message_hash)) for message_hash in message_hashes]
+        if workers == 1 or len(message_hashes) <= chunk_size:
+            return [signed_message(message_hash, self.eth_acct._key_obj) for message_hash in message_hashes]
+        return map_chunks(sign_hashes, message_hashes, (bytes(self.eth_acct.key),), workers, chunk_size)
 
     def sign_authorization(self, target: HexStr, is_sender: bool = True, **kwargs) -> SignedSetCodeAuthorization:
         """Signs an authorization to be included in a EIP-7702 transaction.
@@ -103,17 +276,78 @@ class Account:
                 defaults to the chain ID of the current :class:`Connection <cheb3.connection.Connection>`.
             nonce (int): Allows to sign an authorization with a specific nonce.
         """
+        if "nonce" in kwargs:
+            nonce = kwargs["nonce"]
+        else:
+            manager = self.w3._get_nonce_manager(self.address)
+            # waits for a transaction of the account being sent, whose nonce is not used yet
+            with manager.lock:
+                if manager.nonce is None:
+                    manager.nonce = self.w3.eth.get_transaction_count(self.address, "pending")
+                nonce = manager.nonce + is_sender
         auth = {
-            "chainId": kwargs.get("chain_id", self.w3.eth.chain_id),
-            "nonce": kwargs.get("nonce", self.w3.eth.get_transaction_count(self.address) + is_sender),
+            "chainId": kwargs["chain_id"] if "chain_id" in kwargs else self.w3._get_chain_id(),
+            "nonce": nonce,
             "address": target,
         }
         return self.eth_acct.sign_authorization(auth)
 
     def get_balance(self) -> int:
         """Returns the balance of the account instance."""
-        return self.w3.eth.get_balance(self.eth_acct.address)
+        return self.w3._read(self.w3.eth.get_balance, self.eth_acct.address)
+
+    def send_transactions(self, txs: Sequence[Any], timeout: float = 120) -> SendTransactionsReport:
+        """Signs and broadcasts the transactions back-to-back with consecutive
+        nonces, then waits for all receipts together.
 
+        Examples:
+
+            >>> report = account.send_transactions(
+                [
+                    {"to": receiver, "value": 10**18},
+                    token.functions.approve(spender, 2**256 - 1),
+                    (token.functions.deposit(), {"value": 10**18, "gas_limit": 100000}),
+                ]
+            )
+            >>> report
+            <SendTransactionsReport 3/3 succeeded in 1 blocks, 1.02s>
+            >>> report[1].receipt.status
+            1
+
+        :param txs: The transactions. Each of them is a dict of the arguments of
+            :meth:`send_transaction` (`to`, `value`, `data` and keyword arguments),
+            a contract function with arguments, or a tuple of a contract function
+            and a dict of keyword arguments. Contract functions are signed by this account.
+        :type txs: Sequence[Any]
+        :param timeout: Seconds to wait for the receipts, defaults to 120.
+        :type timeout: float
+
+        :returns: The results in the order of the given transactions, whose
+            failures do not stop the others.
+        :rtype: SendTransactionsReport
+        """
+
+        start = time.monotonic()
+        results = []
+        for item in txs:
+            try:
+                to, value, data, kwargs = _parse_transaction_item(item)
+                kwargs["wait_for_receipt"] = False
+                results.append(TransactionResult(self.send_transaction(to, value, data, **kwargs), sender=self.address))
+            except Exception as e:
+                results.append(TransactionResult(error=e, sender=self.address))
+
+        pending = [r for r in results if r.tx_hash is not None]
+        _set_receipts(pending, self.w3.receipt_tracker.wait_many([r.tx_hash for r in pending], timeout), timeout)
+
+        report = SendTransactionsReport(results, time.monotonic() - start)
+        logger.info(
+            f"{report.succeeded}/{len(results)} transactions succeeded in {report.elapsed:.2f}s, "
+            f"transactions per block: {report.txs_per_block}"
+        )
+        return report
+
+    @instrument("Account.create_access_list")
     def create_access_list(self, to: Union[HexStr, None], value: int = 0, data: HexStr = "0x", **kwargs) -> AccessList:
         """Creates an EIP-2930 type access list based on
         the given transaction data.
@@ -155,11 +389,7 @@ class Account:
                 "data": data,
             }
         )
-        try:
-            estimate_gas = self.w3.eth.estimate_gas(tx) + GAS_BUFFER
-        except Exception:
-            estimate_gas = 3000000
-        tx["gas"] = kwargs.get("gas_limit", estimate_gas)
+        tx["gas"] = self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
         return self.w3.eth.create_access_list(tx, kwargs.get("block_identifier", "latest"))["accessList"]
 
     def call(self, to: HexStr, data: HexStr = "0x", **kwargs) -> HexBytes:
@@ -182,7 +412,8 @@ class Account:
 
         to = Web3.to_checksum_address(to)
 
-        return self.w3.eth.call(
+        return self.w3._read(
+            self.w3.eth.call,
             {
                 "to": to,
                 "from": self.address,
@@ -191,6 +422,7 @@ class Account:
             state_override=kwargs.get("state_override", None),
         )
 
+    @instrument("Account.send_transaction")
     def send_transaction(
         self, to: Union[HexStr, None], value: int = 0, data: HexStr = "0x", **kwargs
     ) -> Union[TxReceipt, HexStr]:
@@ -210,9 +442,13 @@ class Account:
             max_fee_per_gas (int): Specifies the maximum amount you are willing to pay,
                 inclusive of `baseFeePerGas` and `maxPriorityFeePerGas`. Its default value
                 is the sum of `maxPriorityFeePerGas` and twice the `baseFeePerGas` of the latest block.
+            fee_strategy (str): Prices the **EIP-1559** transaction from the recent
+                ``eth_feeHistory`` with the `cheap`, `normal` or `fast` strategy,
+                unless the fees are given. Check :class:`FeeOracle <cheb3.helper.FeeOracle>` for more details.
             gas_limit (int): Specifies the maximum gas the transaction can use.
             nonce (int): Allows to overwrite pending transactions that use
-                the same nonce.
+                the same nonce. Defaults to the next nonce tracked locally by
+                the account.
             access_list (List[Dict]): Specifies a list of addresses and storage
                 keys that the transaction plans to access (EIP-2930).
             authorization_list (List[SignedSetCodeAuthorization]): Specifies a
@@ -228,7 +464,106 @@ class Account:
         if to:
             to = Web3.to_checksum_address(to)
 
-        tx = self.w3._build_transaction(self.address, kwargs)
+        def build(nonce: int) -> dict:
+            tx = self.w3._build_transaction(self.address, {**kwargs, "nonce": nonce})
+            tx.update(
+                {
+                    "to": to,
+                    "value": value,
+                    "data": data,
+                }
+            )
+            tx["gas"] = self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+            return tx
+
+        tx_hash = self._sign_and_send(build, kwargs.get("nonce"))
+        logger.info(f"Transaction to {to}: {tx_hash}")
+        if not kwargs.get("wait_for_receipt", True):
+            return tx_hash
+        with self.w3.stats.phase("mined"):
+            receipt = self.w3.receipt_tracker.wait(tx_hash)
+        if not receipt.status:
+            raise Exception(f"Transact to {to} failed.")
+        return receipt
+
+
+class AsyncAccount(Account):
+    """The asynchronous version of :class:`Account`. Please use
+    :func:`cheb3.AsyncConnection.account` interface to create an account
+    instance associated with the async connection.
+
+    Methods interacting with the chain are coroutines and take the same
+    arguments as their :class:`Account` counterparts.
+
+       >>> account = conn.account("0xpr1vateK3y")
+       >>> await account.send_transaction(to, value=1)
+    """
+
+    w3: AsyncWeb3Helper = None
+
+    async def _sign_and_send(self, build: Callable[[int], Awaitable[dict]], nonce: int = None) -> HexStr:
+        """Builds the transaction with the given or the next nonce, signs and
+        broadcasts it. Concurrent calls are serialized so that nonces are
+        handed out in order.
+        """
+        manager = self.w3._get_nonce_manager(self.address)
+        async with manager.async_lock:
+            for resynced in (False, True):
+                with self.w3.stats.phase("build"):
+                    if nonce is None and manager.nonce is None:
+                        manager.nonce = await self.w3.eth.get_transaction_count(self.address, "pending")
+                    tx = await build(manager.nonce if nonce is None else nonce)
+                with self.w3.stats.phase("sign"):
+                    raw_tx = self.eth_acct.sign_transaction(tx).raw_transaction
+                try:
+                    with self.w3.stats.phase("broadcast"):
+                        tx_hash = (await self.w3.eth.send_raw_transaction(raw_tx)).hex()
+                except Exception as e:
+                    if nonce is not None or resynced or not is_nonce_error(e):
+                        raise
+                    logger.debug(f"Nonce {tx['nonce']} of {self.address} has been used, resyncing ...")
+                    manager.reset()
+                    continue
+                manager.use(tx["nonce"])
+                if self.w3.gas_estimate_cache.enabled:
+                    self.w3.gas_estimate_cache.track(tx_hash, tx)
+                return tx_hash
+
+    async def sign_authorization(self, target: HexStr, is_sender: bool = True, **kwargs) -> SignedSetCodeAuthorization:
+        """Signs an authorization to be included in a EIP-7702 transaction.
+        Check :meth:`Account.sign_authorization` for more details.
+        """
+        if "nonce" in kwargs:
+            nonce = kwargs["nonce"]
+        else:
+            manager = self.w3._get_nonce_manager(self.address)
+            async with manager.async_lock:
+                if manager.nonce is None:
+                    manager.nonce = await self.w3.eth.get_transaction_count(self.address, "pending")
+                nonce = manager.nonce + is_sender
+        auth = {
+            "chainId": kwargs["chain_id"] if "chain_id" in kwargs else await self.w3._get_chain_id(),
+            "nonce": nonce,
+            "address": target,
+        }
+        return self.eth_acct.sign_authorization(auth)
+
+    async def get_balance(self) -> int:
+        """Returns the balance of the account instance."""
+        return await self.w3.eth.get_balance(self.eth_acct.address)
+
+    @instrument("Account.create_access_list")
+    async def create_access_list(
+        self, to: Union[HexStr, None], value: int = 0, data: HexStr = "0x", **kwargs
+    ) -> AccessList:
+        """Creates an EIP-2930 type access list based on the given transaction data.
+        Check :meth:`Account.create_access_list` for more details.
+        """
+
+        if to:
+            to = Web3.to_checksum_address(to)
+
+        tx = await self.w3._build_transaction(self.address, kwargs)
         tx.update(
             {
                 "to": to,
@@ -236,17 +571,86 @@ class Account:
                 "data": data,
             }
         )
-        try:
-            estimate_gas = self.w3.eth.estimate_gas(tx) + GAS_BUFFER
-        except Exception:
-            estimate_gas = 3000000
-        tx["gas"] = kwargs.get("gas_limit", estimate_gas)
-        tx = self.eth_acct.sign_transaction(tx).raw_transaction
-        tx_hash = self.w3.eth.send_raw_transaction(tx).hex()
+        tx["gas"] = await self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+        return (await self.w3.eth.create_access_list(tx, kwargs.get("block_identifier", "latest")))["accessList"]
+
+    async def call(self, to: HexStr, data: HexStr = "0x", **kwargs) -> HexBytes:
+        """Interacts with a smart contract without creating a new transaction.
+        Check :meth:`Account.call` for more details.
+        """
+
+        to = Web3.to_checksum_address(to)
+
+        return await self.w3.eth.call(
+            {
+                "to": to,
+                "from": self.address,
+                "data": data,
+            },
+            state_override=kwargs.get("state_override", None),
+        )
+
+    @instrument("Account.send_transaction")
+    async def send_transaction(
+        self, to: Union[HexStr, None], value: int = 0, data: HexStr = "0x", **kwargs
+    ) -> Union[TxReceipt, HexStr]:
+        """Transfers ETH or interacts with a smart contract without a contract instance.
+        Check :meth:`Account.send_transaction` for more details.
+
+        Transactions of the same account can be sent concurrently, e.g. with
+        :meth:`AsyncConnection.gather <cheb3.connection.AsyncConnection.gather>`.
+        Only building and broadcasting are serialized to keep nonces in order;
+        waiting for receipts overlaps.
+        """
+
+        if to:
+            to = Web3.to_checksum_address(to)
+
+        async def build(nonce: int) -> dict:
+            tx = await self.w3._build_transaction(self.address, {**kwargs, "nonce": nonce})
+            tx.update(
+                {
+                    "to": to,
+                    "value": value,
+                    "data": data,
+                }
+            )
+            tx["gas"] = await self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+            return tx
+
+        tx_hash = await self._sign_and_send(build, kwargs.get("nonce"))
         logger.info(f"Transaction to {to}: {tx_hash}")
         if not kwargs.get("wait_for_receipt", True):
             return tx_hash
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        with self.w3.stats.phase("mined"):
+            receipt = await self.w3.receipt_tracker.wait(tx_hash)
         if not receipt.status:
             raise Exception(f"Transact to {to} failed.")
         return receipt
+
+    async def send_transactions(self, txs: Sequence[Any], timeout: float = 120) -> SendTransactionsReport:
+        """Signs and broadcasts the transactions back-to-back with consecutive
+        nonces, then waits for all receipts together.
+        Check :meth:`Account.send_transactions` for more details.
+        """
+
+        start = time.monotonic()
+        results = []
+        for item in txs:
+            try:
+                to, value, data, kwargs = _parse_transaction_item(item)
+                kwargs["wait_for_receipt"] = False
+                tx_hash = await self.send_transaction(to, value, data, **kwargs)
+                results.append(TransactionResult(tx_hash, sender=self.address))
+            except Exception as e:
+                results.append(TransactionResult(error=e, sender=self.address))
+
+        pending = [r for r in results if r.tx_hash is not None]
+        _set_receipts(pending, await self.w3.receipt_tracker.wait_many([r.tx_hash for r in pending], timeout), timeout)
+
+        report = SendTransactionsReport(results, time.monotonic() - start)
+        logger.info(
+            f"{report.succeeded}/{len(results)} transactions succeeded in {report.elapsed:.2f}s, "
+            f"transactions per block: {report.txs_per_block}"
+        )
+        return report
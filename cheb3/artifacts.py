@@ -0,0 +1,194 @@
+import copy
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+_decoder = json.JSONDecoder()
+_whitespace = " \t\n\r"
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    while index < len(text) and text[index] in _whitespace:
+        index += 1
+    return index
+
+
+def read_artifact(path: str, keys: Sequence[str], chunk_size: int = 2**20) -> Dict[str, Any]:
+    """Reads the top-level fields of a JSON artifact. The members are
+    decoded in order until all the fields are found, and the file is read
+    in chunks as far as needed, so the large fields after them, e.g. the
+    AST in Foundry artifacts, are neither read nor decoded.
+
+    :return: The found fields.
+    :rtype: Dict[str, Any]
+    """
+    keys = set(keys)
+    fields: Dict[str, Any] = dict()
+    with open(path, "r", encoding="utf-8") as f:
+        text, index, started = "", 0, False
+        while keys - fields.keys():
+            try:
+                if not started:
+                    index = _skip_whitespace(text, 0)
+                    if index >= len(text):
+                        raise json.JSONDecodeError("Expecting value", text, index)
+                    if text[index] != "{":
+                        raise ValueError(f"{path} is not a JSON object.")
+                    index, started = index + 1, True
+                index = _skip_whitespace(text, index)
+                if index >= len(text):
+                    raise json.JSONDecodeError("Expecting property name", text, index)
+                if text[index] == "}":
+                    break
+                key, end = _decoder.raw_decode(text, index)
+                end = _skip_whitespace(text, end)
+                if text[end: end + 1] != ":":
+                    raise json.JSONDecodeError("Expecting ':' delimiter", text, end)
+                value, end = _decoder.raw_decode(text, _skip_whitespace(text, end + 1))
+                # the member may be cut off by the end of the text read
+                end = _skip_whitespace(text, end)
+                if end >= len(text):
+                    raise json.JSONDecodeError("Expecting ',' delimiter", text, end)
+            except json.JSONDecodeError:
+                # the text read doubles, so a large member is decoded a few times at most
+                chunk = f.read(max(chunk_size, len(text)))
+                if not chunk:
+                    raise
+                text = (text[index:] if started else text) + chunk
+                index = 0
+                continue
+            if key in keys:
+                fields[key] = value
+            index = end + (text[end] == ",")
+    return fields
+
+
+class ArtifactStore:
+    """An index of the artifacts in the output directory of a Foundry
+    project. The directory is scanned once for the artifact files, and only
+    the ABI and bytecode of an artifact are decoded, on first use. They are
+    cached until the artifact file is modified.
+
+    Contracts are looked up by name, or by the contract file and name if
+    more than one file defines the name, e.g. :code:`"Token.sol:Token"`.
+
+    :param base_path: The output directory, defaults to "out/".
+    :type base_path: str
+    """
+
+    # the directory of the build info, which is not an artifact
+    EXCLUDED_DIRS = ("build-info",)
+
+    def __init__(self, base_path: str = "out/") -> None:
+        self.base_path = base_path
+        # contract name -> the paths of its artifacts
+        self._index: Dict[str, List[str]] = dict()
+        # path -> (mtime, size, fields)
+        self._cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = dict()
+        self._scanned = False
+
+    def scan(self) -> None:
+        """Scans the output directory for the artifacts, e.g. after
+        rebuilding the project. The artifacts are looked up again if a
+        contract is not found, so this is only needed to find out the
+        removed artifacts."""
+        index: Dict[str, List[str]] = dict()
+        for file_entry in os.scandir(self.base_path):
+            if not file_entry.is_dir() or file_entry.name in self.EXCLUDED_DIRS:
+                continue
+            for entry in os.scandir(file_entry.path):
+                if entry.is_file() and entry.name.endswith(".json"):
+                    # artifacts compiled by more than one solc version are named `Name.0.8.20.json`
+                    index.setdefault(entry.name.split(".")[0], []).append(entry.path)
+        for paths in index.values():
+            paths.sort()
+        self._index = index
+        self._scanned = True
+        logger.debug(f"Found {sum(len(paths) for paths in index.values())} artifacts in {self.base_path}")
+
+    def names(self) -> List[str]:
+        """Returns the names of all contracts."""
+        if not self._scanned:
+            self.scan()
+        return sorted(self._index.keys())
+
+    def find(self, contract_name: str, contract_file: Optional[str] = None) -> str:
+        """Returns the path of the artifact of the contract.
+
+        :param contract_name: The contract name, optionally prefixed with
+            the contract file, e.g. :code:`"Token.sol:Token"`.
+        :type contract_name: str
+        :param contract_file: The name of the contract file, which is
+            required if more than one file defines the contract.
+        :type contract_file: str
+
+        :rtype: str
+        """
+        if ":" in contract_name:
+            contract_file, contract_name = contract_name.rsplit(":", 1)
+        if not self._scanned or contract_name not in self._index:
+            self.scan()
+        paths = self._index.get(contract_name, [])
+        if contract_file is not None:
+            contract_file = os.path.basename(contract_file)
+            paths = [path for path in paths if os.path.basename(os.path.dirname(path)) == contract_file]
+        if not paths:
+            raise Exception(f"Contract {contract_name} not found in {self.base_path}.")
+        if len(paths) > 1:
+            raise Exception(f"Contract {contract_name} is ambiguous, found in {', '.join(paths)}.")
+        return paths[0]
+
+    def read(self, path: str, keys: Sequence[str]) -> Dict[str, Any]:
+        """Returns the top-level fields of the artifact file, which are
+        :const:`None` if not in the artifact. The fields are decoded once
+        until the file is modified, and are shared by all callers, so they
+        must not be changed."""
+        stat = os.stat(path)
+        mtime, size, fields = self._cache.get(path, (None, None, dict()))
+        if (mtime, size) != (stat.st_mtime_ns, stat.st_size):
+            fields = dict()
+        missing = [key for key in keys if key not in fields]
+        if missing:
+            found = read_artifact(path, missing)
+            fields.update({key: found.get(key) for key in missing})
+            self._cache[path] = (stat.st_mtime_ns, stat.st_size, fields)
+        return fields
+
+    def get(self, contract_name: str, contract_file: Optional[str] = None) -> Tuple[Dict, str]:
+        """Returns the ABI and bytecode of the contract.
+
+        Check :meth:`find` for the parameters.
+
+        :rtype: Tuple[Dict, str]
+        """
+        fields = self.read(self.find(contract_name, contract_file), ("abi", "bytecode"))
+        # copies, so the cached ABI is not changed by the caller
+        return (copy.deepcopy(fields["abi"]), fields["bytecode"]["object"])
+
+    def storage_layout(self, contract_name: str, contract_file: Optional[str] = None) -> Dict:
+        """Returns the storage layout of the contract, which is only in the
+        output if ``storageLayout`` is set in the ``extra_output`` of the
+        Foundry config.
+
+        Check :meth:`find` for the parameters.
+
+        :rtype: Dict
+        """
+        fields = self.read(self.find(contract_name, contract_file), ("storageLayout",))
+        if fields["storageLayout"] is None:
+            raise Exception(f"The storage layout of {contract_name} is not in the compiled output.")
+        return copy.deepcopy(fields["storageLayout"])
+
+    def load(self, contract_file: str, contract_name: Optional[str] = None) -> Tuple[Dict, str]:
+        """The same as :func:`~cheb3.utils.load_compiled`, with the decoded
+        artifacts cached."""
+        contract_name = contract_name or os.path.splitext(contract_file)[0]
+        fields = self.read(os.path.join(self.base_path, contract_file, f"{contract_name}.json"), ("abi", "bytecode"))
+        return (copy.deepcopy(fields["abi"]), fields["bytecode"]["object"])
+
+    def __contains__(self, contract_name: str) -> bool:
+        if not self._scanned or contract_name not in self._index:
+            self.scan()
+        return contract_name in self._index
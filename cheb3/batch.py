@@ -0,0 +1,171 @@
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+from web3._utils.batching import BatchRequestInformation
+from web3.module import apply_result_formatters
+from web3.providers import JSONBaseProvider
+
+if TYPE_CHECKING:
+    from cheb3.helper import Web3Helper
+
+
+class BatchResult:
+    """A placeholder for the result of a request collected by a :class:`Batch`.
+    It is resolved when the batch is executed.
+    """
+
+    def __init__(self) -> None:
+        self._done = False
+        self._result = None
+        self._exception = None
+
+    def __repr__(self) -> str:
+        if not self._done:
+            return "<BatchResult pending>"
+        if self._exception is not None:
+            return f"<BatchResult error={self._exception!r}>"
+        return f"<BatchResult result={self._result!r}>"
+
+    def done(self) -> bool:
+        """Returns :const:`True` if the batch containing the request has been executed."""
+        return self._done
+
+    def result(self) -> Any:
+        """Returns the result of the request.
+
+        :raises Exception: If the batch has not been executed yet, or the
+            error of the request if it failed.
+        """
+        if not self._done:
+            raise Exception("The batch has not been executed yet.")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self) -> Optional[Exception]:
+        """Returns the error of the request, or :const:`None` if it succeeded."""
+        if not self._done:
+            raise Exception("The batch has not been executed yet.")
+        return self._exception
+
+    def _resolve(self, result: Any = None, exception: Exception = None) -> None:
+        self._result = result
+        self._exception = exception
+        self._done = True
+
+
+class Batch:
+    """Collects read requests and sends them as JSON-RPC batch requests.
+    Please use :func:`cheb3.Connection.batch` interface to create a batch
+    associated with the connection.
+
+    Inside the ``with`` block, :func:`Connection.get_balance <cheb3.connection.Connection.get_balance>`,
+    :func:`Connection.get_storage_at <cheb3.connection.Connection.get_storage_at>`,
+    :func:`Connection.get_code <cheb3.connection.Connection.get_code>`,
+    :func:`Account.call <cheb3.account.Account.call>`, the ``get_balance`` and
+    ``get_storage_at`` methods of accounts and contracts, and contract reads via
+    ``contract.caller`` or ``contract.functions.fn().call()`` return a
+    :class:`BatchResult` instead of the value. The requests are sent when
+    the block exits.
+
+    Examples:
+
+        >>> with conn.batch():
+        ...     balance = conn.get_balance(account.address)
+        ...     supply = token.caller.totalSupply()
+        >>> balance.result(), supply.result()
+        (1000000000000000000, 0)
+
+    Other web3.py read methods can be collected with :meth:`add`:
+
+        >>> with conn.batch() as batch:
+        ...     block = batch.add(conn.w3.eth.get_block, "latest")
+
+    If the provider or the node does not support batch requests, the
+    collected requests are sent one by one.
+
+    :param max_size: The maximum number of requests in a single JSON-RPC
+        batch request, defaults to 100. Larger batches are split.
+    :type max_size: int
+    """
+
+    def __init__(self, w3: "Web3Helper", max_size: int = 100) -> None:
+        self.w3 = w3
+        self.max_size = max_size
+        self._requests: List[Tuple[BatchRequestInformation, BatchResult]] = []
+        self._token = None
+
+    def __enter__(self) -> "Batch":
+        if self.w3._batch.get() is not None:
+            raise Exception("Nested batches are not supported.")
+        self._token = self.w3._batch.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.w3._batch.reset(self._token)
+        self._token = None
+        if exc_type is None:
+            self.execute()
+        else:
+            self._requests = []
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def add(self, request: Callable[..., Any], *args, **kwargs) -> BatchResult:
+        """Collects a read request made by a web3.py method.
+
+        :param request: A web3.py method, e.g. ``conn.w3.eth.get_block``,
+            or the ``call`` method of a contract function.
+        :param `*args`: Arguments passed to the method.
+
+        :rtype: :class:`BatchResult`
+        """
+        token = self.w3.provider._batching_context.set(self)
+        try:
+            request_info = request(*args, **kwargs)
+        finally:
+            self.w3.provider._batching_context.reset(token)
+        return self._add_request_information(tuple(request_info))
+
+    def execute(self) -> List[BatchResult]:
+        """Sends the collected requests and resolves their results. It is
+        called automatically when the ``with`` block exits.
+
+        :returns: The results in the order the requests were collected.
+        :rtype: List[BatchResult]
+        """
+        requests, self._requests = self._requests, []
+        for i in range(0, len(requests), self.max_size):
+            self._execute(requests[i: i + self.max_size])
+        return [result for _, result in requests]
+
+    def _add_request_information(self, request_info: BatchRequestInformation) -> BatchResult:
+        result = BatchResult()
+        self._requests.append((request_info, result))
+        return result
+
+    def _execute(self, requests: List[Tuple[BatchRequestInformation, BatchResult]]) -> None:
+        responses = None
+        if isinstance(self.w3.provider, JSONBaseProvider):
+            request_func = self.w3.provider.batch_request_func(self.w3, self.w3.middleware_onion)
+            responses = request_func([request_info[0] for request_info, _ in requests])
+
+        if not isinstance(responses, list) or len(responses) != len(requests):
+            # the provider or the node does not support batch requests
+            for request_info, result in requests:
+                try:
+                    result._resolve(self._request_blocking(request_info))
+                except Exception as e:
+                    result._resolve(exception=e)
+            return
+
+        for (request_info, result), response in zip(requests, responses):
+            try:
+                result._resolve(self.w3.manager._format_batched_response(request_info, response))
+            except Exception as e:
+                result._resolve(exception=e)
+
+    def _request_blocking(self, request_info: BatchRequestInformation) -> Any:
+        (method, params), (result_formatters, error_formatters, null_result_formatters) = request_info
+        response = self.w3.manager.request_blocking(method, params, error_formatters, null_result_formatters)
+        return apply_result_formatters(result_formatters, response)
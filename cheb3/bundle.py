@@ -0,0 +1,218 @@
+import json
+import time
+from typing import Any, Dict, List, Union
+
+from eth_typing import HexStr
+from hexbytes import HexBytes
+from web3 import Web3
+
+from cheb3.account import Account, SendTransactionsReport, TransactionResult, _set_receipts
+from cheb3.batch import Batch
+from cheb3.helper import Web3Helper
+
+from loguru import logger
+
+
+class Bundle:
+    """A list of transactions built and signed ahead of time, which are
+    broadcast together in one JSON-RPC batch request. Please use
+    :func:`cheb3.Connection.bundle` interface to create a bundle associated
+    with the connection.
+
+    Lookups needed to build the transactions (nonces, fees, gas estimates)
+    only happen in :meth:`add` and only for the fields not given, so nothing
+    but ``eth_sendRawTransaction`` is sent by :meth:`broadcast`.
+
+    The nonces of the transactions are reserved when they are added, so the
+    other transactions of the accounts sent meanwhile use the following
+    nonces. Call :meth:`discard` to give them back if the bundle is dropped.
+
+    Examples:
+
+        >>> bundle = conn.bundle()
+        >>> bundle.add(account, token_addr, data=approve_data, nonce=7, gas_limit=60000, gas_price=10**9)
+        >>> bundle.add_function(contract.functions.swap(10**18), nonce=8, gas_limit=200000, gas_price=10**9)
+        >>> bundle.save("bundle.json")
+        >>> # later, e.g. in another process
+        >>> bundle = conn.load_bundle("bundle.json")
+        >>> report = bundle.broadcast()
+
+    :ivar transactions: The signed transactions, each of them is a dict of
+        `raw_transaction`, `hash`, `sender` and `nonce`.
+    """
+
+    def __init__(self, w3: Web3Helper) -> None:
+        self.w3 = w3
+        self.transactions: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.transactions)
+
+    def add(
+        self, account: Account, to: Union[HexStr, None], value: int = 0, data: HexStr = "0x", **kwargs
+    ) -> HexStr:
+        """Builds and signs a transaction and appends it to the bundle.
+
+        :param account: The account signing the transaction.
+        :type account: :class:`Account <cheb3.account.Account>`
+        :param to: The address of the receiver.
+        :type to: Union[HexStr, None]
+        :param value: The amount to transfer, defaults to 0 (wei).
+        :type value: int
+        :param data: The transaction data, defaults to `0x`.
+        :type data: HexStr
+
+        Keyword Args:
+            nonce (int): The nonce of the transaction. Defaults to the next
+                nonce after the previous transaction of the account in the bundle,
+                or the next nonce tracked locally by the account.
+            gas_limit (int): Specifies the maximum gas the transaction can use,
+                estimated if not given.
+            gas_price, max_priority_fee_per_gas, max_fee_per_gas, access_list, authorization_list:
+                Check :meth:`Account.send_transaction <cheb3.account.Account.send_transaction>` for more details.
+
+        :returns: The transaction hash.
+        :rtype: HexStr
+        """
+        if to:
+            to = Web3.to_checksum_address(to)
+        nonce = kwargs.get("nonce")
+        reserved = nonce is None
+        if reserved:
+            nonce = self._reserve_nonce(account)
+        try:
+            tx = self.w3._build_transaction(account.address, {**kwargs, "nonce": nonce})
+            tx.update(
+                {
+                    "to": to,
+                    "value": value,
+                    "data": data,
+                }
+            )
+            tx["gas"] = self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+            signed_tx = account.eth_acct.sign_transaction(tx)
+        except Exception:
+            if reserved:
+                self._release_nonce(account.address, nonce)
+            raise
+        if not reserved:
+            manager = self.w3._get_nonce_manager(account.address)
+            with manager.lock:
+                manager.use(nonce)
+        self.transactions.append(
+            {
+                "raw_transaction": "0x" + signed_tx.raw_transaction.hex(),
+                "hash": signed_tx.hash.hex(),
+                "sender": account.address,
+                "nonce": tx["nonce"],
+            }
+        )
+        return signed_tx.hash.hex()
+
+    def add_function(self, function: Any, **kwargs) -> HexStr:
+        """Builds and signs a contract function call and appends it to the bundle.
+        It is signed by the signer of the contract.
+
+        Examples:
+
+            >>> bundle.add_function(contract.functions.deposit(), value=10**18, nonce=3)
+
+        :param function: The contract function with arguments.
+        :type function: ContractFunctionWrapper
+
+        Keyword Args:
+            value (int): The amount to transfer, defaults to 0 (wei).
+            Others: Check :meth:`add` for more details.
+
+        :returns: The transaction hash.
+        :rtype: HexStr
+        """
+        if not function.account:
+            raise AttributeError("The `signer` is missing.")
+        value = kwargs.pop("value", 0)
+        return self.add(function.account, function.address, value, function._encode_transaction_data(), **kwargs)
+
+    def discard(self) -> None:
+        """Drops the transactions without broadcasting them. The nonces
+        reserved for them are given back, so that they are used by the next
+        transactions of the accounts."""
+        for sender in {tx["sender"] for tx in self.transactions}:
+            manager = self.w3._get_nonce_manager(sender)
+            with manager.lock:
+                manager.reset()
+        self.transactions = []
+
+    def save(self, path: str) -> None:
+        """Saves the signed transactions to a JSON file."""
+        with open(path, "w") as f:
+            json.dump({"transactions": self.transactions}, f, indent=2)
+
+    @classmethod
+    def load(cls, w3: Web3Helper, path: str) -> "Bundle":
+        """Loads the signed transactions saved by :meth:`save`."""
+        bundle = cls(w3)
+        with open(path) as f:
+            bundle.transactions = json.load(f)["transactions"]
+        return bundle
+
+    def broadcast(self, wait_for_receipts: bool = True, timeout: float = 120) -> SendTransactionsReport:
+        """Broadcasts all transactions in one JSON-RPC batch request. If the
+        provider or the node does not support batch requests, they are sent
+        one by one.
+
+        :param wait_for_receipts: Waits for the receipts, defaults to :const:`True`.
+        :type wait_for_receipts: bool
+        :param timeout: Seconds to wait for the receipts, defaults to 120.
+        :type timeout: float
+
+        :returns: The results in the order of the transactions, whose failures
+            do not stop the others.
+        :rtype: :class:`SendTransactionsReport <cheb3.account.SendTransactionsReport>`
+        """
+        start = time.monotonic()
+        batch = Batch(self.w3, max_size=max(len(self.transactions), 1))
+        for tx in self.transactions:
+            # `eth_sendRawTransaction` cannot be collected by web3.py batching
+            batch._add_request_information((("eth_sendRawTransaction", [tx["raw_transaction"]]), (HexBytes, None, None)))
+        batch_results = batch.execute()
+
+        results = []
+        for tx, batch_result in zip(self.transactions, batch_results):
+            if batch_result.exception() is not None:
+                results.append(TransactionResult(error=batch_result.exception(), sender=tx["sender"]))
+                # the reserved nonce may be unused, so it is fetched again
+                manager = self.w3._get_nonce_manager(tx["sender"])
+                with manager.lock:
+                    manager.reset()
+                continue
+            results.append(TransactionResult(batch_result.result().hex(), sender=tx["sender"]))
+            manager = self.w3._get_nonce_manager(tx["sender"])
+            with manager.lock:
+                manager.use(tx["nonce"])
+        logger.info(f"Broadcast {sum(r.tx_hash is not None for r in results)}/{len(results)} transactions of the bundle")
+
+        if wait_for_receipts:
+            pending = [r for r in results if r.tx_hash is not None]
+            _set_receipts(pending, self.w3.receipt_tracker.wait_many([r.tx_hash for r in pending], timeout), timeout)
+        return SendTransactionsReport(results, time.monotonic() - start)
+
+    def _reserve_nonce(self, account: Account) -> int:
+        """Takes the next nonce of the account, so that it is not used by
+        other transactions sent before the bundle is broadcast."""
+        # the nonce fetched from the node does not count the transactions of the bundle
+        nonce = max((tx["nonce"] + 1 for tx in self.transactions if tx["sender"] == account.address), default=0)
+        manager = self.w3._get_nonce_manager(account.address)
+        with manager.lock:
+            if manager.nonce is None:
+                manager.nonce = self.w3.eth.get_transaction_count(account.address, "pending")
+            nonce = max(nonce, manager.nonce)
+            manager.nonce = nonce + 1
+        return nonce
+
+    def _release_nonce(self, address: str, nonce: int) -> None:
+        manager = self.w3._get_nonce_manager(address)
+        with manager.lock:
+            if manager.nonce == nonce + 1:
+                manager.nonce = nonce
+            else:
+                manager.reset()
@@ -0,0 +1,400 @@
+import hashlib
+import json
+import os
+import posixpath
+import re
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from packaging.version import Version
+from solcx import compile_standard
+from solcx.exceptions import SolcNotInstalled
+from solcx.install import (
+    get_installable_solc_versions,
+    get_installed_solc_versions,
+    install_solc,
+    select_pragma_version,
+)
+
+from loguru import logger
+
+# import "a.sol"; import "a.sol" as A; import {B} from "a.sol"; import * as A from "a.sol";
+IMPORT_PATTERN = re.compile(r"""^\s*import\s+(?:[^"';]*?\s+from\s+)?["']([^"']+)["']""", re.MULTILINE)
+PRAGMA_PATTERN = re.compile(r"^\s*pragma\s+solidity\s+([^;]+);", re.MULTILINE)
+
+# the names of the outputs of `solc --combined-json` in the standard JSON output selection
+STANDARD_JSON_OUTPUTS = {"abi": "abi", "bin": "evm.bytecode.object", "storage-layout": "storageLayout"}
+
+# remappings = ["a/=lib/a/src/", ...] in foundry.toml
+FOUNDRY_REMAPPINGS_PATTERN = re.compile(r"^\s*remappings\s*=\s*\[(.*?)\]", re.MULTILINE | re.DOTALL)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cheb3", "compile")
+
+
+def collect_imports(source: str, base_path: Optional[str] = None, source_dir: Optional[str] = None) -> Dict[str, str]:
+    """Returns the contents of the files imported by the source, directly or
+    not, keyed by their resolved paths. Imports which cannot be found, e.g.
+    with remappings, are keyed by their import paths with empty contents."""
+    imports: Dict[str, str] = dict()
+    pending = [(source, source_dir)]
+    while pending:
+        source, source_dir = pending.pop()
+        for path in IMPORT_PATTERN.findall(source):
+            if path.startswith("."):
+                resolved = os.path.normpath(os.path.join(source_dir or base_path or ".", path))
+            else:
+                resolved = os.path.normpath(os.path.join(base_path or ".", path))
+            if resolved in imports:
+                continue
+            try:
+                with open(resolved, "r", encoding="utf-8") as f:
+                    imports[resolved] = f.read()
+            except OSError:
+                imports[resolved] = ""
+                continue
+            pending.append((imports[resolved], os.path.dirname(resolved)))
+    return imports
+
+
+# (pragmas, installed versions) -> the resolved version
+_resolved_versions: Dict[Tuple[Tuple[str, ...], Tuple[Version, ...]], Version] = dict()
+
+
+def _select_version(pragmas: Tuple[str, ...], versions: List[Version]) -> Optional[Version]:
+    for pragma in pragmas:
+        versions = [v for v in versions if select_pragma_version(pragma, [v])]
+    return max(versions, default=None)
+
+
+def _pragmas(sources: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sorted({p.strip() for s in sources for p in PRAGMA_PATTERN.findall(s)}))
+
+
+def _resolve_pragmas(pragmas: Tuple[str, ...], allow_install: bool) -> Version:
+    installed = tuple(get_installed_solc_versions())
+    key = (pragmas, installed)
+    if key not in _resolved_versions:
+        version = _select_version(pragmas, list(installed))
+        if version is None:
+            if not allow_install:
+                raise SolcNotInstalled(
+                    f"No installed solc version satisfies {' and '.join(pragmas) or 'the source'}."
+                    " Pass `allow_install=True` to download the newest satisfying version,"
+                    " or install one with `solcx.install_solc(version)`."
+                )
+            version = _select_version(pragmas, get_installable_solc_versions())
+            if version is None:
+                raise Exception(f"No solc version satisfies {' and '.join(pragmas)}.")
+            install_solc(version)
+            key = (pragmas, tuple(get_installed_solc_versions()))
+        logger.debug(f"Resolved solc version {version} for {' and '.join(pragmas) or 'the source'}")
+        _resolved_versions[key] = version
+    return _resolved_versions[key]
+
+
+def resolve_solc_version(source: str, base_path: Optional[str] = None, allow_install: bool = False) -> Version:
+    """Returns the newest installed `solc` version satisfying the
+    `pragma solidity` of the source and the files it imports, without
+    network access. The resolution is cached until the installed versions
+    change.
+
+    :param source: The Solidity source code.
+    :type source: str
+    :param base_path: The root of the source tree to find the imported
+        files, defaults to :const:`None`.
+    :type base_path: str
+    :param allow_install: Whether to download and install the newest
+        satisfying version if none is installed, defaults to :const:`False`.
+    :type allow_install: bool
+
+    :return: The `solc` version.
+    :rtype: ~packaging.version.Version
+    """
+    return _resolve_pragmas(_pragmas([source] + list(collect_imports(source, base_path).values())), allow_install)
+
+
+def source_unit_name(path: str, root: str = ".") -> str:
+    """Returns the source unit name of the file, i.e. its path relative to
+    `root`, or its absolute path if it is outside `root`."""
+    name = os.path.relpath(os.path.abspath(path), os.path.abspath(root))
+    if name.startswith(".."):
+        name = os.path.abspath(path)
+    return name.replace(os.sep, "/")
+
+
+def load_remappings(project_dir: str = ".") -> List[str]:
+    """Returns the import remappings of a Foundry project, in the order of
+    precedence: the ones in `remappings.txt`, the ones in `foundry.toml`, and
+    the ones inferred from the libraries in `lib/`, e.g.
+    `forge-std/=lib/forge-std/src/`.
+
+    :rtype: List[str]
+    """
+    remappings = []
+    try:
+        with open(os.path.join(project_dir, "remappings.txt"), "r", encoding="utf-8") as f:
+            remappings.extend(line.strip() for line in f if line.strip() and not line.lstrip().startswith("#"))
+    except OSError:
+        pass
+    try:
+        with open(os.path.join(project_dir, "foundry.toml"), "r", encoding="utf-8") as f:
+            config = f.read()
+        for remapping_list in FOUNDRY_REMAPPINGS_PATTERN.findall(config):
+            remappings.extend(re.findall(r"""["']([^"']+)["']""", remapping_list))
+    except OSError:
+        pass
+    lib_dir = os.path.join(project_dir, "lib")
+    if os.path.isdir(lib_dir):
+        for name in sorted(os.listdir(lib_dir)):
+            if os.path.isdir(os.path.join(lib_dir, name, "src")):
+                remappings.append(f"{name}/=lib/{name}/src/")
+            elif os.path.isdir(os.path.join(lib_dir, name)):
+                remappings.append(f"{name}/=lib/{name}/")
+    # the first remapping of a prefix wins
+    prefixes = set()
+    unique = []
+    for remapping in remappings:
+        prefix = remapping.split("=", 1)[0]
+        if prefix not in prefixes:
+            prefixes.add(prefix)
+            unique.append(remapping)
+    return unique
+
+
+def _remap(unit: str, path: str, remappings: List[Tuple[str, str, str]]) -> str:
+    """Applies the remapping with the longest context, then the longest
+    prefix, and the last one of those, as `solc` does."""
+    best = None
+    for context, prefix, target in remappings:
+        if unit.startswith(context) and path.startswith(prefix):
+            if best is None or (len(context), len(prefix)) >= (len(best[0]), len(best[1])):
+                best = (context, prefix, target)
+    if best is None:
+        return path
+    return best[2] + path[len(best[1]):]
+
+
+def _parse_remappings(remappings: Optional[List[str]]) -> List[Tuple[str, str, str]]:
+    parsed = []
+    for remapping in remappings or []:
+        if "=" not in remapping:
+            raise Exception(f"Invalid remapping {remapping}, expecting `[context:]prefix=target`.")
+        prefix, target = remapping.split("=", 1)
+        context, prefix = prefix.split(":", 1) if ":" in prefix else ("", prefix)
+        parsed.append((context, prefix, target))
+    return parsed
+
+
+def collect_sources(
+    paths: List[str], base_path: Optional[str] = None, root: str = ".", remappings: Optional[List[str]] = None
+) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """Reads the files and the files they import, directly or not, as
+    source units named the way `solc` names them, i.e. relative imports are
+    resolved against the importing unit, and the others are remapped by
+    `remappings`, e.g. `forge-std/=lib/forge-std/src/`. The files are named
+    by their paths relative to `root`, and the other imports are searched in
+    `root` and `base_path`. Imports which cannot be found are left to `solc`
+    to report.
+
+    :return: The contents and the direct imports of the source units.
+    :rtype: Tuple[Dict[str, str], Dict[str, List[str]]]
+    """
+    parsed_remappings = _parse_remappings(remappings)
+    roots = [root] + ([base_path] if base_path else [])
+    sources: Dict[str, str] = dict()
+    imports: Dict[str, List[str]] = dict()
+    pending = []
+    for path in paths:
+        unit = source_unit_name(path, root)
+        with open(path, "r", encoding="utf-8") as f:
+            sources[unit] = f.read()
+        pending.append(unit)
+    while pending:
+        unit = pending.pop()
+        imports[unit] = []
+        for path in IMPORT_PATTERN.findall(sources[unit]):
+            if path.startswith("."):
+                path = posixpath.normpath(posixpath.join(posixpath.dirname(unit), path))
+            else:
+                path = _remap(unit, path, parsed_remappings)
+            imports[unit].append(path)
+            if path in sources:
+                continue
+            for root in roots:
+                try:
+                    with open(os.path.join(root, path), "r", encoding="utf-8") as f:
+                        sources[path] = f.read()
+                except OSError:
+                    continue
+                pending.append(path)
+                break
+    return sources, imports
+
+
+def source_closure(unit: str, imports: Dict[str, List[str]]) -> Set[str]:
+    """Returns the source unit and the units it imports, directly or not."""
+    closure = {unit}
+    pending = [unit]
+    while pending:
+        for path in imports.get(pending.pop(), []):
+            if path not in closure:
+                closure.add(path)
+                pending.append(path)
+    return closure
+
+
+def group_sources(
+    units: List[str],
+    sources: Dict[str, str],
+    imports: Dict[str, List[str]],
+    solc_version: Union[str, Version] = "latest",
+    allow_install: bool = False,
+) -> Dict[Version, List[str]]:
+    """Groups the source units by the `solc` version to compile them with,
+    i.e. the pinned version, or the newest installed version satisfying the
+    pragmas of each unit and its imports."""
+    groups: Dict[Version, List[str]] = dict()
+    for unit in units:
+        if solc_version in ("latest", None):
+            closure = source_closure(unit, imports)
+            version = _resolve_pragmas(_pragmas(sources[u] for u in closure if u in sources), allow_install)
+        else:
+            version = Version(str(solc_version).lstrip("v"))
+        groups.setdefault(version, []).append(unit)
+    return groups
+
+
+def compile_standard_json(
+    sources: Dict[str, str],
+    units: List[str],
+    solc_version: Version,
+    output_values: List[str],
+    remappings: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Compiles the source units with one standard JSON invocation of
+    `solc`. All sources are passed in the input, so `solc` does not read any
+    file. The remappings must be the ones the sources are collected with.
+
+    :return: A dict, mapping each unit in `units` to its contracts and
+        their outputs, named as in :func:`~solcx.compile_source`.
+    :rtype: Dict[str, Dict[str, Dict[str, Any]]]
+    """
+    selection = [STANDARD_JSON_OUTPUTS[output] for output in output_values]
+    input_data = {
+        "language": "Solidity",
+        "sources": {unit: {"content": content} for unit, content in sources.items()},
+        "settings": {"outputSelection": {unit: {"*": selection} for unit in units}},
+    }
+    if remappings:
+        input_data["settings"]["remappings"] = list(remappings)
+    output = compile_standard(input_data, solc_version=solc_version)
+    compiled: Dict[str, Dict[str, Dict[str, Any]]] = dict()
+    for unit in units:
+        compiled[unit] = dict()
+        for name, contract in output.get("contracts", dict()).get(unit, dict()).items():
+            compiled[unit][name] = {
+                "abi": contract.get("abi"),
+                "bin": contract.get("evm", dict()).get("bytecode", dict()).get("object"),
+                "storage-layout": contract.get("storageLayout"),
+            }
+            compiled[unit][name] = {output: compiled[unit][name][output] for output in output_values}
+    return compiled
+
+
+class CompileCache:
+    """A content-addressed cache of compiled contracts on disk. The compiled
+    output is keyed by the hash of the source, the contents of the imported
+    files, the solc version and the output selection, so a cached output is
+    reused only if nothing affecting it has changed.
+
+    The least recently used entries are evicted when the total size of the
+    cache exceeds `max_size`.
+
+    :param path: The cache directory, defaults to `~/.cache/cheb3/compile`.
+    :type path: str
+    :param max_size: The maximum size of the cache in bytes, defaults to 100 MiB.
+    :type max_size: int
+    """
+
+    def __init__(self, path: str = None, max_size: int = 100 * 2**20) -> None:
+        self.path = path or DEFAULT_CACHE_DIR
+        self.max_size = max_size
+
+    def key(
+        self,
+        source: Union[str, Dict[str, Any]],
+        solc_version: str,
+        output_values: List[str],
+        base_path: Optional[str] = None,
+    ) -> str:
+        """Returns the cache key of compiling the source. The source is
+        either a source code, whose imports are read from `base_path`, or a
+        dict of all source units and whatever else selects the output."""
+        data = {
+            "source": source,
+            "imports": sorted(collect_imports(source, base_path).items()) if isinstance(source, str) else [],
+            "solc_version": str(solc_version).lstrip("v"),
+            "output_values": sorted(output_values),
+            "base_path": base_path and os.path.abspath(base_path),
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached output, or :const:`None` if it is not cached."""
+        path = os.path.join(self.path, f"{key}.json")
+        try:
+            with open(path, "r") as f:
+                compiled = json.load(f)
+            # the modification time orders the entries for eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            # possibly evicted by another process meanwhile
+            return None
+        return compiled
+
+    def put(self, key: str, compiled: Dict[str, Any]) -> None:
+        """Caches the output and evicts the least recently used entries if
+        the cache is too large."""
+        os.makedirs(self.path, exist_ok=True)
+        path = os.path.join(self.path, f"{key}.json")
+        # written to a temporary file first, so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", prefix=f"{key}.", dir=self.path)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(compiled, f)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            logger.debug(f"Evicted {path} from the compile cache")
+
+    def clear(self) -> None:
+        """Removes all cached outputs."""
+        if not os.path.isdir(self.path):
+            return
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".json"):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    continue
@@ -1,13 +1,29 @@
+import asyncio
+import secrets
 import subprocess
-from typing import Any
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from eth_account.datastructures import SignedSetCodeAuthorization
+from eth_typing import HexStr
 from hexbytes import HexBytes
 from requests.exceptions import ConnectionError
 
+from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
+from web3.types import TxReceipt
 
-from cheb3.account import Account
-from cheb3.contract import Contract
-from cheb3.helper import Web3Helper
+from cheb3.account import Account, AsyncAccount
+from cheb3.batch import Batch, BatchResult
+from cheb3.bundle import Bundle
+from cheb3.contract import Contract, AsyncContract
+from cheb3.helper import ALWAYS_CACHEABLE_REQUESTS, Web3Helper, AsyncWeb3Helper
+from cheb3.multicall import Multicall
+from cheb3.search import KEY_BATCH_SIZE, SECP256K1_N, AddressPrefix, SearchResult, create_address, run_search, search_keys
+from cheb3.signing import build_authorizations
+from cheb3.stats import OperationRecord
+from cheb3.storage import StorageLayout
+
+from loguru import logger
 
 
 class Connection:
@@ -15,10 +31,39 @@ class Connection:
 
     :param endpoint_uri: The full URI to the RPC endpoint.
     :type endpoint_uri: str
+    :param fee_cache_ttl: If set, the gas price, base fee and max priority fee
+        are cached per block and reused for at most `fee_cache_ttl` seconds
+        before checking for a new block, defaults to :const:`None` (disabled).
+        The chain ID is always fetched only once.
+    :type fee_cache_ttl: float
+    :param gas_estimate_cache: Caches the gas estimates per function and
+        learns the gas limits from the gas used by mined transactions, so that
+        repeated calls skip ``eth_estimateGas``, defaults to :const:`False`.
+        Check :class:`GasEstimateCache <cheb3.helper.GasEstimateCache>` for more details.
+    :type gas_estimate_cache: bool
+    :param stats_hook: Called with the :class:`OperationRecord <cheb3.stats.OperationRecord>`
+        of each finished operation, e.g. to export to a metrics system,
+        defaults to :const:`None`. Check :meth:`stats` for more details.
+    :type stats_hook: Callable[[OperationRecord], Any]
     """
 
-    def __init__(self, endpoint_uri: str) -> None:
-        self.w3 = Web3Helper(Web3Helper.HTTPProvider(endpoint_uri))
+    def __init__(
+        self,
+        endpoint_uri: str,
+        fee_cache_ttl: float = None,
+        gas_estimate_cache: bool = False,
+        stats_hook: Callable[[OperationRecord], Any] = None,
+    ) -> None:
+        self.w3 = Web3Helper(
+            Web3Helper.HTTPProvider(
+                endpoint_uri,
+                cache_allowed_requests=True,
+                cacheable_requests=ALWAYS_CACHEABLE_REQUESTS,
+            ),
+            fee_cache_ttl=fee_cache_ttl,
+            gas_estimate_cache=gas_estimate_cache,
+            stats_hook=stats_hook,
+        )
         self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
 
         try:
@@ -41,6 +86,148 @@ class Connection:
         account_factory = Account.factory(self.w3)
         return account_factory(private_key)
 
+    def find_account(
+        self,
+        predicate: Callable[[bytes], bool] = None,
+        prefix: str = None,
+        nonce: int = None,
+        workers: int = None,
+        chunk_size: int = 2**16,
+        max_attempts: int = None,
+        timeout: float = None,
+        return_result: bool = False,
+    ) -> Union[Optional[Account], SearchResult]:
+        """Searches for an account whose address, or the address of the contract
+        it creates at `nonce`, matches the predicate or the prefix.
+
+        Each worker process starts from a random private key and tries the
+        following `chunk_size` keys, whose public keys are derived from the
+        previous ones with a point addition, which is much faster than
+        creating the keys one by one.
+
+        Examples:
+
+            >>> account = conn.find_account(prefix="0x0000")
+            >>> # the first contract deployed by the account has an address starting with 0xc0de
+            >>> deployer = conn.find_account(prefix="0xc0de", nonce=0, timeout=600)
+            >>> # with the number of keys tried and the keys per second
+            >>> result = conn.find_account(prefix="0x0000", return_result=True)
+            >>> result.value, result.attempts, result.rate
+            (<cheb3.account.Account object at 0x7f...>, 54720, 95310.2)
+
+        :param predicate: Called with the 20 bytes of each address. It must be
+            picklable, e.g. a module-level function, unless `workers` is 1.
+        :type predicate: Callable[[bytes], bool]
+        :param prefix: The hex prefix of the address, compared in lowercase.
+            Used if `predicate` is not given.
+        :type prefix: str
+        :param nonce: Matches the address of the contract created by the account
+            with the `CREATE` opcode at `nonce`, instead of the account address.
+        :type nonce: int
+        :param workers: The number of worker processes, defaults to the number
+            of CPUs. If 1, the keys are tried in the current process.
+        :type workers: int
+        :param chunk_size: The number of keys tried by a worker at a time,
+            defaults to 2**16.
+        :type chunk_size: int
+        :param max_attempts: Stops the search after about `max_attempts` keys,
+            defaults to :const:`None`.
+        :type max_attempts: int
+        :param timeout: Stops the search after `timeout` seconds, defaults to :const:`None`.
+        :type timeout: float
+        :param return_result: Whether to return the :class:`SearchResult <cheb3.search.SearchResult>`,
+            with the account found as `value`, the address matched, the number
+            of keys tried and the keys per second, defaults to :const:`False`.
+        :type return_result: bool
+
+        :returns: The account found, or :const:`None` if the search is stopped
+            or interrupted before an account is found.
+        :rtype: :class:`Account <cheb3.account.Account>`
+        """
+        if predicate is None:
+            if prefix is None:
+                raise Exception("Either `predicate` or `prefix` is required.")
+            predicate = AddressPrefix(prefix)
+
+        def chunks() -> Iterator[Tuple]:
+            count = 0
+            while max_attempts is None or count < max_attempts:
+                yield secrets.randbelow(SECP256K1_N - chunk_size - KEY_BATCH_SIZE) + 1, chunk_size, predicate, nonce
+                count += chunk_size
+
+        started_at = time.monotonic()
+        found, attempts, _ = run_search(search_keys, chunks(), workers, timeout)
+        result = SearchResult(attempts=attempts, elapsed=time.monotonic() - started_at)
+        if found is not None:
+            result.value = self.account("0x" + found[0].to_bytes(32, "big").hex())
+            result.address = Web3.to_checksum_address(found[1] if nonce is None else create_address(found[1], nonce))
+        logger.info(f"Tried {result.attempts} keys in {result.elapsed:.2f}s ({result.rate:.0f} keys/s)")
+        return result if return_result else result.value
+
+    def sign_authorizations(
+        self,
+        accounts: Sequence[Account],
+        targets: Union[HexStr, Sequence[HexStr]],
+        sender: Account = None,
+        chain_id: int = None,
+        workers: int = 1,
+        chunk_size: int = 100,
+    ) -> List[SignedSetCodeAuthorization]:
+        """Signs the EIP-7702 authorizations of many accounts, e.g. to delegate
+        them in one transaction. The chain ID and the nonces of all accounts
+        are fetched in one JSON-RPC batch request, unless they are known.
+
+        Examples:
+
+            >>> authorization_list = conn.sign_authorizations(accounts, delegate_contract.address)
+            >>> sender.send_transaction(sender.address, authorization_list=authorization_list)
+
+        :param accounts: The accounts to sign the authorizations. An account may
+            appear more than once, with its nonces increasing in order.
+        :type accounts: Sequence[:class:`Account <cheb3.account.Account>`]
+        :param targets: The address of the smart contract code to be associated
+            with all accounts, or a list of addresses, one for each account.
+        :type targets: Union[HexStr, Sequence[HexStr]]
+        :param sender: The account to send the EIP-7702 transaction, defaults to
+            :const:`None`. If it is one of the accounts, the nonce of its
+            authorization is 1 higher than its current nonce. Check
+            :meth:`Account.sign_authorization <cheb3.account.Account.sign_authorization>`
+            for more details.
+        :type sender: :class:`Account <cheb3.account.Account>`
+        :param chain_id: The chain ID, defaults to the chain ID of the connection.
+        :type chain_id: int
+        :param workers: The number of worker processes signing the authorizations,
+            defaults to 1, which signs them in the current process. If
+            :const:`None`, the number of CPUs is used.
+        :type workers: int
+        :param chunk_size: The number of authorizations signed by a worker at a
+            time, defaults to 100.
+        :type chunk_size: int
+
+        :returns: The authorization list in the order of the accounts, which can
+            be passed as `authorization_list` to send a transaction.
+        :rtype: List[~eth_account.datastructures.SignedSetCodeAuthorization]
+        """
+        nonces: Dict[str, Any] = dict()
+        batch = Batch(self.w3, max_size=1000)
+        chain_id_result = self.w3._batch_chain_id(batch) if chain_id is None else None
+        for account in accounts:
+            if account.address not in nonces:
+                manager = self.w3._get_nonce_manager(account.address)
+                with manager.lock:
+                    nonce = manager.nonce
+                if nonce is None:
+                    nonce = batch.add(self.w3.eth.get_transaction_count, account.address, "pending")
+                nonces[account.address] = nonce
+        batch.execute()
+
+        if chain_id is None:
+            chain_id = self.w3._set_chain_id(chain_id_result)
+        nonces = {
+            address: nonce.result() if isinstance(nonce, BatchResult) else nonce for address, nonce in nonces.items()
+        }
+        return build_authorizations(accounts, targets, chain_id, nonces, sender and sender.address, workers, chunk_size)
+
     def contract(
         self,
         signer: Account = None,
@@ -68,6 +255,124 @@ class Connection:
         contract_factory = Contract.factory(self.w3, contract_name)
         return contract_factory(signer, address, **kwargs)
 
+    def batch(self, max_size: int = 100) -> Batch:
+        """Creates a batch to send read requests as JSON-RPC batch requests.
+
+        Examples:
+
+            >>> with conn.batch():
+            ...     balance = conn.get_balance(account.address)
+            ...     slot = conn.get_storage_at(contract_addr, 0)
+            >>> balance.result()
+            1000000000000000000
+
+        :param max_size: The maximum number of requests in a single JSON-RPC
+            batch request, defaults to 100.
+        :type max_size: int
+
+        :rtype: :class:`Batch <cheb3.batch.Batch>`
+        """
+        return Batch(self.w3, max_size)
+
+    def multicall(
+        self,
+        allow_failure: bool = True,
+        block_identifier: Any = "latest",
+        max_size: int = 500,
+        deployless: Optional[bool] = None,
+    ) -> Multicall:
+        """Creates a multicall to execute contract reads as one ``eth_call``
+        to Multicall3, or to a deployless multicall if Multicall3 is not deployed.
+
+        Examples:
+
+            >>> with conn.multicall():
+            ...     balances = [token.caller.balanceOf(holder) for holder in holders]
+            >>> balances[0].result()
+            1000000000000000000
+
+        Check :class:`Multicall <cheb3.multicall.Multicall>` for the parameters.
+
+        :rtype: :class:`Multicall <cheb3.multicall.Multicall>`
+        """
+        return Multicall(self.w3, allow_failure, block_identifier, max_size, deployless)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the instrumentation of this connection: the
+        number of RPC calls and the time spent in the `build`, `estimate`,
+        `sign`, `broadcast` and `mined` phases of
+        :meth:`Account.send_transaction <cheb3.account.Account.send_transaction>`,
+        :meth:`Contract.deploy <cheb3.contract.Contract.deploy>`, the
+        ``send_transaction`` method of contract functions and ``create_access_list``,
+        and the latency histogram of each JSON-RPC method.
+
+        Examples:
+
+            >>> conn.stats()["operations"]["Account.send_transaction"]
+            {'count': 10, 'errors': 0, 'rpc_calls': 43, 'elapsed': 2.61,
+            'phases': {'build': 0.41, 'estimate': 0.22, 'sign': 0.03, 'broadcast': 0.12, 'mined': 1.83}}
+            >>> conn.stats()["rpc"]["eth_estimateGas"]
+            {'count': 10, 'total': 0.22, 'mean': 0.022, 'max': 0.031,
+            'buckets': {'0.005': 0, '0.01': 0, '0.025': 8, '0.05': 10, ..., '+Inf': 10}}
+
+        :rtype: Dict[str, Any]
+        """
+        return self.w3.stats.snapshot()
+
+    def reset_stats(self) -> None:
+        """Clears the recorded stats."""
+        self.w3.stats.reset()
+
+    def bundle(self) -> Bundle:
+        """Creates a bundle of transactions signed ahead of time and broadcast
+        together in one JSON-RPC batch request.
+
+        :rtype: :class:`Bundle <cheb3.bundle.Bundle>`
+        """
+        return Bundle(self.w3)
+
+    def load_bundle(self, path: str) -> Bundle:
+        """Loads a bundle saved by :meth:`Bundle.save <cheb3.bundle.Bundle.save>`.
+
+        :param path: The path of the bundle file.
+        :type path: str
+
+        :rtype: :class:`Bundle <cheb3.bundle.Bundle>`
+        """
+        return Bundle.load(self.w3, path)
+
+    def wait_for_transaction_receipt(self, tx_hash: HexStr, timeout: float = 120) -> TxReceipt:
+        """Waits for the receipt of a transaction. All transactions waited for
+        on this connection, including those sent by accounts and contracts,
+        share one polling loop, which checks new blocks instead of polling
+        each transaction hash.
+
+        :param tx_hash: The transaction hash.
+        :type tx_hash: HexStr
+        :param timeout: Seconds to wait, defaults to 120.
+        :type timeout: float
+
+        :raises web3.exceptions.TimeExhausted: If the transaction is not mined in time.
+        :rtype: TxReceipt
+        """
+        return self.w3.receipt_tracker.wait(tx_hash, timeout)
+
+    def wait_for_transaction_receipts(
+        self, tx_hashes: Sequence[HexStr], timeout: float = 120
+    ) -> List[Optional[TxReceipt]]:
+        """Waits for the receipts of the transactions together.
+
+        :param tx_hashes: The transaction hashes.
+        :type tx_hashes: Sequence[HexStr]
+        :param timeout: Seconds to wait, defaults to 120.
+        :type timeout: float
+
+        :returns: The receipts in the order of the hashes, :const:`None` for
+            the transactions not mined in time.
+        :rtype: List[Optional[TxReceipt]]
+        """
+        return self.w3.receipt_tracker.wait_many(tx_hashes, timeout)
+
     def cast_call(self, to: str, signature: str, *_args, **kwargs) -> str:
         r"""Use cast with default settings to interact with a smart contract
         without creating a new transaction on the blockchain.
@@ -128,7 +433,7 @@ class Connection:
 
         :rtype: int
         """
-        return self.w3.eth.get_balance(address)
+        return self.w3._read(self.w3.eth.get_balance, address)
 
     def get_storage_at(self, address: str, slot: int) -> HexBytes:
         """Returns the value from a storage position for the given account.
@@ -140,7 +445,70 @@ class Connection:
 
         :rtype: ~hexbytes.main.HexBytes
         """
-        return self.w3.eth.get_storage_at(address, slot)
+        return self.w3._read(self.w3.eth.get_storage_at, address, slot)
+
+    def get_storage_slots(
+        self, address: str, slots: Sequence[int], block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Returns the values from many storage positions for the given account,
+        read in one JSON-RPC batch request.
+
+        Examples:
+
+            >>> conn.get_storage_slots(contract_addr, [0, 1, 5])
+            [HexBytes('0x...2a'), HexBytes('0x...00'), HexBytes('0x...07')]
+
+        :param address: The address of the account.
+        :type address: str
+        :param slots: The storage slots.
+        :type slots: Sequence[int]
+        :param block_identifier: The block to read at, defaults to `latest`.
+        :param state_override: Reads all slots in one ``eth_call``, with a reader
+            contract placed at the address by a state override, defaults to
+            :const:`False`. The node must support state overrides in ``eth_call``.
+        :type state_override: bool
+
+        :returns: The values in the order of the slots.
+        :rtype: List[~hexbytes.main.HexBytes]
+        """
+        return self.w3._get_storage_slots(address, list(slots), block_identifier, state_override)
+
+    def get_storage_range(
+        self, address: str, start: int, count: int, block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Returns the values from `count` consecutive storage positions starting
+        at `start` for the given account. Check :meth:`get_storage_slots` for
+        the other parameters.
+
+        :rtype: List[~hexbytes.main.HexBytes]
+        """
+        return self.w3._get_storage_slots(address, list(range(start, start + count)), block_identifier, state_override)
+
+    def dump_storage(
+        self, address: str, layout: Dict[str, Any], block_identifier: Any = "latest", state_override: bool = False
+    ) -> Dict[str, Any]:
+        """Reads and decodes all state variables of a contract with the
+        `storageLayout` output of solc. The variables are read in one batch
+        request, and the data of dynamic arrays, ``bytes`` and ``string`` in
+        one more batch request per level of nesting.
+
+        Examples:
+
+            >>> conn.dump_storage(contract_addr, load_storage_layout("Token.sol", "Token"))
+            {'owner': '0x3032Ab3Fa8C01d786D29dAdE018d7f2017918e12', 'paused': False, 'balances': 2, 'name': 'Cheb3Token'}
+
+        Check :class:`StorageLayout <cheb3.storage.StorageLayout>` for how the
+        variables are decoded, and :meth:`get_storage_slots` for the other parameters.
+
+        :param layout: The `storageLayout` output, with `storage` and `types`.
+        :type layout: Dict
+
+        :returns: A dict mapping the name of each variable to its value.
+        :rtype: Dict[str, Any]
+        """
+        return StorageLayout(layout).decode(
+            lambda slots: self.w3._get_storage_slots(address, slots, block_identifier, state_override)
+        )
 
     def get_code(self, address: str) -> HexBytes:
         """Returns the code at the given account.
@@ -150,4 +518,229 @@ class Connection:
 
         :rtype: ~hexbytes.main.HexBytes
         """
-        return self.w3.eth.get_code(address)
+        return self.w3._read(self.w3.eth.get_code, address)
+
+
+class AsyncConnection:
+    """Creates an asynchronous connection to an HTTP provider.
+    It mirrors :class:`Connection`, but the methods interacting with the
+    chain are coroutines.
+
+    Examples:
+
+        >>> async with AsyncConnection("http://localhost:8545") as conn:
+        ...     account = conn.account("0xpr1vateK3y")
+        ...     balances = await conn.gather(*[conn.get_balance(addr) for addr in addresses])
+
+    :param endpoint_uri: The full URI to the RPC endpoint.
+    :type endpoint_uri: str
+    :param max_concurrency: The maximum number of awaitables running at the
+        same time in :meth:`gather`, defaults to 64.
+    :type max_concurrency: int
+    :param fee_cache_ttl: Check :class:`Connection` for more details.
+    :type fee_cache_ttl: float
+    :param gas_estimate_cache: Check :class:`Connection` for more details.
+    :type gas_estimate_cache: bool
+    :param stats_hook: Check :class:`Connection` for more details.
+    :type stats_hook: Callable[[OperationRecord], Any]
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        max_concurrency: int = 64,
+        fee_cache_ttl: float = None,
+        gas_estimate_cache: bool = False,
+        stats_hook: Callable[[OperationRecord], Any] = None,
+    ) -> None:
+        self.w3 = AsyncWeb3Helper(
+            AsyncWeb3Helper.AsyncHTTPProvider(
+                endpoint_uri,
+                cache_allowed_requests=True,
+                cacheable_requests=ALWAYS_CACHEABLE_REQUESTS,
+            ),
+            fee_cache_ttl=fee_cache_ttl,
+            gas_estimate_cache=gas_estimate_cache,
+            stats_hook=stats_hook,
+        )
+        self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        self.max_concurrency = max_concurrency
+
+    async def __aenter__(self) -> "AsyncConnection":
+        try:
+            await self.w3.is_connected(show_traceback=True)
+        except Exception as e:
+            if isinstance(e, (ConnectionError, OSError)):
+                raise Exception(f"Could not connect to {self.w3.provider.endpoint_uri}.")
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.w3.provider.disconnect()
+
+    async def gather(self, *aws: Awaitable, return_exceptions: bool = False) -> List[Any]:
+        """Runs the awaitables concurrently like :func:`asyncio.gather`, but at
+        most :attr:`max_concurrency` of them are running at the same time.
+
+        :param `*aws`: The awaitables to run, e.g. ``conn.get_balance(addr)``
+            or ``contract.functions.fn().send_transaction()``.
+        :param return_exceptions: Returns the exceptions instead of raising
+            the first one, defaults to :const:`False`.
+        :type return_exceptions: bool
+
+        :returns: The results in the order of the awaitables.
+        :rtype: List[Any]
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(aw: Awaitable) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*[bounded(aw) for aw in aws], return_exceptions=return_exceptions)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the instrumentation of this connection.
+        Check :meth:`Connection.stats` for more details.
+
+        :rtype: Dict[str, Any]
+        """
+        return self.w3.stats.snapshot()
+
+    def reset_stats(self) -> None:
+        """Clears the recorded stats."""
+        self.w3.stats.reset()
+
+    def account(self, private_key: str = None) -> AsyncAccount:
+        """Creates an account associated with this connection.
+        Check :meth:`Connection.account` for more details.
+
+        :rtype: :class:`AsyncAccount <cheb3.account.AsyncAccount>`
+        """
+        account_factory = AsyncAccount.factory(self.w3)
+        return account_factory(private_key)
+
+    async def sign_authorizations(
+        self,
+        accounts: Sequence[AsyncAccount],
+        targets: Union[HexStr, Sequence[HexStr]],
+        sender: AsyncAccount = None,
+        chain_id: int = None,
+        workers: int = 1,
+        chunk_size: int = 100,
+    ) -> List[SignedSetCodeAuthorization]:
+        """Signs the EIP-7702 authorizations of many accounts. The nonces of the
+        accounts are fetched concurrently. Check :meth:`Connection.sign_authorizations`
+        for more details.
+        """
+        if chain_id is None:
+            chain_id = await self.w3._get_chain_id()
+        addresses = list(dict.fromkeys(account.address for account in accounts))
+
+        async def get_nonce(address: str) -> int:
+            manager = self.w3._get_nonce_manager(address)
+            # waits for a transaction of the account being sent
+            async with manager.async_lock:
+                nonce = manager.nonce
+            if nonce is None:
+                nonce = await self.w3.eth.get_transaction_count(address, "pending")
+            return nonce
+
+        nonces = dict(zip(addresses, await self.gather(*[get_nonce(address) for address in addresses])))
+        return build_authorizations(accounts, targets, chain_id, nonces, sender and sender.address, workers, chunk_size)
+
+    def contract(
+        self,
+        signer: AsyncAccount = None,
+        contract_name: str = "",
+        address: str = None,
+        **kwargs: Any,
+    ) -> AsyncContract:
+        """Creates a contract instance associated with this connection.
+        Check :meth:`Connection.contract` for more details.
+
+        :rtype: :class:`AsyncContract <cheb3.contract.AsyncContract>`
+        """
+        contract_factory = AsyncContract.factory(self.w3, contract_name)
+        return contract_factory(signer, address, **kwargs)
+
+    async def wait_for_transaction_receipt(self, tx_hash: HexStr, timeout: float = 120) -> TxReceipt:
+        """Waits for the receipt of a transaction.
+        Check :meth:`Connection.wait_for_transaction_receipt` for more details.
+
+        :rtype: TxReceipt
+        """
+        return await self.w3.receipt_tracker.wait(tx_hash, timeout)
+
+    async def wait_for_transaction_receipts(
+        self, tx_hashes: Sequence[HexStr], timeout: float = 120
+    ) -> List[Optional[TxReceipt]]:
+        """Waits for the receipts of the transactions together.
+        Check :meth:`Connection.wait_for_transaction_receipts` for more details.
+
+        :rtype: List[Optional[TxReceipt]]
+        """
+        return await self.w3.receipt_tracker.wait_many(tx_hashes, timeout)
+
+    async def get_balance(self, address: str) -> int:
+        """Returns the balance of the given account.
+
+        :param address: The address of the account.
+        :type address: str
+
+        :rtype: int
+        """
+        return await self.w3.eth.get_balance(address)
+
+    async def get_storage_at(self, address: str, slot: int) -> HexBytes:
+        """Returns the value from a storage position for the given account.
+
+        :param address: The address of the account.
+        :type address: str
+        :param slot: The storage slot.
+        :type slot: int
+
+        :rtype: ~hexbytes.main.HexBytes
+        """
+        return await self.w3.eth.get_storage_at(address, slot)
+
+    async def get_storage_slots(
+        self, address: str, slots: Sequence[int], block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Returns the values from many storage positions for the given account,
+        read concurrently. Check :meth:`Connection.get_storage_slots` for more details.
+
+        :rtype: List[~hexbytes.main.HexBytes]
+        """
+        return await self.w3._get_storage_slots(address, list(slots), block_identifier, state_override)
+
+    async def get_storage_range(
+        self, address: str, start: int, count: int, block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Returns the values from `count` consecutive storage positions starting
+        at `start`. Check :meth:`Connection.get_storage_range` for more details.
+
+        :rtype: List[~hexbytes.main.HexBytes]
+        """
+        return await self.w3._get_storage_slots(address, list(range(start, start + count)), block_identifier, state_override)
+
+    async def dump_storage(
+        self, address: str, layout: Dict[str, Any], block_identifier: Any = "latest", state_override: bool = False
+    ) -> Dict[str, Any]:
+        """Reads and decodes all state variables of a contract.
+        Check :meth:`Connection.dump_storage` for more details.
+
+        :rtype: Dict[str, Any]
+        """
+        return await StorageLayout(layout).async_decode(
+            lambda slots: self.w3._get_storage_slots(address, slots, block_identifier, state_override)
+        )
+
+    async def get_code(self, address: str) -> HexBytes:
+        """Returns the code at the given account.
+
+        :param address: The address of the account.
+        :type address: str
+
+        :rtype: ~hexbytes.main.HexBytes
+        """
+        return await self.w3.eth.get_code(address)
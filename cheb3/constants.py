@@ -3,3 +3,13 @@ TYPE_ALIAS = {
     "int": "int256",
 }
 GAS_BUFFER = 100000
+# the number of storage slots, slot arithmetic wraps around it like the EVM
+STORAGE_SLOTS = 2**256
+# substrings of the errors returned by nodes when a nonce has already been used
+NONCE_ERRORS = (
+    "nonce too low",
+    "nonce is too low",
+    "already known",
+    "known transaction",
+    "invalid transaction nonce",
+)
@@ -1,31 +1,45 @@
-from typing import cast, Optional, Union, Sequence
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import cached_property, partial
+from typing import cast, Any, Dict, List, Optional, Union, Sequence, Tuple, Type
 from hexbytes import HexBytes
 
 from web3 import Web3, AsyncWeb3
 from web3.contract.contract import (
+    Contract as Web3Contract,
     ContractFunction,
     ContractFunctions,
     ContractCaller,
 )
+from web3.contract.async_contract import (
+    AsyncContractFunction,
+    AsyncContractCaller,
+)
 from web3.contract.base_contract import (
+    BaseContractCaller,
     NonExistentFallbackFunction,
     NonExistentReceiveFunction,
 )
 from web3._utils.datatypes import PropertyCheckingFactory
-from web3._utils.abi import (
-    filter_abi_by_type,
-    fallback_func_abi_exists,
-    receive_func_abi_exists,
-)
+from web3._utils.ens import is_ens_name
+from web3._utils.abi import filter_abi_by_type
+from web3._utils.normalizers import normalize_abi
+from web3._utils.validation import validate_address
 from web3._utils.abi_element_identifiers import FallbackFn, ReceiveFn
+from web3.utils.abi import _get_any_abi_signature_with_name, get_name_from_abi_element_identifier
 from web3.types import TxReceipt, AccessList
 from eth_utils import abi_to_signature
-from eth_typing import ABI, ABIFunction, ChecksumAddress, HexStr
+from eth_typing import ABI, ABIFallback, ABIFunction, ABIReceive, ChecksumAddress, HexStr
 import eth_account
 
-from cheb3.account import Account
-from cheb3.helper import Web3Helper
-from cheb3.constants import GAS_BUFFER
+from cheb3.account import Account, AsyncAccount
+from cheb3.helper import Web3Helper, AsyncWeb3Helper
+from cheb3.stats import instrument
+from cheb3.storage import StorageLayout
+from cheb3.utils import calc_mapping_slots
 
 from loguru import logger
 
@@ -54,15 +68,25 @@ class Contract:
                 "`Connection.contract` interface to create a contract."
             )
 
+        if address and not is_ens_name(address):
+            validate_address(address)
+
+        self.account = signer
         self.signer = signer.eth_acct if signer else None
-        if address:
-            self.address = address
-            self.instance = self.w3.eth.contract(address=address, **kwargs)
-            self._init_functions()
-        else:
-            self.address = None
-            self.instance = self.w3.eth.contract(**kwargs)
+        self.address = address if address else None
+        # the ABI-derived data is shared by the contracts with the same ABI,
+        # the wrappers and the web3.py contract are built on first access
+        self._artifacts = _ContractArtifacts.get(kwargs.get("abi"))
+        self._kwargs = {**kwargs, "abi": self._artifacts.abi}
+
+    @cached_property
+    def instance(self) -> Union[Type[Web3Contract], Web3Contract]:
+        """The web3.py contract, or the contract factory if the contract is not deployed."""
+        if self.address:
+            return self.w3.eth.contract(self.address, **self._kwargs)
+        return self.w3.eth.contract(**self._kwargs)
 
+    @instrument("Contract.deploy")
     def deploy(self, *constructor_args, **kwargs) -> None:
         """Deploys the contract.
 
@@ -76,6 +100,9 @@ class Contract:
             max_fee_per_gas (int): Specifies the maximum amount you are willing to pay,
                 inclusive of `baseFeePerGas` and `maxPriorityFeePerGas`. Its default value
                 is the sum of `maxPriorityFeePerGas` and twice the `baseFeePerGas` of the latest block.
+            fee_strategy (str): Prices the **EIP-1559** transaction from the recent
+                ``eth_feeHistory`` with the `cheap`, `normal` or `fast` strategy,
+                unless the fees are given. Check :class:`FeeOracle <cheb3.helper.FeeOracle>` for more details.
             gas_limit (int): Specifies the maximum gas the deployment can use.
             proxy (bool): A minimal proxy contract (ERC-1167) will be deployed
                 and connected to the logic contract if set to :const:`True`,
@@ -94,23 +121,23 @@ class Contract:
         # EIP-7702 transaction cannot be used to create contract
         if "authorization_list" in kwargs:
             del kwargs["authorization_list"]
-        tx = self.w3._build_transaction(self.signer.address, kwargs)
-        tx["value"] = kwargs.get("value", 0)
 
-        # to prevent the build_transaction from simulating the transaction
-        # and reverting during gas estimation.
-        tx["gas"] = 3000000
-
-        tx = self.instance.constructor(*constructor_args).build_transaction(tx)
-        try:
-            estimate_gas = self.w3.eth.estimate_gas(tx) + GAS_BUFFER
-        except Exception:
-            estimate_gas = 3000000
-        tx["gas"] = kwargs.get("gas_limit", estimate_gas)
-        tx = self.signer.sign_transaction(tx).raw_transaction
+        def build_deployment(nonce: int) -> dict:
+            tx = self.w3._build_transaction(self.signer.address, {**kwargs, "nonce": nonce})
+            tx["value"] = kwargs.get("value", 0)
+
+            # to prevent the build_transaction from simulating the transaction
+            # and reverting during gas estimation.
+            tx["gas"] = 3000000
+
+            tx = self.instance.constructor(*constructor_args).build_transaction(tx)
+            tx["gas"] = self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+            return tx
+
         logger.debug(f"Deploying {type(self).__name__} ...")
-        tx_hash = self.w3.eth.send_raw_transaction(tx).hex()
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        tx_hash = self.account._sign_and_send(build_deployment, kwargs.get("nonce"))
+        with self.w3.stats.phase("mined"):
+            receipt = self.w3.receipt_tracker.wait(tx_hash)
         if not receipt.status:
             raise Exception(f"Failed to deploy {type(self).__name__}.")
         logger.info(
@@ -122,77 +149,128 @@ class Contract:
 
         if kwargs.get("proxy", False):
             proxy_bytecode = f"3d602d80600a3d3981f3363d3d373d3d3d363d73{self.address[2:].lower()}5af43d82803e903d91602b57fd5bf3"
-            tx = {
-                "from": self.signer.address,
-                "to": None,
-                "chainId": self.w3.eth.chain_id,
-                "nonce": self.w3.eth.get_transaction_count(self.signer.address),
-                "gasPrice": kwargs.get("gas_price", self.w3.eth.gas_price),
-                "data": proxy_bytecode,
-            }
-            tx["gas"] = kwargs.get("gas_limit", self.w3.eth.estimate_gas(tx) + GAS_BUFFER)
-            tx = self.signer.sign_transaction(tx).raw_transaction
+
+            def build_proxy_deployment(nonce: int) -> dict:
+                tx = {
+                    "from": self.signer.address,
+                    "to": None,
+                    "chainId": self.w3._get_chain_id(),
+                    "nonce": nonce,
+                    "gasPrice": kwargs["gas_price"] if "gas_price" in kwargs else self.w3._get_fee("gas_price"),
+                    "data": proxy_bytecode,
+                }
+                tx["gas"] = self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+                return tx
+
             logger.debug("Deploying the proxy ...")
-            tx_hash = self.w3.eth.send_raw_transaction(tx).hex()
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            tx_hash = self.account._sign_and_send(build_proxy_deployment)
+            with self.w3.stats.phase("mined"):
+                receipt = self.w3.receipt_tracker.wait(tx_hash)
             if not receipt.status:
                 raise Exception("Failed to deploy the proxy.")
             logger.info(f"The proxy is deployed at {receipt.contractAddress}")
             self.address = receipt.contractAddress
 
-        self.instance = self.w3.eth.contract(self.address, abi=self.instance.abi)
         self._init_functions()
 
     @staticmethod
-    def get_fallback_function(abi: ABI, w3: Web3Helper, signer: eth_account.Account, address: str):
-        if abi and fallback_func_abi_exists(abi):
-            fallback_abi = filter_abi_by_type("fallback", abi)[0]
-            return ContractFunctionWrapper.factory(
+    def get_fallback_function(
+        abi: ABI,
+        w3: Web3Helper,
+        signer: eth_account.Account,
+        address: str,
+        account: Account = None,
+        contract_function_class: Type["ContractFunctionWrapper"] = None,
+    ):
+        artifacts = _ContractArtifacts.get(abi)
+        if artifacts.fallback_abi:
+            return artifacts.bind(
+                contract_function_class or ContractFunctionWrapper,
                 "fallback",
+                artifacts.fallback_abi,
+                FallbackFn,
                 w3=w3,
-                signer=signer,
-                contract_abi=abi,
                 address=address,
-                abi_element_identifier=FallbackFn,
-                abi=fallback_abi,
-            )()
+                signer=signer,
+                account=account,
+            )
         else:
             return cast(ContractFunctionWrapper, NonExistentFallbackFunction())
 
     @staticmethod
-    def get_receive_function(abi: ABI, w3: Web3Helper, signer: eth_account.Account, address: str):
-        if abi and receive_func_abi_exists(abi):
-            receive_abi = filter_abi_by_type("receive", abi)[0]
-            return ContractFunctionWrapper.factory(
+    def get_receive_function(
+        abi: ABI,
+        w3: Web3Helper,
+        signer: eth_account.Account,
+        address: str,
+        account: Account = None,
+        contract_function_class: Type["ContractFunctionWrapper"] = None,
+    ):
+        artifacts = _ContractArtifacts.get(abi)
+        if artifacts.receive_abi:
+            return artifacts.bind(
+                contract_function_class or ContractFunctionWrapper,
                 "receive",
+                artifacts.receive_abi,
+                ReceiveFn,
                 w3=w3,
-                signer=signer,
-                contract_abi=abi,
                 address=address,
-                abi_element_identifier=ReceiveFn,
-                abi=receive_abi,
-            )()
+                signer=signer,
+                account=account,
+            )
         else:
             return cast(ContractFunctionWrapper, NonExistentReceiveFunction())
 
-    def _init_functions(self) -> None:
-        self.functions = ContractFunctionsWrapper(self.signer, self.instance.abi, self.w3, self.address)
-        self.caller = ContractCaller(self.instance.abi, self.w3, self.address)
+    @cached_property
+    def functions(self) -> "ContractFunctionsWrapper":
+        """The functions of the deployed contract."""
+        return self._build_functions(ContractFunctionWrapper)
+
+    @cached_property
+    def caller(self) -> "ContractCallerWrapper":
+        """The caller of the deployed contract."""
+        self._check_deployed("caller")
+        return ContractCallerWrapper(self._artifacts.abi, self.w3, self.address)
+
+    @cached_property
+    def fallback(self) -> "ContractFunctionWrapper":
+        """The fallback function of the deployed contract."""
+        return self.get_fallback_function(
+            self._artifacts.abi, self.w3, self.signer, self.address, self.account, self.functions.contract_function_class
+        )
+
+    @cached_property
+    def receive(self) -> "ContractFunctionWrapper":
+        """The receive function of the deployed contract."""
+        return self.get_receive_function(
+            self._artifacts.abi, self.w3, self.signer, self.address, self.account, self.functions.contract_function_class
+        )
 
-        self.fallback = self.get_fallback_function(self.instance.abi, self.w3, self.signer, self.address)
-        self.receive = self.get_receive_function(self.instance.abi, self.w3, self.signer, self.address)
+    def _check_deployed(self, name: str) -> None:
+        if not self.address:
+            raise AttributeError(f"The contract is not deployed, `{name}` is not available.")
+
+    def _build_functions(self, contract_function_class: Type["ContractFunctionWrapper"]) -> "ContractFunctionsWrapper":
+        self._check_deployed("functions")
+        return ContractFunctionsWrapper(
+            self.signer, self._artifacts.abi, self.w3, self.address, self.account, contract_function_class
+        )
+
+    def _init_functions(self) -> None:
+        # rebuilt on next access with the new address
+        for name in ("instance", "functions", "caller", "fallback", "receive"):
+            self.__dict__.pop(name, None)
 
     @classmethod
     def factory(cls, w3: Web3Helper, contract_name: str = "") -> "Contract":
-        contract = cast(
-            Contract,
-            PropertyCheckingFactory(contract_name or cls.__name__.lower(), (cls,), {"w3": w3}),
-        )
-        return contract
+        key = (cls, contract_name or cls.__name__.lower())
+        if key not in w3._contract_factories:
+            w3._contract_factories[key] = PropertyCheckingFactory(key[1], (cls,), {"w3": w3})
+        return cast(Contract, w3._contract_factories[key])
 
     def get_balance(self) -> int:
         """Returns the balance of the contract instance."""
-        return self.w3.eth.get_balance(self.address)
+        return self.w3._read(self.w3.eth.get_balance, self.address)
 
     def get_storage_at(self, slot: int) -> HexBytes:
         """Returns the value from a storage position for the contract instance.
@@ -202,51 +280,331 @@ class Contract:
 
         :rtype: ~hexbytes.main.HexBytes
         """
-        return self.w3.eth.get_storage_at(self.address, slot)
+        return self.w3._read(self.w3.eth.get_storage_at, self.address, slot)
+
+    def get_storage_slots(
+        self, slots: Sequence[int], block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Returns the values from many storage positions for the contract instance.
+        Check :meth:`Connection.get_storage_slots <cheb3.connection.Connection.get_storage_slots>`
+        for more details.
+
+        :rtype: List[~hexbytes.main.HexBytes]
+        """
+        return self.w3._get_storage_slots(self.address, list(slots), block_identifier, state_override)
+
+    def get_storage_range(
+        self, start: int, count: int, block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Returns the values from `count` consecutive storage positions starting
+        at `start` for the contract instance. Check :meth:`Connection.get_storage_slots
+        <cheb3.connection.Connection.get_storage_slots>` for more details.
+
+        :rtype: List[~hexbytes.main.HexBytes]
+        """
+        return self.w3._get_storage_slots(self.address, list(range(start, start + count)), block_identifier, state_override)
+
+    def dump_storage(
+        self, layout: Dict[str, Any], block_identifier: Any = "latest", state_override: bool = False
+    ) -> Dict[str, Any]:
+        """Reads and decodes all state variables of the contract instance.
+        Check :meth:`Connection.dump_storage <cheb3.connection.Connection.dump_storage>`
+        for more details.
+
+        :rtype: Dict[str, Any]
+        """
+        return StorageLayout(layout).decode(
+            lambda slots: self.w3._get_storage_slots(self.address, slots, block_identifier, state_override)
+        )
+
+    def read_mapping(
+        self,
+        slot: int,
+        keys: Sequence[Any],
+        value_type: str = "uint256",
+        key_type: Union[str, Sequence[str]] = "address",
+        block_identifier: Any = "latest",
+        state_override: bool = False,
+    ) -> List[Any]:
+        """Reads the values of a mapping of the contract instance for many
+        keys. The slots of the values are read in one batch request.
+
+        Examples:
+
+            >>> # `mapping(address => uint256) balances` at slot 3
+            >>> contract.read_mapping(3, holders)
+            [1000000000000000000, 0, 42]
+            >>> # `mapping(address => mapping(address => uint256)) allowance` at slot 4
+            >>> contract.read_mapping(4, [(owner, spender)], key_type=["address", "address"])
+            [115792089237316195423570985008687907853269984665640564039457584007913129639935]
+
+        :param slot: The slot of the mapping.
+        :type slot: int
+        :param keys: The keys, or sequences of keys for nested mappings.
+        :type keys: Sequence[Any]
+        :param value_type: The type of the values, a value type, `bytes` or `string`,
+            defaults to `uint256`.
+        :type value_type: str
+        :param key_type: The type of the keys, or a sequence of the key types
+            for nested mappings, defaults to `address`.
+        :type key_type: Union[str, Sequence[str]]
+
+        Check :meth:`Connection.get_storage_slots <cheb3.connection.Connection.get_storage_slots>`
+        for the other parameters.
+
+        :returns: The values in the order of the keys.
+        :rtype: List[Any]
+        """
+        slots = calc_mapping_slots(slot, keys, key_type)
+        decoded = StorageLayout.from_slots(slots, value_type).decode(
+            lambda slots: self.w3._get_storage_slots(self.address, slots, block_identifier, state_override)
+        )
+        return [decoded[str(i)] for i in range(len(slots))]
+
+
+class _ContractArtifacts:
+    """The data derived from an ABI: the sorted functions, the resolved
+    function names and the function wrapper classes. It is computed once per
+    ABI and shared by all contracts with the same ABI, so each contract only
+    binds its address and signer to the shared classes."""
+
+    # the number of ABIs whose artifacts are kept, the least recently used are dropped
+    MAX_CACHED = 256
+
+    _lock = threading.Lock()
+    # keyed by the hash of the ABI
+    _by_hash: "OrderedDict[str, _ContractArtifacts]" = OrderedDict()
+    # keyed by the id of the caller's ABI object, which is kept alive, to skip
+    # hashing the same ABI again; a hit is checked against the copy in the artifacts
+    _by_id: "OrderedDict[int, Tuple[Any, _ContractArtifacts]]" = OrderedDict()
+
+    def __init__(self, abi: Optional[ABI]) -> None:
+        # a copy, so changes of the caller's ABI do not leak into the shared artifacts
+        self.abi = copy.deepcopy(abi)
+        abi = self.abi
+        self.functions: Sequence[ABIFunction] = []
+        self.fallback_abi: Optional[ABIFallback] = None
+        self.receive_abi: Optional[ABIReceive] = None
+        if abi:
+            for element in abi:
+                if element.get("name") in ("abi", "address"):
+                    raise AttributeError(
+                        f"Contract contains a reserved word `{element['name']}` and could not be instantiated."
+                    )
+            # functions with the least number of inputs come first, as web3.py does
+            self.functions = sorted(
+                filter_abi_by_type("function", abi),
+                key=lambda fn: (fn["name"], len(fn.get("inputs", []))),
+            )
+            self.fallback_abi = next(iter(filter_abi_by_type("fallback", abi)), None)
+            self.receive_abi = next(iter(filter_abi_by_type("receive", abi)), None)
+        self._found: Dict[str, Tuple[str, ABIFunction]] = dict()
+        self._classes: Dict[Tuple[type, str], type] = dict()
+        # guards the lazily filled `_found` and `_classes`
+        self._lazy_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, abi: Union[ABI, str, None]) -> "_ContractArtifacts":
+        """Returns the artifacts of the ABI, computing them if it is a new ABI."""
+        source = abi
+        entry = cls._by_id.get(id(source))
+        if entry is not None and entry[0] is source and entry[1].abi == source:
+            return entry[1]
+        if abi is not None:
+            abi = normalize_abi(abi)
+        key = hashlib.sha256(json.dumps(abi, sort_keys=True).encode()).hexdigest()
+        with cls._lock:
+            if key in cls._by_hash:
+                cls._by_hash.move_to_end(key)
+            else:
+                cls._by_hash[key] = cls(abi)
+                while len(cls._by_hash) > cls.MAX_CACHED:
+                    cls._by_hash.popitem(last=False)
+            artifacts = cls._by_hash[key]
+            if isinstance(source, list):
+                cls._by_id[id(source)] = (source, artifacts)
+                cls._by_id.move_to_end(id(source))
+                while len(cls._by_id) > cls.MAX_CACHED:
+                    cls._by_id.popitem(last=False)
+            return artifacts
+
+    def find_function(self, function_name: str) -> Optional[Tuple[str, ABIFunction]]:
+        """Finds the signature and the ABI of a function by its name or signature.
+        Overloaded names are resolved the same way as web3.py does."""
+        found = self._found.get(function_name)
+        if found is not None or not self.functions:
+            return found
+        signature = function_name
+        if "(" not in function_name:
+            signature = _get_any_abi_signature_with_name(function_name, self.functions)
+            if signature is None:
+                return None
+        name = get_name_from_abi_element_identifier(signature)
+        for func in self.functions:
+            if func["name"] == name and abi_to_signature(func) == signature:
+                with self._lazy_lock:
+                    self._found[function_name] = (signature, func)
+                return signature, func
+        return None
+
+    def bind(
+        self,
+        contract_function_class: Type[ContractFunction],
+        class_name: str,
+        abi: ABIFunction,
+        abi_element_identifier: Any = None,
+        **attributes,
+    ) -> ContractFunction:
+        """Creates a contract function of the shared class, with the `attributes`
+        (e.g. `w3`, `address` and `signer`) set on the instance."""
+        key = (contract_function_class, class_name)
+        function_class = self._classes.get(key)
+        if function_class is None:
+            with self._lazy_lock:
+                function_class = self._classes.get(key)
+                if function_class is None:
+                    namespace = {"contract_abi": self.abi, "abi": abi}
+                    if abi_element_identifier is not None:
+                        namespace["abi_element_identifier"] = abi_element_identifier
+                    function_class = PropertyCheckingFactory(class_name, (contract_function_class,), namespace)
+                    self._classes[key] = function_class
+        function = function_class()
+        for name, value in attributes.items():
+            setattr(function, name, value)
+        return function
 
 
 class ContractFunctionsWrapper(ContractFunctions):
+    """The functions of a contract. Each function wrapper is built on its
+    first access and cached, so the construction cost does not grow with
+    the size of the ABI."""
+
     def __init__(
         self,
         signer: eth_account.Account,
         abi: ABI,
         w3: Union["Web3", "AsyncWeb3"],
         address: Optional[ChecksumAddress] = None,
+        account: Account = None,
+        contract_function_class: Type["ContractFunctionWrapper"] = None,
     ) -> None:
+        self._artifacts = _ContractArtifacts.get(abi)
         self.signer = signer
-        self.abi = abi
+        self.abi = self._artifacts.abi
         self.w3 = w3
         self.address = address
-        _functions: Sequence[ABIFunction] = None
+        self.account = account
+        self.contract_function_class = contract_function_class or ContractFunctionWrapper
+        if self._artifacts.functions:
+            self._functions = self._artifacts.functions
+
+    def __getattr__(self, function_name: str) -> "ContractFunctionWrapper":
+        artifacts = self.__dict__.get("_artifacts")
+        if artifacts is None:
+            return super().__getattr__(function_name)
+        found = artifacts.find_function(function_name)
+        if found is None and function_name.startswith("_") and "(" in function_name:
+            # the wrappers are also available as `_<signature>` attributes
+            found = artifacts.find_function(function_name[1:])
+        if found is None:
+            # raises the same errors as web3.py
+            return super().__getattr__(function_name)
+
+        signature, func = found
+        function = self.__dict__.get(f"_{signature}")
+        if function is None:
+            function = artifacts.bind(
+                self.contract_function_class,
+                signature,
+                func,
+                w3=self.w3,
+                address=self.address,
+                signer=self.signer,
+                account=self.account,
+            )
+            self.__dict__[f"_{signature}"] = function
+        if "(" not in function_name:
+            self.__dict__[function_name] = function
+        return function
+
+
+class _LazyContractCaller(BaseContractCaller):
+    """Builds the caller methods on first access."""
 
+    # set by subclasses
+    contract_function_class: Type[ContractFunction] = None
+
+    def __init__(
+        self,
+        abi: ABI,
+        w3: Union["Web3", "AsyncWeb3"],
+        address: ChecksumAddress,
+        transaction: dict = None,
+        block_identifier: Any = None,
+        ccip_read_enabled: Optional[bool] = None,
+        decode_tuples: Optional[bool] = False,
+        contract_functions: Any = None,
+    ) -> None:
+        self._artifacts = _ContractArtifacts.get(abi)
+        BaseContractCaller.__init__(self, self._artifacts.abi, w3, address, decode_tuples=decode_tuples)
+        self._call_kwargs = {
+            "transaction": transaction or {},
+            "block_identifier": block_identifier,
+            "ccip_read_enabled": ccip_read_enabled,
+        }
         if self.abi:
-            _functions = sorted(
-                filter_abi_by_type("function", self.abi),
-                key=lambda fn: (fn["name"], len(fn.get("inputs", []))),
+            self._functions = self._artifacts.functions
+
+    def __getattr__(self, function_name: str) -> Any:
+        artifacts = self.__dict__.get("_artifacts")
+        found = artifacts.find_function(function_name) if artifacts is not None else None
+        if found is None:
+            # raises the same errors as web3.py
+            return super().__getattr__(function_name)
+
+        signature, func = found
+        caller_method = self.__dict__.get(signature)
+        if caller_method is None:
+            fn = artifacts.bind(
+                self.contract_function_class,
+                signature,
+                func,
+                w3=self.w3,
+                address=self.address,
+                decode_tuples=self.decode_tuples,
             )
-            for func in _functions:
-                abi_signature = abi_to_signature(func)
-                function_factory = ContractFunctionWrapper.factory(
-                    abi_signature,
-                    w3=self.w3,
-                    signer=self.signer,
-                    contract_abi=self.abi,
-                    address=self.address,
-                    abi=func,
-                )
+            caller_method = partial(self.call_function, fn, **self._call_kwargs)
+            self.__dict__[signature] = caller_method
+        self.__dict__[function_name] = caller_method
+        return caller_method
 
-                if func["name"] not in self.__dict__:
-                    setattr(self, func["name"], function_factory)
 
-                setattr(self, f"_{abi_signature}", function_factory)
+class ContractCallerWrapper(_LazyContractCaller, ContractCaller):
+    contract_function_class = ContractFunction
 
-        if _functions:
-            self._functions = _functions
+    @staticmethod
+    def call_function(fn: ContractFunction, *args, **kwargs):
+        return fn.w3._read(ContractCaller.call_function, fn, *args, **kwargs)
+
+
+class AsyncContractCallerWrapper(_LazyContractCaller, AsyncContractCaller):
+    contract_function_class = AsyncContractFunction
 
 
 class ContractFunctionWrapper(ContractFunction):
     signer: eth_account.Account = None
+    account: Account = None
+
+    def __call__(self, *args, **kwargs) -> "ContractFunctionWrapper":
+        function = super().__call__(*args, **kwargs)
+        # an overload matching the arguments is created from the shared class
+        function.signer, function.account = self.signer, self.account
+        return function
+
+    def call(self, *args, **kwargs):
+        return self.w3._read(super().call, *args, **kwargs)
 
+    @instrument("ContractFunction.send_transaction")
     def send_transaction(self, **kwargs) -> Union[TxReceipt, HexStr]:
         """Signs and sends the transaction.
 
@@ -258,9 +616,13 @@ class ContractFunctionWrapper(ContractFunction):
             max_fee_per_gas (int): Specifies the maximum amount you are willing to pay,
                 inclusive of `baseFeePerGas` and `maxPriorityFeePerGas`. Its default value
                 is the sum of `maxPriorityFeePerGas` and twice the `baseFeePerGas` of the latest block.
+            fee_strategy (str): Prices the **EIP-1559** transaction from the recent
+                ``eth_feeHistory`` with the `cheap`, `normal` or `fast` strategy,
+                unless the fees are given. Check :class:`FeeOracle <cheb3.helper.FeeOracle>` for more details.
             gas_limit (int): Specifies the maximum gas the transaction can use.
             nonce (int): Allows to overwrite pending transactions that use
-                the same nonce.
+                the same nonce. Defaults to the next nonce tracked locally by
+                the signer.
             access_list (List[Dict]): Specifies a list of addresses and storage
                 keys that the transaction plans to access (EIP-2930).
             authorization_list (List[SignedSetCodeAuthorization]): Specifies a
@@ -276,21 +638,19 @@ class ContractFunctionWrapper(ContractFunction):
         if not self.signer:
             raise AttributeError("The `signer` is missing.")
 
-        tx = self.w3._build_transaction(self.signer.address, kwargs)
+        def build(nonce: int) -> dict:
+            tx = self.w3._build_transaction(self.signer.address, {**kwargs, "nonce": nonce})
 
-        # to prevent the build_transaction from simulating the transaction
-        # and reverting during gas estimation.
-        tx["gas"] = 3000000
+            # to prevent the build_transaction from simulating the transaction
+            # and reverting during gas estimation.
+            tx["gas"] = 3000000
 
-        tx = self.build_transaction(tx)
-        tx["value"] = kwargs.get("value", 0)
-        try:
-            estimate_gas = self.estimate_gas(tx) + GAS_BUFFER
-        except Exception:
-            estimate_gas = 3000000
-        tx["gas"] = kwargs.get("gas_limit", estimate_gas)
-        raw_tx = self.signer.sign_transaction(tx).raw_transaction
-        tx_hash = self.w3.eth.send_raw_transaction(raw_tx).hex()
+            tx = self.build_transaction(tx)
+            tx["value"] = kwargs.get("value", 0)
+            tx["gas"] = self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+            return tx
+
+        tx_hash = self.account._sign_and_send(build, kwargs.get("nonce"))
         func_name = (
             self.abi_element_identifier
             if isinstance(self.abi_element_identifier, str)
@@ -299,11 +659,13 @@ class ContractFunctionWrapper(ContractFunction):
         logger.info(f"({self.address}).{func_name} transaction hash: {tx_hash}")
         if not kwargs.get("wait_for_receipt", True):
             return tx_hash
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        with self.w3.stats.phase("mined"):
+            receipt = self.w3.receipt_tracker.wait(tx_hash)
         if not receipt.status:
             raise Exception(f"Transact to ({self.address}).{func_name} errored.")
         return receipt
 
+    @instrument("ContractFunction.create_access_list")
     def create_access_list(self, **kwargs) -> AccessList:
         """Creates an EIP-2930 type access list based on
         the function call data.
@@ -334,9 +696,216 @@ class ContractFunctionWrapper(ContractFunction):
         tx = self.w3._build_transaction(self.signer.address, kwargs)
         tx = self.build_transaction(tx)
         tx["value"] = kwargs.get("value", 0)
-        try:
-            estimate_gas = self.estimate_gas(tx) + GAS_BUFFER
-        except Exception:
-            estimate_gas = 3000000
-        tx["gas"] = kwargs.get("gas_limit", estimate_gas)
+        tx["gas"] = self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
         return self.w3.eth.create_access_list(tx, kwargs.get("block_identifier", "latest"))["accessList"]
+
+
+class AsyncContract(Contract):
+    """The asynchronous version of :class:`Contract`. Please use
+    :func:`cheb3.AsyncConnection.contract` interface to create a contract
+    instance associated with the async connection.
+
+    :meth:`deploy`, :meth:`get_balance` and :meth:`get_storage_at` are coroutines,
+    and so are the ``send_transaction``, ``create_access_list`` and ``call``
+    methods of the contract functions.
+
+        >>> await contract.deploy()
+        >>> await contract.functions.deposit().send_transaction(value=10)
+        >>> await contract.caller.balanceOf(account.address)
+    """
+
+    # set during class construction
+    w3: AsyncWeb3Helper = None
+
+    @instrument("Contract.deploy")
+    async def deploy(self, *constructor_args, **kwargs) -> None:
+        """Deploys the contract. Check :meth:`Contract.deploy` for more details."""
+        if not self.signer:
+            raise AttributeError("The `signer` is missing.")
+
+        if self.address:
+            logger.info(f"Contract {type(self).__name__} has already been deployed at {self.address}.")
+            return
+
+        # EIP-7702 transaction cannot be used to create contract
+        if "authorization_list" in kwargs:
+            del kwargs["authorization_list"]
+
+        async def build_deployment(nonce: int) -> dict:
+            tx = await self.w3._build_transaction(self.signer.address, {**kwargs, "nonce": nonce})
+            tx["value"] = kwargs.get("value", 0)
+
+            # to prevent the build_transaction from simulating the transaction
+            # and reverting during gas estimation.
+            tx["gas"] = 3000000
+
+            tx = await self.instance.constructor(*constructor_args).build_transaction(tx)
+            tx["gas"] = await self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+            return tx
+
+        logger.debug(f"Deploying {type(self).__name__} ...")
+        tx_hash = await self.account._sign_and_send(build_deployment, kwargs.get("nonce"))
+        with self.w3.stats.phase("mined"):
+            receipt = await self.w3.receipt_tracker.wait(tx_hash)
+        if not receipt.status:
+            raise Exception(f"Failed to deploy {type(self).__name__}.")
+        logger.info(
+            f"""The {
+                "logic " if kwargs.get('proxy', False) else ""
+            }{type(self).__name__} is deployed at {receipt.contractAddress}"""
+        )
+        self.address = receipt.contractAddress
+
+        if kwargs.get("proxy", False):
+            proxy_bytecode = f"3d602d80600a3d3981f3363d3d373d3d3d363d73{self.address[2:].lower()}5af43d82803e903d91602b57fd5bf3"
+
+            async def build_proxy_deployment(nonce: int) -> dict:
+                tx = {
+                    "from": self.signer.address,
+                    "to": None,
+                    "chainId": await self.w3._get_chain_id(),
+                    "nonce": nonce,
+                    "gasPrice": kwargs["gas_price"] if "gas_price" in kwargs else await self.w3._get_fee("gas_price"),
+                    "data": proxy_bytecode,
+                }
+                tx["gas"] = await self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+                return tx
+
+            logger.debug("Deploying the proxy ...")
+            tx_hash = await self.account._sign_and_send(build_proxy_deployment)
+            with self.w3.stats.phase("mined"):
+                receipt = await self.w3.receipt_tracker.wait(tx_hash)
+            if not receipt.status:
+                raise Exception("Failed to deploy the proxy.")
+            logger.info(f"The proxy is deployed at {receipt.contractAddress}")
+            self.address = receipt.contractAddress
+
+        self._init_functions()
+
+    @cached_property
+    def functions(self) -> "ContractFunctionsWrapper":
+        """The functions of the deployed contract."""
+        return self._build_functions(AsyncContractFunctionWrapper)
+
+    @cached_property
+    def caller(self) -> "AsyncContractCallerWrapper":
+        """The caller of the deployed contract."""
+        self._check_deployed("caller")
+        return AsyncContractCallerWrapper(self._artifacts.abi, self.w3, self.address)
+
+    async def get_balance(self) -> int:
+        """Returns the balance of the contract instance."""
+        return await self.w3.eth.get_balance(self.address)
+
+    async def get_storage_at(self, slot: int) -> HexBytes:
+        """Returns the value from a storage position for the contract instance.
+
+        :param slot: The storage slot.
+        :type slot: int
+
+        :rtype: ~hexbytes.main.HexBytes
+        """
+        return await self.w3.eth.get_storage_at(self.address, slot)
+
+    async def get_storage_slots(
+        self, slots: Sequence[int], block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Returns the values from many storage positions for the contract instance.
+        Check :meth:`Contract.get_storage_slots` for more details."""
+        return await self.w3._get_storage_slots(self.address, list(slots), block_identifier, state_override)
+
+    async def get_storage_range(
+        self, start: int, count: int, block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Returns the values from consecutive storage positions for the contract
+        instance. Check :meth:`Contract.get_storage_range` for more details."""
+        return await self.w3._get_storage_slots(
+            self.address, list(range(start, start + count)), block_identifier, state_override
+        )
+
+    async def dump_storage(
+        self, layout: Dict[str, Any], block_identifier: Any = "latest", state_override: bool = False
+    ) -> Dict[str, Any]:
+        """Reads and decodes all state variables of the contract instance.
+        Check :meth:`Contract.dump_storage` for more details."""
+        return await StorageLayout(layout).async_decode(
+            lambda slots: self.w3._get_storage_slots(self.address, slots, block_identifier, state_override)
+        )
+
+    async def read_mapping(
+        self,
+        slot: int,
+        keys: Sequence[Any],
+        value_type: str = "uint256",
+        key_type: Union[str, Sequence[str]] = "address",
+        block_identifier: Any = "latest",
+        state_override: bool = False,
+    ) -> List[Any]:
+        """Reads the values of a mapping of the contract instance for many keys.
+        Check :meth:`Contract.read_mapping` for more details."""
+        slots = calc_mapping_slots(slot, keys, key_type)
+        decoded = await StorageLayout.from_slots(slots, value_type).async_decode(
+            lambda slots: self.w3._get_storage_slots(self.address, slots, block_identifier, state_override)
+        )
+        return [decoded[str(i)] for i in range(len(slots))]
+
+
+class AsyncContractFunctionWrapper(AsyncContractFunction):
+    signer: eth_account.Account = None
+    account: AsyncAccount = None
+
+    def __call__(self, *args, **kwargs) -> "AsyncContractFunctionWrapper":
+        function = super().__call__(*args, **kwargs)
+        function.signer, function.account = self.signer, self.account
+        return function
+
+    @instrument("ContractFunction.send_transaction")
+    async def send_transaction(self, **kwargs) -> Union[TxReceipt, HexStr]:
+        """Signs and sends the transaction.
+        Check :meth:`ContractFunctionWrapper.send_transaction` for more details.
+        """
+
+        if not self.signer:
+            raise AttributeError("The `signer` is missing.")
+
+        async def build(nonce: int) -> dict:
+            tx = await self.w3._build_transaction(self.signer.address, {**kwargs, "nonce": nonce})
+
+            # to prevent the build_transaction from simulating the transaction
+            # and reverting during gas estimation.
+            tx["gas"] = 3000000
+
+            tx = await self.build_transaction(tx)
+            tx["value"] = kwargs.get("value", 0)
+            tx["gas"] = await self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+            return tx
+
+        tx_hash = await self.account._sign_and_send(build, kwargs.get("nonce"))
+        func_name = (
+            self.abi_element_identifier
+            if isinstance(self.abi_element_identifier, str)
+            else self.abi_element_identifier.__name__
+        )
+        logger.info(f"({self.address}).{func_name} transaction hash: {tx_hash}")
+        if not kwargs.get("wait_for_receipt", True):
+            return tx_hash
+        with self.w3.stats.phase("mined"):
+            receipt = await self.w3.receipt_tracker.wait(tx_hash)
+        if not receipt.status:
+            raise Exception(f"Transact to ({self.address}).{func_name} errored.")
+        return receipt
+
+    @instrument("ContractFunction.create_access_list")
+    async def create_access_list(self, **kwargs) -> AccessList:
+        """Creates an EIP-2930 type access list based on the function call data.
+        Check :meth:`ContractFunctionWrapper.create_access_list` for more details.
+        """
+
+        if not self.signer:
+            raise AttributeError("The `signer` is missing.")
+
+        tx = await self.w3._build_transaction(self.signer.address, kwargs)
+        tx = await self.build_transaction(tx)
+        tx["value"] = kwargs.get("value", 0)
+        tx["gas"] = await self.w3._estimate_gas(tx, kwargs.get("gas_limit"))
+        return (await self.w3.eth.create_access_list(tx, kwargs.get("block_identifier", "latest")))["accessList"]
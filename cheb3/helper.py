@@ -1,29 +1,521 @@
-from web3 import Web3
+import asyncio
+import statistics
+import threading
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from web3 import Web3, AsyncWeb3
+from web3.types import FeeHistory, TxReceipt
 from eth_typing import HexStr
+from hexbytes import HexBytes
+
+from cheb3.batch import Batch, BatchResult
+from cheb3.constants import GAS_BUFFER, NONCE_ERRORS
+from cheb3.receipt import ReceiptTracker, AsyncReceiptTracker
+from cheb3.stats import OperationRecord, Stats, StatsMiddleware
+from cheb3.storage import STORAGE_BATCH_MAX_SIZE, STORAGE_MAX_CONCURRENCY, STORAGE_READER_CODE, STORAGE_READER_MAX_SLOTS
+
+# requests whose results never change during a connection
+ALWAYS_CACHEABLE_REQUESTS = {"eth_chainId", "net_version", "web3_clientVersion"}
+
+
+class FeeCache:
+    """Caches the fee data (gas price, base fee and max priority fee) of the
+    latest block.
+
+    The cached values are reused for at most `ttl` seconds without checking
+    the chain head. After that, the head is checked and the values are dropped
+    if a new block has been observed. The cache is disabled if `ttl` is :const:`None`.
+    """
+
+    def __init__(self, ttl: float = None) -> None:
+        self.ttl = ttl
+        self.block_number: int = None
+        self.values: Dict[str, int] = dict()
+        self._checked_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl is not None
+
+    def expired(self) -> bool:
+        return time.monotonic() - self._checked_at > self.ttl
+
+    def observe_head(self, block_number: int) -> None:
+        """Drops the cached values if `block_number` is a new head."""
+        if block_number != self.block_number:
+            self.values.clear()
+            self.block_number = block_number
+        self._checked_at = time.monotonic()
+
+
+class FeeOracle:
+    """Suggests the fees of EIP-1559 transactions from ``eth_feeHistory``.
+
+    A strategy picks a percentile of the priority fees paid in the recent
+    blocks (the median over the blocks) and a multiplier of the base fee of
+    the next block. If no priority fees were paid, ``eth_maxPriorityFeePerGas``
+    is used instead. Assign a subclass instance to ``conn.w3.fee_oracle`` to
+    change or add strategies.
+    """
+
+    # the number of recent blocks read
+    BLOCKS = 10
+    # strategy: (priority fee percentile, base fee multiplier)
+    STRATEGIES = {
+        "cheap": (10, 1.125),
+        "normal": (50, 2),
+        "fast": (90, 2),
+    }
+
+    @property
+    def percentiles(self) -> List[int]:
+        return sorted({percentile for percentile, _ in self.STRATEGIES.values()})
+
+    def suggest(self, fee_history: FeeHistory, strategy: str) -> Tuple[Optional[int], int]:
+        """Returns the priority fee and the part of the max fee covering the
+        base fee. The priority fee is :const:`None` if no priority fees were
+        paid in the blocks.
+        """
+        if strategy not in self.STRATEGIES:
+            raise Exception(f"Unknown fee strategy: {strategy}.")
+        percentile, multiplier = self.STRATEGIES[strategy]
+        index = self.percentiles.index(percentile)
+        rewards = [reward[index] for reward in fee_history["reward"] if reward]
+        priority_fee = int(statistics.median(rewards)) if any(rewards) else None
+        return priority_fee, int(fee_history["baseFeePerGas"][-1] * multiplier)
+
+
+class GasEstimateCache:
+    """Caches the gas estimates of transactions, so that repeated calls to the
+    same function skip ``eth_estimateGas``.
+
+    Transactions are keyed by the target, the function selector, the length
+    of the calldata and whether value is sent. The gas used by mined
+    transactions is recorded per key, and the gas limit is derived from the
+    estimate and the observed gas used (mean plus three standard deviations),
+    whichever is larger, plus a `margin` ratio. A key is dropped after one of
+    its transactions runs out of gas. The cache is disabled if `enabled` is
+    :const:`False`.
+
+    :ivar hits: The number of gas limits served from the cache.
+    :ivar misses: The number of gas limits that required ``eth_estimateGas``.
+    """
+
+    # the number of recent gas used kept per key
+    MAX_SAMPLES = 32
+    # the number of sent transactions kept until their receipts are observed
+    MAX_TRACKED = 4096
+
+    def __init__(self, enabled: bool = False, margin: float = 0.1) -> None:
+        self.enabled = enabled
+        self.margin = margin
+        self.hits = 0
+        self.misses = 0
+        self._estimates: Dict[Tuple, int] = dict()
+        self._gas_used: Dict[Tuple, Deque[int]] = dict()
+        self._tracked: "OrderedDict[HexBytes, Tuple[Tuple, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(tx: dict) -> Tuple:
+        data = HexBytes(tx.get("data") or b"")
+        to = tx.get("to")
+        return (to.lower() if to else None, bytes(data[:4]), len(data), bool(tx.get("value")))
+
+    def get(self, tx: dict) -> Optional[int]:
+        """Returns the gas limit of the transaction, or :const:`None` if its key is not cached."""
+        key = self.key(tx)
+        with self._lock:
+            if key not in self._estimates:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._gas_limit(key)
+
+    def put(self, tx: dict, estimate: int) -> int:
+        """Caches the estimate of the transaction and returns its gas limit."""
+        key = self.key(tx)
+        with self._lock:
+            self._estimates[key] = estimate
+            return self._gas_limit(key)
+
+    def track(self, tx_hash: HexStr, tx: dict) -> None:
+        """Records the key of a sent transaction to learn from its receipt."""
+        with self._lock:
+            self._tracked[HexBytes(tx_hash)] = (self.key(tx), tx["gas"])
+            if len(self._tracked) > self.MAX_TRACKED:
+                self._tracked.popitem(last=False)
+
+    def observe(self, receipt: TxReceipt) -> None:
+        """Learns the gas used of a tracked transaction."""
+        with self._lock:
+            tracked = self._tracked.pop(HexBytes(receipt["transactionHash"]), None)
+            if tracked is None or tracked[0] not in self._estimates:
+                return
+            key, gas_limit = tracked
+            if receipt["status"]:
+                self._gas_used.setdefault(key, deque(maxlen=self.MAX_SAMPLES)).append(receipt["gasUsed"])
+            elif receipt["gasUsed"] >= gas_limit:
+                # out of gas, estimate again next time
+                self._estimates.pop(key)
+                self._gas_used.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._estimates.clear()
+            self._gas_used.clear()
+            self._tracked.clear()
+
+    def _gas_limit(self, key: Tuple) -> int:
+        gas = self._estimates[key]
+        gas_used = self._gas_used.get(key)
+        if gas_used:
+            deviation = statistics.pstdev(gas_used) if len(gas_used) > 1 else 0
+            gas = max(gas, statistics.mean(gas_used) + 3 * deviation)
+        return round(gas * (1 + self.margin))
+
+
+class NonceManager:
+    """Tracks the next nonce of an account locally, so that transactions can
+    be sent back-to-back without querying the transaction count each time.
+
+    The nonce is fetched from the node (including pending transactions) when
+    it is unknown, and again after the node rejects a transaction for using
+    an already used nonce.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self._async_lock: asyncio.Lock = None
+        # the next nonce to use, `None` if it should be fetched from the node
+        self.nonce: int = None
+
+    @property
+    def async_lock(self) -> asyncio.Lock:
+        # created lazily to bind to the running event loop
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        return self._async_lock
+
+    def use(self, nonce: int) -> None:
+        """Marks `nonce` as used by a broadcast transaction."""
+        if self.nonce is not None and nonce >= self.nonce:
+            self.nonce = nonce + 1
+
+    def reset(self) -> None:
+        self.nonce = None
+
+
+def is_nonce_error(e: Exception) -> bool:
+    """Returns :const:`True` if the node rejected a transaction because its nonce has been used."""
+    message = str(e).lower()
+    return any(err in message for err in NONCE_ERRORS)
+
+
+def _build_fee_fields(tx: dict, kwargs: dict) -> bool:
+    """Fills the fee fields given in `kwargs`. Returns :const:`True` if it is
+    an EIP-1559 transaction."""
+    for key, field in (
+        ("gas_price", "gasPrice"),
+        ("max_priority_fee_per_gas", "maxPriorityFeePerGas"),
+        ("max_fee_per_gas", "maxFeePerGas"),
+    ):
+        if kwargs.get(key) is not None:
+            tx[field] = kwargs[key]
+    # Legacy transaction does not support authorization list
+    is_dynamic_fee = any(
+        kwargs.get(key)
+        for key in ("max_fee_per_gas", "max_priority_fee_per_gas", "authorization_list", "fee_strategy")
+    )
+    if is_dynamic_fee:
+        tx.pop("gasPrice", None)
+    return is_dynamic_fee
 
 
 class Web3Helper(Web3):
+    def __init__(
+        self,
+        *args,
+        fee_cache_ttl: float = None,
+        gas_estimate_cache: bool = False,
+        stats_hook: Callable[[OperationRecord], Any] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = Stats(stats_hook)
+        self.middleware_onion.add(StatsMiddleware, "stats")
+        # the active `cheb3.batch.Batch` of the current context
+        self._batch = ContextVar("batch", default=None)
+        self._chain_id: int = None
+        self.fee_cache = FeeCache(fee_cache_ttl)
+        self.gas_estimate_cache = GasEstimateCache(gas_estimate_cache)
+        self.fee_oracle = FeeOracle()
+        self._fee_cache_lock = threading.Lock()
+        self._nonce_managers: Dict[str, NonceManager] = dict()
+        self._nonce_managers_lock = threading.Lock()
+        self.receipt_tracker = ReceiptTracker(self)
+        # the contract classes bound to this connection, keyed by their names
+        self._contract_factories: Dict[Any, type] = dict()
+        # whether there is code at the address, e.g. Multicall3
+        self._code_exists: Dict[str, bool] = dict()
+
+    def _read(self, request: Callable[..., Any], *args, **kwargs) -> Any:
+        """Makes the read request, or collects it if a batch is active."""
+        batch = self._batch.get()
+        if batch is None:
+            return request(*args, **kwargs)
+        return batch.add(request, *args, **kwargs)
+
+    def _get_storage_slots(
+        self, address: HexStr, slots: List[int], block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Reads the storage slots in JSON-RPC batch requests, or in ``eth_call``
+        requests with the storage reader placed at the address by a state override."""
+        if state_override:
+            values = []
+            for i in range(0, len(slots), STORAGE_READER_MAX_SLOTS):
+                data = b"".join(slot.to_bytes(32, "big") for slot in slots[i: i + STORAGE_READER_MAX_SLOTS])
+                return_data = self.eth.call(
+                    {"to": address, "data": "0x" + data.hex()}, block_identifier, {address: {"code": STORAGE_READER_CODE}}
+                )
+                values.extend(HexBytes(return_data[j: j + 32]) for j in range(0, len(return_data), 32))
+            return values
+        batch = Batch(self, max_size=STORAGE_BATCH_MAX_SIZE)
+        results = [batch.add(self.eth.get_storage_at, address, slot, block_identifier) for slot in slots]
+        batch.execute()
+        return [result.result() for result in results]
+
+    def _get_chain_id(self) -> int:
+        """Returns the chain ID, which is fetched once per connection."""
+        if self._chain_id is None:
+            self._chain_id = self.eth.chain_id
+        return self._chain_id
+
+    def _batch_chain_id(self, batch: Batch) -> Optional[BatchResult]:
+        """Adds the chain ID request to the batch, unless the chain ID is
+        known. The chain ID is stored by :meth:`_set_chain_id` once the batch
+        is executed."""
+        if self._chain_id is not None:
+            return None
+        # the property is read inside the batch, so it returns the batched request
+        return batch.add(lambda: self.eth.chain_id)
+
+    def _set_chain_id(self, result: Optional[BatchResult]) -> int:
+        """Stores the chain ID read by :meth:`_batch_chain_id`, and returns it."""
+        if result is not None:
+            self._chain_id = result.result()
+        return self._chain_id
+
+    def _get_nonce_manager(self, address: str) -> NonceManager:
+        """Returns the nonce manager shared by the accounts with the same address."""
+        with self._nonce_managers_lock:
+            if address not in self._nonce_managers:
+                self._nonce_managers[address] = NonceManager()
+            return self._nonce_managers[address]
+
+    def _get_fee(self, name: str) -> Any:
+        """Returns the `gas_price`, `base_fee`, `max_priority_fee` or `fee_history` of the latest block."""
+        if not self.fee_cache.enabled:
+            return self._fetch_fee(name)
+        with self._fee_cache_lock:
+            if self.fee_cache.values and self.fee_cache.expired():
+                self.fee_cache.observe_head(self.eth.block_number)
+            if name not in self.fee_cache.values:
+                self.fee_cache.values[name] = self._fetch_fee(name)
+            return self.fee_cache.values[name]
+
+    def _fetch_fee(self, name: str) -> Any:
+        if name == "gas_price":
+            return self.eth.gas_price
+        if name == "max_priority_fee":
+            return self.eth.max_priority_fee
+        if name == "fee_history":
+            fee_history = self.eth.fee_history(FeeOracle.BLOCKS, "latest", self.fee_oracle.percentiles)
+            if self.fee_cache.enabled:
+                self.fee_cache.observe_head(fee_history["oldestBlock"] + len(fee_history["gasUsedRatio"]) - 1)
+            return fee_history
+        block = self.eth.get_block("latest")
+        if self.fee_cache.enabled:
+            self.fee_cache.observe_head(block["number"])
+        return block["baseFeePerGas"]
+
+    def _estimate_gas(self, tx: dict, gas_limit: int = None) -> int:
+        """Returns `gas_limit` if given, otherwise the cached or estimated gas limit of the transaction."""
+        if gas_limit is not None:
+            return gas_limit
+        cache = self.gas_estimate_cache
+        if cache.enabled:
+            cached = cache.get(tx)
+            if cached is not None:
+                return cached
+        try:
+            with self.stats.phase("estimate"):
+                estimate = self.eth.estimate_gas(tx)
+        except Exception:
+            return 3000000
+        if cache.enabled:
+            return cache.put(tx, estimate)
+        return estimate + GAS_BUFFER
+
     def _build_transaction(self, signer: HexStr, kwargs: dict) -> dict:
         tx = {
             "from": signer,
-            "chainId": self.eth.chain_id,
-            "nonce": kwargs.get("nonce", self.eth.get_transaction_count(signer)),
-            "gasPrice": kwargs.get("gas_price", self.eth.gas_price),
+            "chainId": self._get_chain_id(),
+            "nonce": kwargs["nonce"] if kwargs.get("nonce") is not None else self.eth.get_transaction_count(signer),
+        }
+        if _build_fee_fields(tx, kwargs):
+            if kwargs.get("fee_strategy") and ("maxPriorityFeePerGas" not in tx or "maxFeePerGas" not in tx):
+                fee_history = self._get_fee("fee_history")
+                if not fee_history["baseFeePerGas"]:
+                    fee_history = {**fee_history, "baseFeePerGas": [self._get_fee("base_fee")]}
+                priority_fee, base_fee = self.fee_oracle.suggest(fee_history, kwargs["fee_strategy"])
+                if priority_fee is None:
+                    priority_fee = self._get_fee("max_priority_fee")
+                tx.setdefault("maxPriorityFeePerGas", priority_fee)
+                tx.setdefault("maxFeePerGas", tx["maxPriorityFeePerGas"] + base_fee)
+            if "maxPriorityFeePerGas" not in tx:
+                tx["maxPriorityFeePerGas"] = self._get_fee("max_priority_fee")
+            if "maxFeePerGas" not in tx:
+                tx["maxFeePerGas"] = tx["maxPriorityFeePerGas"] + self._get_fee("base_fee") * 2
+        elif "gasPrice" not in tx:
+            tx["gasPrice"] = self._get_fee("gas_price")
+        if kwargs.get("access_list"):
+            tx["accessList"] = kwargs["access_list"]
+        if kwargs.get("authorization_list"):
+            tx["authorizationList"] = kwargs["authorization_list"]
+        return tx
+
+
+class AsyncWeb3Helper(AsyncWeb3):
+    def __init__(
+        self,
+        *args,
+        fee_cache_ttl: float = None,
+        gas_estimate_cache: bool = False,
+        stats_hook: Callable[[OperationRecord], Any] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = Stats(stats_hook)
+        self.middleware_onion.add(StatsMiddleware, "stats")
+        self._chain_id: int = None
+        self.fee_cache = FeeCache(fee_cache_ttl)
+        self.gas_estimate_cache = GasEstimateCache(gas_estimate_cache)
+        self.fee_oracle = FeeOracle()
+        self._nonce_managers: Dict[str, NonceManager] = dict()
+        self.receipt_tracker = AsyncReceiptTracker(self)
+        # the contract classes bound to this connection, keyed by their names
+        self._contract_factories: Dict[Any, type] = dict()
+
+    async def _get_storage_slots(
+        self, address: HexStr, slots: List[int], block_identifier: Any = "latest", state_override: bool = False
+    ) -> List[HexBytes]:
+        """Reads the storage slots concurrently, or in ``eth_call`` requests with
+        the storage reader placed at the address by a state override."""
+        if state_override:
+            values = []
+            for i in range(0, len(slots), STORAGE_READER_MAX_SLOTS):
+                data = b"".join(slot.to_bytes(32, "big") for slot in slots[i: i + STORAGE_READER_MAX_SLOTS])
+                return_data = await self.eth.call(
+                    {"to": address, "data": "0x" + data.hex()}, block_identifier, {address: {"code": STORAGE_READER_CODE}}
+                )
+                values.extend(HexBytes(return_data[j: j + 32]) for j in range(0, len(return_data), 32))
+            return values
+        semaphore = asyncio.Semaphore(STORAGE_MAX_CONCURRENCY)
+
+        async def get_storage_at(slot: int) -> HexBytes:
+            async with semaphore:
+                return await self.eth.get_storage_at(address, slot, block_identifier)
+
+        return list(await asyncio.gather(*[get_storage_at(slot) for slot in slots]))
+
+    async def _get_chain_id(self) -> int:
+        """Returns the chain ID, which is fetched once per connection."""
+        if self._chain_id is None:
+            self._chain_id = await self.eth.chain_id
+        return self._chain_id
+
+    def _get_nonce_manager(self, address: str) -> NonceManager:
+        """Returns the nonce manager shared by the accounts with the same address."""
+        if address not in self._nonce_managers:
+            self._nonce_managers[address] = NonceManager()
+        return self._nonce_managers[address]
+
+    async def _get_fee(self, name: str) -> Any:
+        """Returns the `gas_price`, `base_fee`, `max_priority_fee` or `fee_history` of the latest block."""
+        if not self.fee_cache.enabled:
+            return await self._fetch_fee(name)
+        if self.fee_cache.values and self.fee_cache.expired():
+            self.fee_cache.observe_head(await self.eth.block_number)
+        if name not in self.fee_cache.values:
+            self.fee_cache.values[name] = await self._fetch_fee(name)
+        return self.fee_cache.values[name]
+
+    async def _fetch_fee(self, name: str) -> Any:
+        if name == "gas_price":
+            return await self.eth.gas_price
+        if name == "max_priority_fee":
+            return await self.eth.max_priority_fee
+        if name == "fee_history":
+            fee_history = await self.eth.fee_history(FeeOracle.BLOCKS, "latest", self.fee_oracle.percentiles)
+            if self.fee_cache.enabled:
+                self.fee_cache.observe_head(fee_history["oldestBlock"] + len(fee_history["gasUsedRatio"]) - 1)
+            return fee_history
+        block = await self.eth.get_block("latest")
+        if self.fee_cache.enabled:
+            self.fee_cache.observe_head(block["number"])
+        return block["baseFeePerGas"]
+
+    async def _estimate_gas(self, tx: dict, gas_limit: int = None) -> int:
+        """Returns `gas_limit` if given, otherwise the cached or estimated gas limit of the transaction."""
+        if gas_limit is not None:
+            return gas_limit
+        cache = self.gas_estimate_cache
+        if cache.enabled:
+            cached = cache.get(tx)
+            if cached is not None:
+                return cached
+        try:
+            with self.stats.phase("estimate"):
+                estimate = await self.eth.estimate_gas(tx)
+        except Exception:
+            return 3000000
+        if cache.enabled:
+            return cache.put(tx, estimate)
+        return estimate + GAS_BUFFER
+
+    async def _build_transaction(self, signer: HexStr, kwargs: dict) -> dict:
+        if kwargs.get("nonce") is not None:
+            nonce = kwargs["nonce"]
+        else:
+            # transactions may be broadcast before the previous ones are mined
+            nonce = await self.eth.get_transaction_count(signer, "pending")
+        tx = {
+            "from": signer,
+            "chainId": await self._get_chain_id(),
+            "nonce": nonce,
         }
-        latest_base_fee_per_gas = self.eth.get_block("latest")["baseFeePerGas"]
-        if kwargs.get("max_fee_per_gas") or kwargs.get("max_priority_fee_per_gas"):
-            del tx["gasPrice"]
-            tx["maxPriorityFeePerGas"] = kwargs.get("max_priority_fee_per_gas", self.eth.max_priority_fee)
-            tx["maxFeePerGas"] = kwargs.get(
-                "max_fee_per_gas", tx["maxPriorityFeePerGas"] + latest_base_fee_per_gas * 2
-            )
+        if _build_fee_fields(tx, kwargs):
+            if kwargs.get("fee_strategy") and ("maxPriorityFeePerGas" not in tx or "maxFeePerGas" not in tx):
+                fee_history = await self._get_fee("fee_history")
+                if not fee_history["baseFeePerGas"]:
+                    fee_history = {**fee_history, "baseFeePerGas": [await self._get_fee("base_fee")]}
+                priority_fee, base_fee = self.fee_oracle.suggest(fee_history, kwargs["fee_strategy"])
+                if priority_fee is None:
+                    priority_fee = await self._get_fee("max_priority_fee")
+                tx.setdefault("maxPriorityFeePerGas", priority_fee)
+                tx.setdefault("maxFeePerGas", tx["maxPriorityFeePerGas"] + base_fee)
+            if "maxPriorityFeePerGas" not in tx:
+                tx["maxPriorityFeePerGas"] = await self._get_fee("max_priority_fee")
+            if "maxFeePerGas" not in tx:
+                tx["maxFeePerGas"] = tx["maxPriorityFeePerGas"] + await self._get_fee("base_fee") * 2
+        elif "gasPrice" not in tx:
+            tx["gasPrice"] = await self._get_fee("gas_price")
         if kwargs.get("access_list"):
             tx["accessList"] = kwargs["access_list"]
         if kwargs.get("authorization_list"):
             tx["authorizationList"] = kwargs["authorization_list"]
-            # Legacy transaction does not support authorization list
-            if "gasPrice" in tx:
-                del tx["gasPrice"]
-                tx["maxPriorityFeePerGas"] = self.eth.max_priority_fee
-                tx["maxFeePerGas"] = tx["maxPriorityFeePerGas"] + latest_base_fee_per_gas * 2
         return tx
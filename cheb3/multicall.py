@@ -0,0 +1,257 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from eth_abi import decode
+from eth_abi.exceptions import DecodingError
+from eth_utils.abi import get_abi_output_types
+from hexbytes import HexBytes
+from web3.contract.base_contract import BaseContractFunction
+from web3.contract.contract import ContractCaller, ContractFunction
+from web3.contract.utils import format_contract_call_return_data_curried
+from web3.exceptions import ContractLogicError
+
+from cheb3.batch import BatchResult
+
+if TYPE_CHECKING:
+    from cheb3.helper import Web3Helper
+
+# the address of Multicall3 on most chains, https://github.com/mds1/multicall
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+# aggregate3((address,bool,bytes)[])
+AGGREGATE3_SELECTOR = "0x82ad56cb"
+
+# The creation code of the deployless multicall. Executed by `eth_call` without
+# a target, its constructor makes the calls appended to the code and returns
+# their results, without anything being deployed. Each appended call is the
+# target (32 bytes), the length of the calldata (32 bytes) and the calldata,
+# and each result is the success flag (32 bytes), the length of the return
+# data (32 bytes) and the return data.
+#
+#     PUSH2 end DUP1 CODESIZE SUB DUP1 SWAP2 PUSH1 0 CODECOPY  ; copy the calls to memory [0, end)
+#     PUSH1 0 DUP2                                             ; stack: end in out
+#   loop:
+#     DUP3 DUP3 LT ISZERO PUSH2 done JUMPI
+#     PUSH1 0 PUSH1 0 DUP4 PUSH1 32 ADD MLOAD DUP5 PUSH1 64 ADD PUSH1 0 DUP7 MLOAD GAS CALL
+#     DUP2 MSTORE                                              ; success
+#     RETURNDATASIZE DUP1 DUP3 PUSH1 32 ADD MSTORE             ; length
+#     DUP1 PUSH1 0 DUP4 PUSH1 64 ADD RETURNDATACOPY            ; return data
+#     PUSH1 64 ADD ADD                                         ; out += 64 + length
+#     SWAP1 DUP1 PUSH1 32 ADD MLOAD PUSH1 64 ADD ADD SWAP1     ; in += 64 + calldata length
+#     PUSH2 loop JUMP
+#   done:
+#     DUP3 SWAP1 SUB DUP3 RETURN                               ; return memory [end, out)
+#   end:
+DEPLOYLESS_MULTICALL_CODE = (
+    "61005480380380916000396000815b8282101561004e5760006000836020015184604001600086515af181523d8082602001528060"
+    "00836040013e60400101908060200151604001019061000e565b82900382f3"
+)
+
+
+def _contract_logic_error(return_data: bytes) -> ContractLogicError:
+    # Error(string)
+    if return_data[:4] == bytes.fromhex("08c379a0"):
+        try:
+            reason = decode(["string"], return_data[4:])[0]
+            return ContractLogicError(f"execution reverted: {reason}", data="0x" + return_data.hex())
+        except DecodingError:
+            pass
+    return ContractLogicError("execution reverted", data="0x" + return_data.hex())
+
+
+class Multicall:
+    """Collects contract reads and executes them as one ``eth_call`` to the
+    ``aggregate3`` function of `Multicall3 <https://github.com/mds1/multicall>`_.
+    Please use :func:`cheb3.Connection.multicall` interface to create a
+    multicall associated with the connection.
+
+    Inside the ``with`` block, contract reads via ``contract.caller`` or
+    ``contract.functions.fn().call()``, of any contract on the connection,
+    return a :class:`BatchResult <cheb3.batch.BatchResult>` instead of the
+    value. The reads are executed when the block exits, and each result is
+    decoded with the ABI of its function.
+
+    Examples:
+
+        >>> with conn.multicall():
+        ...     reserves = [pair.caller.getReserves() for pair in pairs]
+        ...     supply = token.functions.totalSupply().call()
+        >>> reserves[0].result()
+        [1000000000000000000, 2000000000, 1700000000]
+
+    If Multicall3 is not deployed on the chain, the reads are executed by the
+    creation code of a deployless multicall in an ``eth_call`` without a target,
+    which needs no deployment.
+
+    The reads are made by the multicall contract, so they cannot have their
+    own `transaction` (e.g. `from`), `block_identifier` or `state_override`.
+
+    :param allow_failure: If :const:`False`, a failed read fails all reads
+        of the multicall, defaults to :const:`True`. Otherwise the error is
+        kept in the result of the failed read.
+    :type allow_failure: bool
+    :param block_identifier: The block to read at, defaults to `latest`.
+    :param max_size: The maximum number of reads in a single ``eth_call``,
+        defaults to 500. Larger multicalls are split.
+    :type max_size: int
+    :param deployless: Whether to use the deployless multicall, defaults to
+        :const:`None`, which uses it only if Multicall3 is not deployed.
+    :type deployless: bool
+    """
+
+    def __init__(
+        self,
+        w3: "Web3Helper",
+        allow_failure: bool = True,
+        block_identifier: Any = "latest",
+        max_size: int = 500,
+        deployless: Optional[bool] = None,
+    ) -> None:
+        self.w3 = w3
+        self.allow_failure = allow_failure
+        self.block_identifier = block_identifier
+        self.max_size = max_size
+        self.deployless = deployless
+        self._calls: List[Tuple[ContractFunction, bool, BatchResult]] = []
+        self._token = None
+
+    def __enter__(self) -> "Multicall":
+        if self.w3._batch.get() is not None:
+            raise Exception("Nested batches are not supported.")
+        self._token = self.w3._batch.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.w3._batch.reset(self._token)
+        self._token = None
+        if exc_type is None:
+            self.execute()
+        else:
+            self._calls = []
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def add(self, request: Callable[..., Any], *args, **kwargs) -> BatchResult:
+        """Collects a contract read, made by the ``call`` method of a contract
+        function or by a contract caller. Reads are collected automatically
+        inside the ``with`` block."""
+        if request is ContractCaller.call_function:
+            function, *args = args
+            options = {name: kwargs.pop(name, None) for name in ("transaction", "block_identifier", "ccip_read_enabled")}
+            function = function(*args, **kwargs)
+        elif getattr(request, "__func__", None) is ContractFunction.call:
+            function = request.__self__
+            options = dict(zip(("transaction", "block_identifier", "state_override", "ccip_read_enabled"), args))
+            options.update(kwargs)
+        else:
+            raise Exception("Only contract reads can be collected by a multicall.")
+        if options.get("transaction") or options.get("block_identifier") is not None or options.get("state_override"):
+            raise Exception(
+                "The reads of a multicall cannot have their own `transaction`, `block_identifier` or `state_override`."
+            )
+        return self.add_call(function)
+
+    def add_call(self, function: BaseContractFunction, allow_failure: bool = None) -> BatchResult:
+        """Collects a contract read.
+
+        Examples:
+
+            >>> with conn.multicall() as multicall:
+            ...     owner = multicall.add_call(vault.functions.owner(), allow_failure=False)
+
+        :param function: The contract function with arguments.
+        :type function: ContractFunctionWrapper
+        :param allow_failure: Overrides the `allow_failure` of the multicall for this read.
+        :type allow_failure: bool
+
+        :rtype: :class:`BatchResult <cheb3.batch.BatchResult>`
+        """
+        if not function.address:
+            raise Exception("The contract address is missing.")
+        result = BatchResult()
+        self._calls.append((function, self.allow_failure if allow_failure is None else allow_failure, result))
+        return result
+
+    def execute(self) -> List[BatchResult]:
+        """Executes the collected reads and resolves their results. It is
+        called automatically when the ``with`` block exits.
+
+        :returns: The results in the order the reads were collected.
+        :rtype: List[BatchResult]
+        """
+        calls, self._calls = self._calls, []
+        if not calls:
+            return []
+        deployless = self.deployless
+        if deployless is None:
+            deployless = not self._multicall3_deployed()
+        for i in range(0, len(calls), self.max_size):
+            chunk = calls[i: i + self.max_size]
+            try:
+                if deployless:
+                    results = self._call_deployless(chunk)
+                else:
+                    results = self._call_multicall3(chunk)
+            except Exception as e:
+                for _, _, result in chunk:
+                    result._resolve(exception=e)
+                continue
+            for (function, _, result), (success, return_data) in zip(chunk, results):
+                if not success:
+                    result._resolve(exception=_contract_logic_error(return_data))
+                    continue
+                try:
+                    result._resolve(self._decode(function, return_data))
+                except Exception as e:
+                    result._resolve(exception=e)
+        return [result for _, _, result in calls]
+
+    def _multicall3_deployed(self) -> bool:
+        # checked once per connection
+        if MULTICALL3_ADDRESS not in self.w3._code_exists:
+            self.w3._code_exists[MULTICALL3_ADDRESS] = len(self.w3.eth.get_code(MULTICALL3_ADDRESS)) > 0
+        return self.w3._code_exists[MULTICALL3_ADDRESS]
+
+    def _call_multicall3(self, calls: List[Tuple[ContractFunction, bool, BatchResult]]) -> List[Tuple[bool, bytes]]:
+        data = self.w3.codec.encode(
+            ["(address,bool,bytes)[]"],
+            [
+                [
+                    (function.address, allow_failure, HexBytes(function._encode_transaction_data()))
+                    for function, allow_failure, _ in calls
+                ]
+            ],
+        )
+        return_data = self.w3.eth.call(
+            {"to": MULTICALL3_ADDRESS, "data": AGGREGATE3_SELECTOR + data.hex()}, self.block_identifier
+        )
+        return self.w3.codec.decode(["(bool,bytes)[]"], return_data)[0]
+
+    def _call_deployless(self, calls: List[Tuple[ContractFunction, bool, BatchResult]]) -> List[Tuple[bool, bytes]]:
+        data = bytearray.fromhex(DEPLOYLESS_MULTICALL_CODE)
+        for function, _, _ in calls:
+            calldata = HexBytes(function._encode_transaction_data())
+            data += int(function.address, 16).to_bytes(32, "big") + len(calldata).to_bytes(32, "big") + calldata
+        return_data = self.w3.eth.call({"data": "0x" + data.hex()}, self.block_identifier)
+
+        results, offset = [], 0
+        for function, allow_failure, _ in calls:
+            success = bool(int.from_bytes(return_data[offset: offset + 32], "big"))
+            length = int.from_bytes(return_data[offset + 32: offset + 64], "big")
+            results.append((success, bytes(return_data[offset + 64: offset + 64 + length])))
+            offset += 64 + length
+            if not success and not allow_failure:
+                # the same as Multicall3 does
+                raise ContractLogicError("execution reverted: Multicall3: call failed")
+        return results
+
+    def _decode(self, function: ContractFunction, return_data: bytes) -> Any:
+        output_types = get_abi_output_types(function.abi) if function.abi["type"] == "function" else []
+        return format_contract_call_return_data_curried(
+            self.w3,
+            function.decode_tuples,
+            function.abi,
+            function.abi_element_identifier,
+            function._return_data_normalizers,
+            output_types,
+            return_data,
+        )
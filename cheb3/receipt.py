@@ -0,0 +1,297 @@
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Union
+
+from eth_typing import HexStr
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted, TransactionIndexingInProgress, TransactionNotFound, Web3RPCError
+from web3.types import TxReceipt
+
+from cheb3.batch import Batch
+
+if TYPE_CHECKING:
+    from cheb3.helper import Web3Helper, AsyncWeb3Helper
+
+_NOT_FOUND_ERRORS = (TransactionNotFound, TransactionIndexingInProgress)
+
+
+class _ReceiptTrackerState:
+    """The bookkeeping shared by :class:`ReceiptTracker` and :class:`AsyncReceiptTracker`."""
+
+    def __init__(self, poll_latency: float) -> None:
+        self.poll_latency = poll_latency
+        # `eth_getBlockReceipts` is assumed available until the node rejects it
+        self.block_receipts_supported = True
+        # the latest block whose receipts have been looked up
+        self._block_number: int = None
+        # hashes that have not been looked up yet
+        self._new: Set[HexBytes] = set()
+        # hashes looked up but not mined yet
+        self._pending: Set[HexBytes] = set()
+        self._receipts: Dict[HexBytes, TxReceipt] = dict()
+        self._waiters: Dict[HexBytes, int] = dict()
+        self._polled_at = 0.0
+
+    def _register(self, tx_hash: HexBytes) -> None:
+        self._waiters[tx_hash] = self._waiters.get(tx_hash, 0) + 1
+        if tx_hash not in self._receipts and tx_hash not in self._pending:
+            self._new.add(tx_hash)
+
+    def _unregister(self, tx_hash: HexBytes) -> None:
+        self._waiters[tx_hash] -= 1
+        if self._waiters[tx_hash] == 0:
+            del self._waiters[tx_hash]
+            self._receipts.pop(tx_hash, None)
+            self._pending.discard(tx_hash)
+            self._new.discard(tx_hash)
+
+    def _should_poll(self) -> bool:
+        return bool(self._new) or time.monotonic() - self._polled_at >= self.poll_latency
+
+    def _use_block_receipts(self, head: int, pending: Set[HexBytes]) -> bool:
+        # fetching each new block is only worth it if there are fewer blocks than pending hashes
+        return self.block_receipts_supported and head - self._block_number <= len(pending)
+
+    def _collect(self, new: Set[HexBytes], found: Dict[HexBytes, TxReceipt], head: int) -> None:
+        for tx_hash, receipt in found.items():
+            if tx_hash in self._waiters:
+                self._receipts[tx_hash] = receipt
+                self._pending.discard(tx_hash)
+        self._pending.update(h for h in new if h not in found and h in self._waiters)
+        self._block_number = head
+        self._polled_at = time.monotonic()
+
+    @staticmethod
+    def _timeout_error(tx_hash: HexBytes, timeout: float) -> TimeExhausted:
+        return TimeExhausted(f"Transaction {tx_hash!r} is not in the chain after {timeout} seconds")
+
+
+class ReceiptTracker(_ReceiptTrackerState):
+    """Waits for transaction receipts with a single polling loop shared by
+    all waiting threads. Please use :func:`cheb3.Connection.wait_for_transaction_receipt`
+    interface to wait for a receipt.
+
+    Each new transaction hash is looked up once. After that, only new heads
+    are polled, and the receipts of all pending transactions are fetched
+    once per new block with ``eth_getBlockReceipts``. If the node does not
+    support it, ``eth_getTransactionReceipt`` requests of the pending
+    transactions are sent in a JSON-RPC batch instead.
+
+    :param poll_latency: Seconds between two polls, defaults to 0.1.
+    :type poll_latency: float
+    """
+
+    def __init__(self, w3: "Web3Helper", poll_latency: float = 0.1) -> None:
+        super().__init__(poll_latency)
+        self.w3 = w3
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._poll_lock = threading.Lock()
+
+    def wait(self, tx_hash: Union[HexStr, bytes], timeout: float = 120) -> TxReceipt:
+        """Waits for the receipt of a transaction.
+
+        :param tx_hash: The transaction hash.
+        :type tx_hash: HexStr
+        :param timeout: Seconds to wait, defaults to 120.
+        :type timeout: float
+
+        :raises web3.exceptions.TimeExhausted: If the transaction is not mined in time.
+        :rtype: TxReceipt
+        """
+        receipt = self.wait_many([tx_hash], timeout)[0]
+        if receipt is None:
+            raise self._timeout_error(HexBytes(tx_hash), timeout)
+        return receipt
+
+    def wait_many(self, tx_hashes: Sequence[Union[HexStr, bytes]], timeout: float = 120) -> List[Optional[TxReceipt]]:
+        """Waits for the receipts of the transactions.
+
+        :param tx_hashes: The transaction hashes.
+        :type tx_hashes: Sequence[HexStr]
+        :param timeout: Seconds to wait, defaults to 120.
+        :type timeout: float
+
+        :returns: The receipts in the order of the hashes, :const:`None` for
+            the transactions not mined in time.
+        :rtype: List[Optional[TxReceipt]]
+        """
+        tx_hashes = [HexBytes(tx_hash) for tx_hash in tx_hashes]
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            for tx_hash in tx_hashes:
+                self._register(tx_hash)
+        try:
+            while True:
+                self._maybe_poll()
+                with self._condition:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or all(tx_hash in self._receipts for tx_hash in tx_hashes):
+                        return [self._receipts.get(tx_hash) for tx_hash in tx_hashes]
+                    self._condition.wait(min(self.poll_latency, remaining))
+        finally:
+            with self._lock:
+                for tx_hash in tx_hashes:
+                    self._unregister(tx_hash)
+
+    def _maybe_poll(self) -> None:
+        # only one thread polls at a time, the others wait for its results
+        if not self._poll_lock.acquire(blocking=False):
+            return
+        try:
+            with self._lock:
+                if not self._should_poll():
+                    return
+                new, self._new = self._new, set()
+                pending = set(self._pending)
+            try:
+                head, found = self._poll(new, pending)
+            except Exception:
+                with self._lock:
+                    self._new.update(new)
+                raise
+            with self._condition:
+                self._collect(new, found, head)
+                self._condition.notify_all()
+            if self.w3.gas_estimate_cache.enabled:
+                for receipt in found.values():
+                    self.w3.gas_estimate_cache.observe(receipt)
+        finally:
+            self._poll_lock.release()
+
+    def _poll(self, new: Set[HexBytes], pending: Set[HexBytes]):
+        head = self.w3.eth.block_number
+        found = self._fetch_receipts(new)
+        if pending and head > self._block_number:
+            if self._use_block_receipts(head, pending):
+                try:
+                    found.update(self._fetch_block_receipts(range(self._block_number + 1, head + 1), pending))
+                    return head, found
+                except Web3RPCError:
+                    # e.g. the method is unavailable or its params are rejected, so it is not used again
+                    self.block_receipts_supported = False
+            found.update(self._fetch_receipts(pending))
+        return head, found
+
+    def _fetch_receipts(self, tx_hashes: Iterable[HexBytes]) -> Dict[HexBytes, TxReceipt]:
+        batch = Batch(self.w3)
+        results = {tx_hash: batch.add(self.w3.eth.get_transaction_receipt, tx_hash) for tx_hash in tx_hashes}
+        batch.execute()
+        found = dict()
+        for tx_hash, result in results.items():
+            if isinstance(result.exception(), _NOT_FOUND_ERRORS):
+                continue
+            found[tx_hash] = result.result()
+        return found
+
+    def _fetch_block_receipts(self, block_numbers: Iterable[int], pending: Set[HexBytes]) -> Dict[HexBytes, TxReceipt]:
+        batch = Batch(self.w3)
+        results = [batch.add(self.w3.eth.get_block_receipts, n) for n in block_numbers]
+        batch.execute()
+        found = dict()
+        for result in results:
+            for receipt in result.result():
+                if receipt["transactionHash"] in pending:
+                    found[HexBytes(receipt["transactionHash"])] = receipt
+        return found
+
+
+class AsyncReceiptTracker(_ReceiptTrackerState):
+    """The asynchronous version of :class:`ReceiptTracker`, shared by all
+    coroutines waiting for receipts. The lookups of a poll are sent concurrently.
+    """
+
+    def __init__(self, w3: "AsyncWeb3Helper", poll_latency: float = 0.1) -> None:
+        super().__init__(poll_latency)
+        self.w3 = w3
+        self._polling = False
+
+    async def wait(self, tx_hash: Union[HexStr, bytes], timeout: float = 120) -> TxReceipt:
+        """Waits for the receipt of a transaction.
+        Check :meth:`ReceiptTracker.wait` for more details.
+        """
+        receipt = (await self.wait_many([tx_hash], timeout))[0]
+        if receipt is None:
+            raise self._timeout_error(HexBytes(tx_hash), timeout)
+        return receipt
+
+    async def wait_many(
+        self, tx_hashes: Sequence[Union[HexStr, bytes]], timeout: float = 120
+    ) -> List[Optional[TxReceipt]]:
+        """Waits for the receipts of the transactions.
+        Check :meth:`ReceiptTracker.wait_many` for more details.
+        """
+        tx_hashes = [HexBytes(tx_hash) for tx_hash in tx_hashes]
+        deadline = time.monotonic() + timeout
+        for tx_hash in tx_hashes:
+            self._register(tx_hash)
+        try:
+            while True:
+                await self._maybe_poll()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or all(tx_hash in self._receipts for tx_hash in tx_hashes):
+                    return [self._receipts.get(tx_hash) for tx_hash in tx_hashes]
+                await asyncio.sleep(min(self.poll_latency, remaining))
+        finally:
+            for tx_hash in tx_hashes:
+                self._unregister(tx_hash)
+
+    async def _maybe_poll(self) -> None:
+        # only one coroutine polls at a time, the others wait for its results
+        if self._polling or not self._should_poll():
+            return
+        self._polling = True
+        new, self._new = self._new, set()
+        try:
+            head, found = await self._poll(new, set(self._pending))
+        except Exception:
+            self._new.update(new)
+            raise
+        finally:
+            self._polling = False
+        self._collect(new, found, head)
+        if self.w3.gas_estimate_cache.enabled:
+            for receipt in found.values():
+                self.w3.gas_estimate_cache.observe(receipt)
+
+    async def _poll(self, new: Set[HexBytes], pending: Set[HexBytes]):
+        head = await self.w3.eth.block_number
+        found = await self._fetch_receipts(new)
+        if pending and head > self._block_number:
+            if self._use_block_receipts(head, pending):
+                try:
+                    found.update(await self._fetch_block_receipts(range(self._block_number + 1, head + 1), pending))
+                    return head, found
+                except Web3RPCError:
+                    # e.g. the method is unavailable or its params are rejected, so it is not used again
+                    self.block_receipts_supported = False
+            found.update(await self._fetch_receipts(pending))
+        return head, found
+
+    async def _fetch_receipts(self, tx_hashes: Iterable[HexBytes]) -> Dict[HexBytes, TxReceipt]:
+        tx_hashes = list(tx_hashes)
+        results = await asyncio.gather(
+            *[self.w3.eth.get_transaction_receipt(tx_hash) for tx_hash in tx_hashes], return_exceptions=True
+        )
+        found = dict()
+        for tx_hash, result in zip(tx_hashes, results):
+            if isinstance(result, _NOT_FOUND_ERRORS):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            found[tx_hash] = result
+        return found
+
+    async def _fetch_block_receipts(
+        self, block_numbers: Iterable[int], pending: Set[HexBytes]
+    ) -> Dict[HexBytes, TxReceipt]:
+        results: List[List[TxReceipt]] = await asyncio.gather(
+            *[self.w3.eth.get_block_receipts(n) for n in block_numbers]
+        )
+        found = dict()
+        for receipts in results:
+            for receipt in receipts:
+                if receipt["transactionHash"] in pending:
+                    found[HexBytes(receipt["transactionHash"])] = receipt
+        return found
@@ -0,0 +1,268 @@
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Sequence
+
+from web3.exceptions import TimeExhausted
+
+from cheb3.account import Account, SendTransactionsReport, TransactionResult, _parse_transaction_item
+
+from loguru import logger
+
+
+class SchedulerReport(SendTransactionsReport):
+    """The report of :meth:`TransactionScheduler.run` and :meth:`TransactionScheduler.join`.
+
+    :ivar txs_per_account: The number of succeeded transactions sent by each account.
+    :ivar retries: The number of retried attempts.
+    """
+
+    def __init__(self, results: List[TransactionResult], elapsed: float, retries: int) -> None:
+        super().__init__(results, elapsed)
+        self.txs_per_account: Dict[str, int] = dict(Counter(r.sender for r in results if r.success))
+        self.retries = retries
+
+    def __repr__(self) -> str:
+        return (
+            f"<SchedulerReport {self.succeeded}/{len(self.results)} succeeded "
+            f"by {len(self.txs_per_account)} accounts, {self.tx_per_second:.2f} tx/s>"
+        )
+
+
+class _WorkItem:
+    def __init__(self, item: Any, future: Future) -> None:
+        self.item = item
+        self.future = future
+        self.attempts = 0
+
+
+class TransactionScheduler:
+    """Dispatches transactions across a pool of accounts in parallel. Each
+    account sends with its own nonce stream, so the throughput is not
+    limited by the nonce ordering of a single sender.
+
+    Each account has a worker thread taking work items from a shared queue.
+    A worker broadcasts without waiting for the receipt, until the account
+    has `max_pending` transactions in flight. :meth:`submit` blocks when
+    `queue_size` items are waiting to be sent.
+
+    Examples:
+
+        >>> accounts = [conn.account(pkey) for pkey in pkeys]
+        >>> report = TransactionScheduler(accounts, max_pending=8).run(
+                [token.functions.transfer(receiver, 1) for receiver in receivers]
+            )
+        >>> report
+        <SchedulerReport 1000/1000 succeeded by 10 accounts, 152.37 tx/s>
+
+    It can also be used as a context manager, which waits for all submitted
+    items when the block exits:
+
+        >>> with TransactionScheduler(accounts) as scheduler:
+        ...     futures = [scheduler.submit({"to": receiver, "value": 10**18}) for receiver in receivers]
+        >>> futures[0].result().success
+        True
+
+    :param accounts: The accounts sending the transactions. Contract functions
+        submitted are sent by these accounts instead of their signers.
+    :type accounts: Sequence[Account]
+    :param max_pending: The maximum number of unmined transactions per
+        account, defaults to 16.
+    :type max_pending: int
+    :param queue_size: The maximum number of submitted items waiting to be
+        sent, defaults to 1024.
+    :type queue_size: int
+    :param retries: The number of times an item is submitted again,
+        possibly to another account, if it fails before or during the
+        broadcast, defaults to 0. Reverted and timed out transactions are
+        failures, but never sent again, as the timed out transaction may
+        still be mined and a revert is deterministic.
+    :type retries: int
+    :param timeout: Seconds to wait for each receipt, defaults to 120.
+    :type timeout: float
+    """
+
+    def __init__(
+        self,
+        accounts: Sequence[Account],
+        max_pending: int = 16,
+        queue_size: int = 1024,
+        retries: int = 0,
+        timeout: float = 120,
+    ) -> None:
+        if not accounts:
+            raise Exception("At least one account is required.")
+        self.accounts = list(accounts)
+        self.max_pending = max_pending
+        self.retries = retries
+        self.timeout = timeout
+        # retried items skip the backpressure, so the queue itself is unbounded
+        self._queue: "queue.Queue[_WorkItem]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._workers: List[threading.Thread] = []
+        self._waiters: ThreadPoolExecutor = None
+        self._results: List[TransactionResult] = []
+        self._retried = 0
+        self._outstanding = 0
+        self._condition = threading.Condition()
+        self._started_at: float = None
+        # set by `stop`, after which failed items are no longer retried
+        self._stopping = False
+
+    def __enter__(self) -> "TransactionScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.join()
+        self.stop()
+
+    def start(self) -> None:
+        """Starts the worker threads. It is called automatically by :meth:`submit`."""
+        if self._workers:
+            return
+        self._started_at = time.monotonic()
+        self._stopping = False
+        self._waiters = ThreadPoolExecutor(len(self.accounts) * self.max_pending)
+        for account in self.accounts:
+            worker = threading.Thread(target=self._work, args=(account,), daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self) -> None:
+        """Stops the worker threads after the items already submitted are sent.
+        The failed items are not retried any more, and the items left in the
+        queue, e.g. the ones retried before, are done with an error."""
+        with self._condition:
+            self._stopping = True
+            for _ in self._workers:
+                self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        if self._waiters is not None:
+            self._waiters.shutdown()
+            self._waiters = None
+        while True:
+            try:
+                work_item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if work_item is None:
+                continue
+            if work_item.attempts == 0:
+                self._slots.release()
+            error = Exception("The transaction was cancelled as the scheduler stopped.")
+            self._done(work_item, TransactionResult(error=error), retry=False)
+
+    def submit(self, item: Any) -> "Future[TransactionResult]":
+        """Submits a work item. It blocks while the queue is full.
+
+        :param item: A dict of the arguments of :meth:`Account.send_transaction <cheb3.account.Account.send_transaction>`,
+            a contract function with arguments, or a tuple of a contract function
+            and a dict of keyword arguments. Check :meth:`Account.send_transactions <cheb3.account.Account.send_transactions>`
+            for more details.
+
+        :returns: A future resolved to the :class:`TransactionResult <cheb3.account.TransactionResult>`
+            of the last attempt. It never raises, the error is kept in the result.
+        :rtype: Future[TransactionResult]
+        """
+        self.start()
+        future = Future()
+        self._slots.acquire()
+        with self._condition:
+            self._outstanding += 1
+        self._queue.put(_WorkItem(item, future))
+        return future
+
+    def join(self) -> SchedulerReport:
+        """Waits until all submitted items are done.
+
+        :returns: The report of the items submitted since the scheduler started,
+            in the order they were done.
+        :rtype: SchedulerReport
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._outstanding == 0)
+            elapsed = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+            report = SchedulerReport(list(self._results), elapsed, self._retried)
+        logger.info(
+            f"{report.succeeded}/{len(report)} transactions succeeded in {report.elapsed:.2f}s "
+            f"({report.tx_per_second:.2f} tx/s), transactions per account: {report.txs_per_account}"
+        )
+        return report
+
+    def run(self, items: Iterable[Any]) -> SchedulerReport:
+        """Submits the items and waits until all of them are done. The worker
+        threads are stopped afterwards unless the scheduler was started before.
+
+        :returns: The report with the results in the order of the items.
+        :rtype: SchedulerReport
+        """
+        started = bool(self._workers)
+        self.start()
+        started_at = time.monotonic()
+        try:
+            futures = [self.submit(item) for item in items]
+            self.join()
+        finally:
+            if not started:
+                self.stop()
+        results = [future.result() for future in futures]
+        return SchedulerReport(results, time.monotonic() - started_at, sum(r.attempts - 1 for r in results))
+
+    def _work(self, account: Account) -> None:
+        pending = threading.BoundedSemaphore(self.max_pending)
+        while True:
+            work_item = self._queue.get()
+            if work_item is None:
+                return
+            if work_item.attempts == 0:
+                self._slots.release()
+            pending.acquire()
+            work_item.attempts += 1
+            try:
+                to, value, data, kwargs = _parse_transaction_item(work_item.item)
+                kwargs["wait_for_receipt"] = False
+                tx_hash = account.send_transaction(to, value, data, **kwargs)
+            except Exception as e:
+                pending.release()
+                self._done(work_item, TransactionResult(error=e, sender=account.address), retry=True)
+                continue
+            self._waiters.submit(self._wait, account, work_item, tx_hash, pending)
+
+    def _wait(self, account: Account, work_item: _WorkItem, tx_hash: str, pending: threading.BoundedSemaphore) -> None:
+        result = TransactionResult(tx_hash, sender=account.address)
+        try:
+            result.receipt = account.w3.receipt_tracker.wait(tx_hash, self.timeout)
+            if not result.receipt.status:
+                result.error = Exception(f"Transaction {tx_hash} failed.")
+        except TimeExhausted as e:
+            # the nonce may never be mined, resync it for the next items
+            account.reset_nonce()
+            result.error = e
+        except Exception as e:
+            result.error = e
+        finally:
+            pending.release()
+        # the transaction was broadcast, sending it again may run it twice
+        self._done(work_item, result, retry=False)
+
+    def _done(self, work_item: _WorkItem, result: TransactionResult, retry: bool) -> None:
+        result.attempts = work_item.attempts
+        if retry and not result.success and work_item.attempts <= self.retries:
+            with self._condition:
+                # put before the sentinels of `stop`, or not at all
+                if not self._stopping:
+                    logger.debug(f"Retrying a failed transaction (attempt {work_item.attempts}): {result.error!r}")
+                    self._retried += 1
+                    self._queue.put(work_item)
+                    return
+        with self._condition:
+            self._results.append(result)
+            self._outstanding -= 1
+            self._condition.notify_all()
+        work_item.future.set_result(result)
@@ -0,0 +1,371 @@
+import json
+import os
+import time
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from eth_keys import keys
+from eth_utils import to_checksum_address
+from loguru import logger
+
+try:
+    # much faster than pycryptodome, installed with `eth-hash[pysha3]`
+    from sha3 import keccak_256
+except ImportError:
+    from Crypto.Hash import keccak as _keccak
+
+    def keccak_256(data: bytes = b"") -> Any:
+        return _keccak.new(digest_bits=256, data=data)
+
+
+# secp256k1
+_P = 2**256 - 2**32 - 977
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+_G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+)
+# the number of keys sharing one modular inversion
+KEY_BATCH_SIZE = 1024
+
+
+class AddressPrefix:
+    """Matches the addresses starting with the given hex prefix, compared in
+    lowercase, e.g. ``AddressPrefix("0x0000")``. It is picklable, so it can be
+    used as the predicate of the searches running in worker processes.
+
+    :param prefix: The hex prefix, with or without `0x`.
+    :type prefix: str
+    """
+
+    def __init__(self, prefix: str) -> None:
+        prefix = prefix.lower()
+        if prefix.startswith("0x"):
+            prefix = prefix[2:]
+        if len(prefix) > 40:
+            raise Exception("The prefix is longer than an address.")
+        self.prefix = prefix
+        self._bytes = bytes.fromhex(prefix[: len(prefix) // 2 * 2])
+        # the high nibble of the next byte, if the prefix has an odd length
+        self._nibble = int(prefix[-1], 16) if len(prefix) % 2 else None
+
+    def __repr__(self) -> str:
+        return f"AddressPrefix('0x{self.prefix}')"
+
+    def __call__(self, address: bytes) -> bool:
+        if not address.startswith(self._bytes):
+            return False
+        return self._nibble is None or address[len(self._bytes)] >> 4 == self._nibble
+
+
+class SearchResult:
+    """The result of a search running in chunks across worker processes.
+
+    :ivar value: The value found, e.g. the salt, :const:`None` if nothing is
+        found in the range, or the search is cancelled or timed out.
+    :ivar address: The address matched by the value.
+    :ivar attempts: The number of values tried.
+    :ivar elapsed: The wall time in seconds.
+    :ivar next_start: The start of the remaining range, to resume the search.
+        The values below it have all been tried, but some values above it
+        may have been tried as well.
+    """
+
+    def __init__(
+        self,
+        value: Any = None,
+        address: Optional[str] = None,
+        attempts: int = 0,
+        elapsed: float = 0.0,
+        next_start: Optional[int] = None,
+    ) -> None:
+        self.value = value
+        self.address = address
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.next_start = next_start
+
+    def __repr__(self) -> str:
+        return (
+            f"<SearchResult value={self.value!r} address={self.address} attempts={self.attempts} "
+            f"rate={self.rate:.0f}/s next_start={self.next_start}>"
+        )
+
+    @property
+    def found(self) -> bool:
+        return self.value is not None
+
+    @property
+    def rate(self) -> float:
+        """The number of values tried per second."""
+        return self.attempts / self.elapsed if self.elapsed else 0.0
+
+
+def run_search(
+    task: Callable[..., Tuple[Any, bytes, int]],
+    chunks: Iterator[Tuple],
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Optional[Tuple[Any, bytes]], int, int]:
+    """Runs `task(*chunk)` for the chunks until one of them finds a value.
+
+    Each task returns the value found (or :const:`None`), the matched address
+    and the number of values tried. At most `workers` processes run the tasks,
+    with a few chunks queued for each of them. Pending chunks are cancelled as
+    soon as a value is found, the `timeout` expires or the search is interrupted.
+
+    :returns: The value and address found, the number of values tried, and
+        the number of chunks completed in order from the first one.
+    """
+    workers = workers or os.cpu_count() or 1
+    deadline = None if timeout is None else time.monotonic() + timeout
+    completed: Dict[int, bool] = dict()
+    found, attempts = None, 0
+
+    def completed_in_order() -> int:
+        n = 0
+        while completed.get(n):
+            n += 1
+        return n
+
+    if workers == 1:
+        # in the current process, so the task and the predicate need not be picklable
+        try:
+            for i, chunk in enumerate(chunks):
+                value, address, tried = task(*chunk)
+                attempts += tried
+                completed[i] = True
+                if value is not None:
+                    return (value, address), attempts, completed_in_order()
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+        except KeyboardInterrupt:
+            logger.warning("The search is interrupted.")
+        return found, attempts, completed_in_order()
+
+    executor = ProcessPoolExecutor(workers)
+    pending: Dict[Future, int] = dict()
+    chunks = enumerate(chunks)
+    try:
+        while True:
+            while len(pending) < workers * 2:
+                try:
+                    i, chunk = next(chunks)
+                except StopIteration:
+                    break
+                pending[executor.submit(task, *chunk)] = i
+            if not pending:
+                break
+            wait_timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            done, _ = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = pending.pop(future)
+                value, address, tried = future.result()
+                attempts += tried
+                completed[i] = True
+                if value is not None and found is None:
+                    found = (value, address)
+            if found is not None or (deadline is not None and time.monotonic() >= deadline):
+                break
+    except KeyboardInterrupt:
+        logger.warning("The search is interrupted.")
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+    return found, attempts, completed_in_order()
+
+
+def search_create2_salts(
+    sender: bytes, init_hash: bytes, start: int, stop: int, predicate: Callable[[bytes], bool]
+) -> Tuple[Optional[int], bytes, int]:
+    """Tries the salts in [start, stop), returning the first one whose CREATE2
+    address matches the predicate."""
+    head = b"\xff" + sender
+    for salt in range(start, stop):
+        address = keccak_256(head + salt.to_bytes(32, "big") + init_hash).digest()[12:]
+        if predicate(address):
+            return salt, address, salt - start + 1
+    return None, b"", stop - start
+
+
+def create_address(sender: bytes, nonce: int) -> bytes:
+    """Returns the 20 bytes of the CREATE address, with the RLP encoding of
+    the sender and the nonce written out."""
+    if nonce == 0:
+        encoded_nonce = b"\x80"
+    elif nonce < 0x80:
+        encoded_nonce = bytes([nonce])
+    else:
+        nonce_bytes = nonce.to_bytes((nonce.bit_length() + 7) // 8, "big")
+        encoded_nonce = bytes([0x80 + len(nonce_bytes)]) + nonce_bytes
+    payload = b"\x94" + sender + encoded_nonce
+    return keccak_256(bytes([0xC0 + len(payload)]) + payload).digest()[12:]
+
+
+def _address_bytes(address: str) -> bytes:
+    return bytes.fromhex(address[2:] if address.startswith(("0x", "0X")) else address)
+
+
+class CreateAddressIndex:
+    """A reverse lookup index from the addresses of the contracts created
+    with the `CREATE` opcode to their senders and nonces, e.g. to find which
+    nonce of a factory created a contract. The addresses are computed in
+    bulk, and the index can be saved to a file to skip computing them again.
+
+    Examples:
+
+        >>> index = CreateAddressIndex()
+        >>> index.add(factory_addr, range(10000))
+        >>> # the contracts created by the first 100 contracts of the factory
+        >>> for address in calc_create_addresses(factory_addr, range(100)):
+        ...     index.add(address, range(1, 100))
+        >>> index.lookup(contract_addr)
+        ('0x518C2143bDd79d3bc060BC4883d92D545D3E3bb0', 1234)
+        >>> index.save("create_addresses.json")
+        >>> index = CreateAddressIndex.load("create_addresses.json")
+    """
+
+    def __init__(self) -> None:
+        self._index: Dict[bytes, Tuple[str, int]] = dict()
+        # the (sender, nonces, addresses) added, in order
+        self._tables: List[Tuple[str, List[int], bytes]] = []
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, address: str) -> bool:
+        return _address_bytes(address) in self._index
+
+    def add(self, sender: str, nonces: Iterable[int]) -> None:
+        """Computes and indexes the addresses of the contracts created by
+        `sender` with the given nonces.
+
+        :param sender: The address of the sender.
+        :type sender: str
+        :param nonces: The nonces, e.g. ``range(1000)``.
+        :type nonces: Iterable[int]
+        """
+        sender = to_checksum_address(sender)
+        nonces = list(nonces)
+        sender_bytes = bytes.fromhex(sender[2:])
+        self._add_table(sender, nonces, [create_address(sender_bytes, nonce) for nonce in nonces])
+
+    def lookup(self, address: str) -> Optional[Tuple[str, int]]:
+        """Returns the sender and the nonce which created the contract at
+        `address`, or :const:`None` if it is not in the index."""
+        return self._index.get(_address_bytes(address))
+
+    def save(self, path: str) -> None:
+        """Saves the index to a JSON file."""
+        tables = []
+        for sender, nonces, addresses in self._tables:
+            table: Dict[str, Any] = {"sender": sender, "addresses": addresses.hex()}
+            if nonces == list(range(nonces[0], nonces[0] + len(nonces))):
+                table["start"] = nonces[0]
+            else:
+                table["nonces"] = nonces
+            tables.append(table)
+        with open(path, "w") as f:
+            json.dump({"tables": tables}, f)
+
+    @classmethod
+    def load(cls, path: str) -> "CreateAddressIndex":
+        """Loads the index saved by :meth:`save`."""
+        index = cls()
+        with open(path) as f:
+            tables = json.load(f)["tables"]
+        for table in tables:
+            data = bytes.fromhex(table["addresses"])
+            addresses = [data[i: i + 20] for i in range(0, len(data), 20)]
+            nonces = table.get("nonces") or list(range(table["start"], table["start"] + len(addresses)))
+            index._add_table(table["sender"], nonces, addresses)
+        return index
+
+    def _add_table(self, sender: str, nonces: List[int], addresses: List[bytes]) -> None:
+        if not nonces:
+            return
+        self._tables.append((sender, nonces, b"".join(addresses)))
+        self._index.update(zip(addresses, ((sender, nonce) for nonce in nonces)))
+
+
+def _add_points(p: Tuple[int, int], q: Tuple[int, int]) -> Tuple[int, int]:
+    # affine addition of two different points, neither of them infinity
+    slope = (q[1] - p[1]) * pow(q[0] - p[0], -1, _P) % _P
+    x = (slope * slope - p[0] - q[0]) % _P
+    return x, (slope * (p[0] - x) - p[1]) % _P
+
+
+@lru_cache(maxsize=None)
+def _multiples_of_g() -> List[Tuple[int, int]]:
+    # G, 2G, ..., KEY_BATCH_SIZE * G, computed once per process
+    points = [
+        _G,
+        (
+            0xC6047F9441ED7D6D3045406E95C07CD85C778E4B8CEF3CA7ABAC09B95C709EE5,
+            0x1AE168FEA63DC339A3C58419466CEAEEF7F632653266D0E1236431A950CFE52A,
+        ),
+    ]
+    for _ in range(KEY_BATCH_SIZE - 2):
+        points.append(_add_points(points[-1], _G))
+    return points
+
+
+def _public_point(key: int) -> Tuple[int, int]:
+    public_key = keys.PrivateKey(key.to_bytes(32, "big")).public_key.to_bytes()
+    return int.from_bytes(public_key[:32], "big"), int.from_bytes(public_key[32:], "big")
+
+
+def search_keys(
+    start: int, count: int, predicate: Callable[[bytes], bool], nonce: Optional[int] = None
+) -> Tuple[Optional[int], bytes, int]:
+    """Tries the private keys in [start, start + count), returning the first
+    one whose address, or CREATE address at `nonce`, matches the predicate.
+
+    Consecutive keys are consecutive points on the curve, so each key costs a
+    point addition instead of a scalar multiplication, and the modular
+    inversions of a batch of additions are shared (Montgomery's trick).
+    The keys must be in [1, SECP256K1_N - KEY_BATCH_SIZE).
+    """
+    multiples = _multiples_of_g()
+    x, y = _public_point(start)
+    key, tried = start, 0
+    while tried < count:
+        address = keccak_256(x.to_bytes(32, "big") + y.to_bytes(32, "big")).digest()[12:]
+        if predicate(address if nonce is None else create_address(address, nonce)):
+            return key, address, tried + 1
+        tried += 1
+
+        # the points key + 1, ..., key + KEY_BATCH_SIZE
+        if key <= KEY_BATCH_SIZE:
+            # key * G is one of the multiples, which cannot be added as different points
+            points = [_public_point(key + j + 1) for j in range(KEY_BATCH_SIZE)]
+        else:
+            diffs = [(mx - x) % _P for mx, _ in multiples]
+            products, product = [], 1
+            for diff in diffs:
+                product = product * diff % _P
+                products.append(product)
+            inverse = pow(product, -1, _P)
+            points = [None] * KEY_BATCH_SIZE
+            for j in range(KEY_BATCH_SIZE - 1, -1, -1):
+                inverse_j = inverse * products[j - 1] % _P if j else inverse
+                inverse = inverse * diffs[j] % _P
+                mx, my = multiples[j]
+                slope = (my - y) * inverse_j % _P
+                px = (slope * slope - x - mx) % _P
+                points[j] = (px, (slope * (x - px) - y) % _P)
+
+        for j in range(KEY_BATCH_SIZE - 1):
+            if tried >= count:
+                break
+            px, py = points[j]
+            address = keccak_256(px.to_bytes(32, "big") + py.to_bytes(32, "big")).digest()[12:]
+            if predicate(address if nonce is None else create_address(address, nonce)):
+                return key + j + 1, address, tried + 1
+            tried += 1
+        # the last point is the first one checked in the next round
+        x, y = points[-1]
+        key += KEY_BATCH_SIZE
+    return None, b"", tried
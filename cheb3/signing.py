@@ -0,0 +1,86 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import eth_account
+from eth_account._utils.signing import sign_message_hash, to_standard_signature_bytes
+from eth_account.datastructures import SignedMessage, SignedSetCodeAuthorization
+from eth_account.signers.local import LocalAccount
+from eth_keys import keys
+from hexbytes import HexBytes
+
+
+def map_chunks(
+    func: Callable[..., List[Any]], items: Sequence[Any], args: Tuple, workers: Optional[int], chunk_size: int
+) -> List[Any]:
+    """Runs `func(chunk, *args)` for the chunks of `items` and concatenates
+    the results in order. The chunks run in worker processes, unless there
+    is only one chunk or `workers` is 1."""
+    chunks = [items[i: i + chunk_size] for i in range(0, len(items), chunk_size)]
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    if workers <= 1:
+        results = [func(chunk, *args) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            results = list(executor.map(func, chunks, *([arg] * len(chunks) for arg in args)))
+    return [result for chunk_results in results for result in chunk_results]
+
+
+def signed_message(message_hash: bytes, key: keys.PrivateKey) -> SignedMessage:
+    if len(message_hash) != 32:
+        raise ValueError("The message hash must be exactly 32-bytes")
+    v, r, s, signature = sign_message_hash(key, message_hash)
+    return SignedMessage(message_hash=HexBytes(message_hash), r=r, s=s, v=v, signature=HexBytes(signature))
+
+
+def sign_hashes(message_hashes: Sequence[bytes], private_key: bytes) -> List[SignedMessage]:
+    # the key is derived once per chunk
+    key = keys.PrivateKey(private_key)
+    return [signed_message(message_hash, key) for message_hash in message_hashes]
+
+
+def recover_hashes(items: Sequence[Tuple[bytes, bytes]]) -> List[str]:
+    addresses = []
+    for message_hash, signature in items:
+        signature = keys.Signature(signature_bytes=to_standard_signature_bytes(signature))
+        addresses.append(signature.recover_public_key_from_msg_hash(message_hash).to_checksum_address())
+    return addresses
+
+
+def sign_authorizations(items: Sequence[Tuple[bytes, Dict[str, Any]]]) -> List[SignedSetCodeAuthorization]:
+    # each key is derived once per chunk
+    accounts: Dict[bytes, LocalAccount] = dict()
+    signed = []
+    for private_key, authorization in items:
+        if private_key not in accounts:
+            accounts[private_key] = eth_account.Account.from_key(private_key)
+        signed.append(accounts[private_key].sign_authorization(authorization))
+    return signed
+
+
+def build_authorizations(
+    accounts: Sequence[Any],
+    targets: Union[str, Sequence[str]],
+    chain_id: int,
+    nonces: Dict[str, int],
+    sender: Optional[str],
+    workers: Optional[int],
+    chunk_size: int,
+) -> List[SignedSetCodeAuthorization]:
+    """Signs the authorizations of the accounts with the prefetched nonces of
+    their addresses. The nonces of an account used more than once increase
+    in order, and start from the next nonce if the account is the sender."""
+    if isinstance(targets, str):
+        targets = [targets] * len(accounts)
+    if len(targets) != len(accounts):
+        raise Exception("The numbers of accounts and targets do not match.")
+    nonces = {address: nonce + (address == sender) for address, nonce in nonces.items()}
+    authorizations = []
+    for account, target in zip(accounts, targets):
+        authorizations.append({"chainId": chain_id, "nonce": nonces[account.address], "address": target})
+        nonces[account.address] += 1
+
+    if workers == 1 or len(accounts) <= chunk_size:
+        return [account.eth_acct.sign_authorization(auth) for account, auth in zip(accounts, authorizations)]
+    items = [(bytes(account.eth_acct.key), auth) for account, auth in zip(accounts, authorizations)]
+    return map_chunks(sign_authorizations, items, (), workers, chunk_size)
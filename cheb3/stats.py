@@ -0,0 +1,269 @@
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from web3.middleware import Web3Middleware
+
+from loguru import logger
+
+# upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class LatencyHistogram:
+    """Counts latencies in the buckets of :const:`LATENCY_BUCKETS`."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        # cumulative counts of the latencies less than or equal to each bound
+        buckets, cumulative = dict(), 0
+        for bound, count in zip((*map(str, LATENCY_BUCKETS), "+Inf"), self.buckets):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "buckets": buckets,
+        }
+
+
+class OperationRecord:
+    """The record of a high-level operation, e.g. :meth:`Account.send_transaction
+    <cheb3.account.Account.send_transaction>`, passed to the stats hook.
+
+    :ivar name: The name of the operation.
+    :ivar elapsed: The wall time in seconds.
+    :ivar phases: The seconds spent in the `build`, `estimate`, `sign`,
+        `broadcast` and `mined` phases. Nested phases are not counted in
+        their parents, e.g. `estimate` is not part of `build`.
+    :ivar rpc_calls: The number of JSON-RPC requests made.
+    :ivar error: The error raised by the operation, :const:`None` if it succeeded.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.elapsed = 0.0
+        self.phases: Dict[str, float] = dict()
+        self.rpc_calls = 0
+        self.error: Optional[BaseException] = None
+        # the active phases, each with the time it was (re)started
+        self._phases: List[Tuple[str, float]] = []
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{name}={seconds:.3f}s" for name, seconds in self.phases.items())
+        return f"<OperationRecord {self.name} {self.elapsed:.3f}s rpc_calls={self.rpc_calls} {phases}>"
+
+    def _pause(self, now: float) -> None:
+        if self._phases:
+            name, started_at = self._phases[-1]
+            self.phases[name] = self.phases.get(name, 0.0) + now - started_at
+
+    def _enter_phase(self, name: str) -> None:
+        now = time.perf_counter()
+        self._pause(now)
+        self._phases.append((name, now))
+
+    def _exit_phase(self) -> None:
+        now = time.perf_counter()
+        self._pause(now)
+        self._phases.pop()
+        if self._phases:
+            self._phases[-1] = (self._phases[-1][0], now)
+
+
+class Stats:
+    """Records the RPC latencies and the phases of high-level operations of
+    a connection. Please use :func:`cheb3.Connection.stats` interface to get
+    a snapshot.
+
+    :param hook: Called with the :class:`OperationRecord` of each finished
+        operation, e.g. to export the records to a metrics system.
+    :type hook: Callable[[OperationRecord], Any]
+    """
+
+    def __init__(self, hook: Callable[[OperationRecord], Any] = None) -> None:
+        self.hook = hook
+        self._current = ContextVar("operation", default=None)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rpc: Dict[str, LatencyHistogram] = dict()
+            self._operations: Dict[str, Dict[str, Any]] = dict()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the aggregated records.
+
+        :returns: A dict with `operations`, mapping each operation name to
+            its `count`, `errors`, `rpc_calls`, `elapsed` and `phases` totals,
+            and `rpc`, mapping each JSON-RPC method to its latency histogram.
+            Each request sent in a JSON-RPC batch is recorded under its method
+            with the latency of the batch, and the batch itself under `batch`.
+        :rtype: Dict[str, Any]
+        """
+        with self._lock:
+            return {
+                "operations": {
+                    name: {**operation, "phases": dict(operation["phases"])}
+                    for name, operation in self._operations.items()
+                },
+                "rpc": {method: histogram.snapshot() for method, histogram in self._rpc.items()},
+            }
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[Optional[OperationRecord]]:
+        """Records a high-level operation. Operations started inside another
+        one are counted in the outer one."""
+        if self._current.get() is not None:
+            yield None
+            return
+        record = OperationRecord(name)
+        token = self._current.set(record)
+        started_at = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record.error = e
+            raise
+        finally:
+            record.elapsed = time.perf_counter() - started_at
+            self._current.reset(token)
+            self._finish(record)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Records the time spent in a phase of the current operation."""
+        record = self._current.get()
+        if record is None:
+            yield
+            return
+        record._enter_phase(name)
+        try:
+            yield
+        finally:
+            record._exit_phase()
+
+    def record_rpc(self, method: str, seconds: float, calls: int = 1) -> None:
+        with self._lock:
+            if method not in self._rpc:
+                self._rpc[method] = LatencyHistogram()
+            self._rpc[method].observe(seconds)
+        record = self._current.get()
+        if record is not None:
+            record.rpc_calls += calls
+
+    def record_batch(self, methods: List[str], seconds: float) -> None:
+        """Records a JSON-RPC batch request, whose requests all take its latency."""
+        with self._lock:
+            for method in (*methods, "batch"):
+                if method not in self._rpc:
+                    self._rpc[method] = LatencyHistogram()
+                self._rpc[method].observe(seconds)
+        record = self._current.get()
+        if record is not None:
+            record.rpc_calls += len(methods)
+
+    def _finish(self, record: OperationRecord) -> None:
+        with self._lock:
+            if record.name not in self._operations:
+                self._operations[record.name] = {"count": 0, "errors": 0, "rpc_calls": 0, "elapsed": 0.0, "phases": {}}
+            operation = self._operations[record.name]
+            operation["count"] += 1
+            operation["errors"] += record.error is not None
+            operation["rpc_calls"] += record.rpc_calls
+            operation["elapsed"] += record.elapsed
+            for name, seconds in record.phases.items():
+                operation["phases"][name] = operation["phases"].get(name, 0.0) + seconds
+        if self.hook is not None:
+            # exporting the record must not change the result of the operation
+            try:
+                self.hook(record)
+            except Exception:
+                logger.exception(f"The stats hook failed on {record!r}")
+
+
+def instrument(name: str) -> Callable:
+    """Records the decorated method of an account or a contract as the
+    operation `name` in the stats of its connection."""
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.w3.stats.operation(name):
+                    return await func(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.w3.stats.operation(name):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class StatsMiddleware(Web3Middleware):
+    """Records the latency of each JSON-RPC request in the stats of the connection."""
+
+    def wrap_make_request(self, make_request):
+        def middleware(method, params):
+            started_at = time.perf_counter()
+            try:
+                return make_request(method, params)
+            finally:
+                self._w3.stats.record_rpc(method, time.perf_counter() - started_at)
+
+        return middleware
+
+    def wrap_make_batch_request(self, make_batch_request):
+        def middleware(requests_info):
+            started_at = time.perf_counter()
+            try:
+                return make_batch_request(requests_info)
+            finally:
+                self._w3.stats.record_batch([method for method, _ in requests_info], time.perf_counter() - started_at)
+
+        return middleware
+
+    async def async_wrap_make_request(self, make_request):
+        async def middleware(method, params):
+            started_at = time.perf_counter()
+            try:
+                return await make_request(method, params)
+            finally:
+                self._w3.stats.record_rpc(method, time.perf_counter() - started_at)
+
+        return middleware
+
+    async def async_wrap_make_batch_request(self, make_batch_request):
+        async def middleware(requests_info):
+            started_at = time.perf_counter()
+            try:
+                return await make_batch_request(requests_info)
+            finally:
+                self._w3.stats.record_batch([method for method, _ in requests_info], time.perf_counter() - started_at)
+
+        return middleware
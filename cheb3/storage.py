@@ -0,0 +1,226 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from eth_utils import keccak
+from hexbytes import HexBytes
+from web3 import Web3
+
+from cheb3.constants import STORAGE_SLOTS
+
+# The runtime code of the storage reader, which returns the value of each
+# slot given in the calldata. It is placed at the target address with a state
+# override, so the slots are read in a single `eth_call`.
+#
+#     PUSH1 0
+#   loop:
+#     CALLDATASIZE DUP2 LT ISZERO PUSH1 done JUMPI
+#     DUP1 CALLDATALOAD SLOAD DUP2 MSTORE  ; mstore(i, sload(calldataload(i)))
+#     PUSH1 32 ADD PUSH1 loop JUMP
+#   done:
+#     CALLDATASIZE PUSH1 0 RETURN
+STORAGE_READER_CODE = "0x60005b3681101560155780355481526020016002565b366000f3"
+# the maximum number of slots read by one `eth_call` of the storage reader,
+# about 21M gas if all of them are cold
+STORAGE_READER_MAX_SLOTS = 10000
+# the maximum number of `eth_getStorageAt` requests in one JSON-RPC batch
+# request, the default limit of geth
+STORAGE_BATCH_MAX_SIZE = 1000
+# the maximum number of concurrent `eth_getStorageAt` requests of an async connection
+STORAGE_MAX_CONCURRENCY = 64
+
+
+def _value_size(label: str) -> int:
+    # the size in bytes of a value type
+    if label == "bool":
+        return 1
+    if label.startswith(("address", "contract ")):
+        return 20
+    for prefix in ("uint", "int", "bytes"):
+        if label.startswith(prefix) and label[len(prefix):].isdigit():
+            size = int(label[len(prefix):])
+            return size if prefix == "bytes" else size // 8
+    return 32
+
+
+class StorageLayout:
+    """Decodes raw storage slots into state variables with the `storageLayout`
+    output of solc, e.g. ``solc --storage-layout`` or the ``storageLayout``
+    field of the Foundry artifacts with ``extra_output = ["storageLayout"]``.
+
+    Value types packed in one slot, structs, static and dynamic arrays,
+    ``bytes`` and ``string`` are decoded. Mappings cannot be enumerated, so
+    they are decoded as their slots, which can be used to calculate the slots
+    of their values.
+
+    Examples:
+
+        >>> layout = StorageLayout(load_storage_layout("Token.sol", "Token"))
+        >>> layout.decode(lambda slots: conn.get_storage_slots(contract_addr, slots))
+        {'owner': '0x3032Ab3Fa8C01d786D29dAdE018d7f2017918e12', 'paused': False, 'balances': 2, 'name': 'Cheb3Token'}
+
+    Please use :func:`cheb3.Connection.dump_storage` interface to decode the
+    storage of a contract.
+
+    :param layout: The `storageLayout` output, with `storage` and `types`.
+    :type layout: Dict
+    :param max_items: The maximum number of elements decoded for each dynamic
+        array, and of 32-byte words for each long `bytes` or `string`,
+        defaults to 1024.
+    :type max_items: int
+    """
+
+    def __init__(self, layout: Dict[str, Any], max_items: int = 1024) -> None:
+        self.storage: List[Dict[str, Any]] = layout.get("storage") or []
+        self.types: Dict[str, Dict[str, Any]] = layout.get("types") or dict()
+        self.max_items = max_items
+
+    @classmethod
+    def from_slots(cls, slots: Sequence[int], value_type: str) -> "StorageLayout":
+        """Creates the layout of variables of `value_type` stored at the given
+        slots, e.g. the values of a mapping, named by their indices in `slots`.
+
+        :param slots: The slots of the variables.
+        :type slots: Sequence[int]
+        :param value_type: The type of the variables, a value type, `bytes` or `string`.
+        :type value_type: str
+
+        :rtype: StorageLayout
+        """
+        if value_type in ("bytes", "string"):
+            type_info = {"encoding": "bytes", "label": value_type, "numberOfBytes": "32"}
+        else:
+            type_info = {"encoding": "inplace", "label": value_type, "numberOfBytes": str(_value_size(value_type))}
+        return cls(
+            {
+                "storage": [
+                    {"label": str(i), "offset": 0, "slot": str(slot), "type": value_type} for i, slot in enumerate(slots)
+                ],
+                "types": {value_type: type_info},
+            }
+        )
+
+    def decode(self, read: Callable[[Sequence[int]], Sequence[bytes]]) -> Dict[str, Any]:
+        """Decodes all state variables.
+
+        The slots of the variables are read in the first round, and the data
+        of dynamic arrays, long ``bytes`` and ``string`` in the next rounds,
+        one more round per level of nesting.
+
+        :param read: Reads a list of slots at once, returning their values in order.
+        :type read: Callable[[Sequence[int]], Sequence[bytes]]
+
+        :returns: A dict mapping the name of each variable to its value.
+        :rtype: Dict[str, Any]
+        """
+        values: Dict[int, bytes] = dict()
+        while True:
+            decoded, slots = self._round(values)
+            if not slots:
+                return decoded
+            values.update(zip(slots, (HexBytes(value).rjust(32, b"\0") for value in read(slots))))
+
+    async def async_decode(self, read: Callable[[Sequence[int]], Awaitable[Sequence[bytes]]]) -> Dict[str, Any]:
+        """Decodes all state variables with a coroutine `read`. Check :meth:`decode` for more details."""
+        values: Dict[int, bytes] = dict()
+        while True:
+            decoded, slots = self._round(values)
+            if not slots:
+                return decoded
+            values.update(zip(slots, (HexBytes(value).rjust(32, b"\0") for value in await read(slots))))
+
+    def slots(self) -> List[int]:
+        """Returns the slots read in the first round of :meth:`decode`."""
+        return self._round(dict())[1]
+
+    def _round(self, values: Dict[int, bytes]) -> Tuple[Dict[str, Any], List[int]]:
+        # decodes with the slots read so far, and collects the slots still needed
+        missing: Set[int] = set()
+        decoded = {
+            variable["label"]: self._decode(variable["type"], int(variable["slot"]), variable["offset"], values, missing)
+            for variable in self.storage
+        }
+        return decoded, sorted(missing)
+
+    def _decode(self, type_id: str, slot: int, offset: int, values: Dict[int, bytes], missing: Set[int]) -> Any:
+        # the slots derived from a hash may wrap around, e.g. the members of a struct
+        slot %= STORAGE_SLOTS
+        type_info = self.types[type_id]
+        encoding = type_info["encoding"]
+        if encoding == "mapping":
+            return slot
+        if encoding == "bytes":
+            return self._decode_bytes(type_info, slot, values, missing)
+        if encoding == "dynamic_array":
+            word = self._word(slot, values, missing)
+            if word is None:
+                return None
+            length = min(int.from_bytes(word, "big"), self.max_items)
+            start = int.from_bytes(keccak(slot.to_bytes(32, "big")), "big")
+            return self._decode_array(type_info["base"], length, start, values, missing)
+        if "members" in type_info:
+            return {
+                member["label"]: self._decode(member["type"], slot + int(member["slot"]), member["offset"], values, missing)
+                for member in type_info["members"]
+            }
+        if "base" in type_info:
+            length = int(type_info["label"].rsplit("[", 1)[1][:-1])
+            return self._decode_array(type_info["base"], length, slot, values, missing)
+
+        word = self._word(slot, values, missing)
+        if word is None:
+            return None
+        size = int(type_info["numberOfBytes"])
+        return self._decode_value(type_info["label"], word[32 - offset - size: 32 - offset])
+
+    def _decode_array(
+        self, base: str, length: int, slot: int, values: Dict[int, bytes], missing: Set[int]
+    ) -> List[Any]:
+        size = int(self.types[base]["numberOfBytes"])
+        items = []
+        for i in range(length):
+            if size <= 16:
+                # small elements are packed, starting from the lower-order bytes
+                per_slot = 32 // size
+                items.append(self._decode(base, slot + i // per_slot, i % per_slot * size, values, missing))
+            else:
+                items.append(self._decode(base, slot + i * ((size + 31) // 32), 0, values, missing))
+        return items
+
+    def _decode_bytes(self, type_info: Dict[str, Any], slot: int, values: Dict[int, bytes], missing: Set[int]) -> Any:
+        word = self._word(slot, values, missing)
+        if word is None:
+            return None
+        if word[-1] & 1 == 0:
+            # short data is stored in the slot with its length * 2 in the lowest byte
+            data = word[: word[-1] // 2]
+        else:
+            # capped like dynamic arrays, in words, as the length may be garbage
+            length = min((int.from_bytes(word, "big") - 1) // 2, self.max_items * 32)
+            start = int.from_bytes(keccak(slot.to_bytes(32, "big")), "big")
+            words = [self._word(start + i, values, missing) for i in range((length + 31) // 32)]
+            if any(w is None for w in words):
+                return None
+            data = b"".join(words)[:length]
+        if type_info["label"] == "string":
+            return data.decode("utf-8", errors="replace")
+        return HexBytes(data)
+
+    @staticmethod
+    def _word(slot: int, values: Dict[int, bytes], missing: Set[int]) -> Optional[bytes]:
+        slot %= STORAGE_SLOTS
+        if slot not in values:
+            missing.add(slot)
+            return None
+        return values[slot]
+
+    @staticmethod
+    def _decode_value(label: str, data: bytes) -> Any:
+        if label == "bool":
+            return data[-1] != 0
+        if label.startswith(("address", "contract ")):
+            return Web3.to_checksum_address(data[-20:])
+        if label.startswith("bytes"):
+            return HexBytes(data)
+        if label.startswith("int"):
+            return int.from_bytes(data, "big", signed=True)
+        # uint, enum and user-defined value types
+        return int.from_bytes(data, "big")
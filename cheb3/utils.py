@@ -1,20 +1,55 @@
 import os
+import copy
 import json
-from typing import List, Tuple, Dict, Union, Any, Iterable
+import time
+from typing import Callable, List, Tuple, Dict, Union, Any, Iterable, Sequence
 from hexbytes import HexBytes
 from itertools import accumulate
+from functools import lru_cache
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from packaging.version import Version
 
 from web3 import Web3
 from web3.exceptions import MismatchedABI
+from eth_utils import keccak, to_canonical_address
 from eth_typing import HexStr
 import eth_abi
 import rlp
 
 from solcx import compile_source, set_solc_version
-from solcx.install import install_solc
+from solcx.install import get_installed_solc_versions, install_solc
 from solcx.exceptions import SolcNotInstalled
 
-from cheb3.constants import TYPE_ALIAS
+from cheb3.artifacts import ArtifactStore
+from cheb3.compiler import (
+    CompileCache,
+    collect_sources,
+    compile_standard_json,
+    group_sources,
+    load_remappings,
+    resolve_solc_version,
+    source_closure,
+    source_unit_name,
+)
+from cheb3.constants import STORAGE_SLOTS, TYPE_ALIAS
+from cheb3.search import AddressPrefix, SearchResult, create_address, run_search, search_create2_salts
+from cheb3.signing import map_chunks, recover_hashes
+
+from loguru import logger
+
+# directories of dependencies and build outputs skipped by `compile_project`
+PROJECT_EXCLUDED_DIRS = ("lib", "node_modules", "out", "cache", "artifacts", "broadcast")
+
+
+def _artifact_store(base_path: str) -> ArtifactStore:
+    return _artifact_store_of(os.path.abspath(base_path))
+
+
+# the artifact stores shared by `load_compiled` and `load_storage_layout`, for the recent base paths
+@lru_cache(maxsize=16)
+def _artifact_store_of(base_path: str) -> ArtifactStore:
+    return ArtifactStore(base_path)
 
 
 def load_compiled(contract_file: str, contract_name: str = None, base_path: str = "out/") -> Tuple[Dict, str]:
@@ -31,12 +66,32 @@ def load_compiled(contract_file: str, contract_name: str = None, base_path: str
 
     :return: ABI and bytecode of the required contract.
     :rtype: Tuple[Dict, str]
+
+    Only the ABI and bytecode are decoded, and they are cached until the
+    artifact is modified. Check :class:`~cheb3.artifacts.ArtifactStore` to
+    look up contracts by name.
+    """
+
+    return _artifact_store(base_path).load(contract_file, contract_name)
+
+
+def load_storage_layout(contract_file: str, contract_name: str = None, base_path: str = "out/") -> Dict:
+    """Loads the storage layout of a compiled contract from the project,
+    which is only in the output if ``storageLayout`` is set in the
+    ``extra_output`` of the Foundry config.
+
+    Check :func:`load_compiled` for the parameters.
+
+    :return: The `storageLayout` output of the required contract.
+    :rtype: Dict
     """
 
     contract_name = contract_name or os.path.splitext(contract_file)[0]
-    with open(os.path.join(base_path, contract_file, f"{contract_name}.json"), "r") as f:
-        compiled = json.load(f)
-        return (compiled["abi"], compiled["bytecode"]["object"])
+    path = os.path.join(base_path, contract_file, f"{contract_name}.json")
+    storage_layout = _artifact_store(base_path).read(path, ("storageLayout",))["storageLayout"]
+    if storage_layout is None:
+        raise Exception(f"The storage layout of {contract_name} is not in the compiled output.")
+    return copy.deepcopy(storage_layout)
 
 
 def compile_file(
@@ -44,6 +99,9 @@ def compile_file(
     contract_names: Union[str, List[str]] = None,
     solc_version: str = None,
     base_path: str = None,
+    storage_layout: bool = False,
+    cache: Union[bool, CompileCache] = True,
+    allow_install: bool = False,
 ) -> Dict[str, Tuple[Dict, str]]:
     """Compile the Solidity source in the given file.
 
@@ -55,6 +113,9 @@ def compile_file(
             contract_names=contract_names,
             solc_version=solc_version,
             base_path=base_path,
+            storage_layout=storage_layout,
+            cache=cache,
+            allow_install=allow_install,
         )
 
 
@@ -63,10 +124,17 @@ def compile_sol(
     contract_names: Union[str, List[str]] = None,
     solc_version: str = "latest",
     base_path: str = None,
+    storage_layout: bool = False,
+    cache: Union[bool, CompileCache] = True,
+    allow_install: bool = False,
 ) -> Dict[str, Tuple[Dict, str]]:
     """Compiles the Solidity source and return the ABI and bytecode of
     the specific contracts.
 
+    The compiled contracts are cached on disk, keyed by the source, the
+    imported files, the `solc` version and the outputs, so compiling an
+    unchanged source again does not run `solc`.
+
     :param contract_source: The Solidity source code.
     :type contract_source: str
     :param contract_name: A target contract name or a list of target
@@ -74,48 +142,182 @@ def compile_sol(
         will return all contracts in the source file.
     :type contract_name: str | List[str]
     :param solc_version: `solc` version to use, defaults to :const:`latest`,
-        i.e. the latest available version. If the specified version
-        is not installed, it will be installed automatically.
+        i.e. the newest installed version satisfying the `pragma solidity`
+        of the source and its imports, which is resolved without network
+        access. If the specified version is not installed, it will be
+        installed automatically.
     :type solc_version: str
     :param base_path: Uses the given path as the root of the source tree
         to include other dependence contracts, e.g. the path to
         openzeppelin contracts. Defaults to :const:`None`.
     :type base_path: str
+    :param storage_layout: Whether to also return the storage layout of
+        the contracts, defaults to :const:`False`. The layout can be used
+        with :meth:`~cheb3.Connection.dump_storage`.
+    :type storage_layout: bool
+    :param cache: Whether to use the compile cache, or the
+        :class:`~cheb3.compiler.CompileCache` to use, defaults to
+        :const:`True`, i.e. the cache in `~/.cache/cheb3/compile`.
+    :type cache: bool | CompileCache
+    :param allow_install: Whether to install the newest satisfying `solc`
+        version if no installed version satisfies the source when
+        `solc_version` is :const:`latest`, defaults to :const:`False`.
+    :type allow_install: bool
 
     :return: A dict, mapping the contract name to a tuple of the ABI and
-        bytecode.
+        bytecode, and the storage layout if `storage_layout` is :const:`True`.
     :rtype: Dict[str, Tuple[Dict, str]]
     """
-    if solc_version == "latest":
-        solc_version = install_solc()
-
-    try:
-        set_solc_version(solc_version)
-    except SolcNotInstalled:
-        install_solc(solc_version)
-        set_solc_version(solc_version)
-
-    compiled = compile_source(
-        contract_source,
-        output_values=["abi", "bin"],
-        solc_version=solc_version,
-        base_path=base_path,
-    )
+    if solc_version in ("latest", None):
+        solc_version = resolve_solc_version(contract_source, base_path, allow_install)
+
+    output_values = ["abi", "bin"] + (["storage-layout"] if storage_layout else [])
+    if cache is True:
+        cache = CompileCache()
+    compiled = None
+    if cache:
+        key = cache.key(contract_source, solc_version, output_values, base_path)
+        compiled = cache.get(key)
+    if compiled is None:
+        try:
+            set_solc_version(solc_version)
+        except SolcNotInstalled:
+            install_solc(solc_version)
+            set_solc_version(solc_version)
+        compiled = compile_source(
+            contract_source,
+            output_values=output_values,
+            solc_version=solc_version,
+            base_path=base_path,
+        )
+        # only the contracts in the source are returned
+        compiled = {c.split(":")[1]: compiled[c] for c in compiled.keys() if c.startswith("<stdin>:")}
+        if cache:
+            cache.put(key, compiled)
+    else:
+        logger.debug(f"Loaded the compiled contracts from {cache.path}")
+
     contracts = dict()
     if contract_names is None:
-        contract_names = [c.split(":")[1] for c in compiled.keys() if c.startswith("<stdin>:")]
+        contract_names = list(compiled.keys())
     if isinstance(contract_names, str):
         contract_names = [contract_names]
     for cn in contract_names:
-        if f"<stdin>:{cn}" not in compiled:
+        if cn not in compiled:
             raise Exception(f"Contract {cn} not found.")
-        contracts[cn] = (
-            compiled[f"<stdin>:{cn}"]["abi"],
-            compiled[f"<stdin>:{cn}"]["bin"],
-        )
+        contracts[cn] = tuple(compiled[cn][output] for output in output_values)
     return contracts
 
 
+def compile_files(
+    contract_files: List[str],
+    contract_names: Union[str, List[str]] = None,
+    solc_version: str = "latest",
+    base_path: str = None,
+    storage_layout: bool = False,
+    cache: Union[bool, CompileCache] = True,
+    allow_install: bool = False,
+    workers: int = None,
+    root: str = ".",
+    remappings: List[str] = None,
+) -> Dict[str, Tuple[Dict, str]]:
+    """Compiles the Solidity files and return the ABI and bytecode of the
+    specific contracts in them.
+
+    The files are grouped by the `solc` version satisfying their pragmas,
+    and each group is compiled by one standard JSON invocation of `solc`.
+    The groups are compiled in parallel, and cached like :func:`compile_sol`.
+
+    Check :func:`compile_sol` for more details.
+
+    :param contract_files: The paths of the Solidity files.
+    :type contract_files: List[str]
+    :param workers: The maximum number of `solc` processes running at the
+        same time, defaults to the number of groups.
+    :type workers: int
+    :param root: The root of the source tree of the files, defaults to the
+        working directory. The files are imported by their paths relative
+        to it, e.g. `src/Token.sol`.
+    :type root: str
+    :param remappings: The import remappings, relative to `root`, e.g.
+        :code:`["forge-std/=lib/forge-std/src/"]`, defaults to :const:`None`.
+    :type remappings: List[str]
+
+    :return: A dict, mapping the contract name to a tuple of the ABI and
+        bytecode. A contract name defined in more than one file is prefixed
+        with the file path, e.g. `src/Token.sol:Token`.
+    :rtype: Dict[str, Tuple[Dict, str]]
+    """
+    output_values = ["abi", "bin"] + (["storage-layout"] if storage_layout else [])
+    if cache is True:
+        cache = CompileCache()
+    units = list(dict.fromkeys(source_unit_name(path, root) for path in contract_files))
+    sources, imports = collect_sources(contract_files, base_path, root, remappings)
+    groups = group_sources(units, sources, imports, solc_version, allow_install)
+
+    def compile_group(version: Version, group: List[str]) -> Dict[str, Dict[str, Dict]]:
+        closure = sorted(set().union(*(source_closure(unit, imports) for unit in group)))
+        group_sources = {unit: sources[unit] for unit in closure if unit in sources}
+        if cache:
+            key = cache.key({"sources": group_sources, "units": group, "remappings": remappings}, version, output_values)
+            compiled = cache.get(key)
+            if compiled is not None:
+                return compiled
+        if version not in get_installed_solc_versions():
+            install_solc(version)
+        start = time.perf_counter()
+        compiled = compile_standard_json(group_sources, group, version, output_values, remappings)
+        logger.debug(f"Compiled {len(group)} files with solc {version} in {time.perf_counter() - start:.2f}s")
+        if cache:
+            cache.put(key, compiled)
+        return compiled
+
+    with ThreadPoolExecutor(workers or len(groups) or 1) as executor:
+        results = list(executor.map(lambda group: compile_group(*group), groups.items()))
+
+    compiled = {unit: contracts for result in results for unit, contracts in result.items()}
+    counts = Counter(name for unit in units for name in compiled[unit])
+    contracts = dict()
+    for unit in units:
+        for name, outputs in compiled[unit].items():
+            name = name if counts[name] == 1 else f"{unit}:{name}"
+            contracts[name] = tuple(outputs[output] for output in output_values)
+    if contract_names is None:
+        return contracts
+    if isinstance(contract_names, str):
+        contract_names = [contract_names]
+    for cn in contract_names:
+        if cn not in contracts:
+            raise Exception(f"Contract {cn} not found.")
+    return {cn: contracts[cn] for cn in contract_names}
+
+
+def compile_project(
+    project_dir: str = ".", contract_names: Union[str, List[str]] = None, **kwargs
+) -> Dict[str, Tuple[Dict, str]]:
+    """Compiles all Solidity files in the project directory, except the
+    dependencies and build outputs, e.g. `lib/`, `node_modules/` and `out/`.
+    The dependencies are still compiled if imported, with the remappings of
+    the project, i.e. the ones in `remappings.txt` and `foundry.toml` and the
+    ones inferred from the libraries in `lib/`, unless `remappings` is given.
+
+    Check :func:`compile_files` for the keyword arguments and more details.
+
+    :param project_dir: The project directory, which is the root of the
+        source tree and, by default, the base path, defaults to the working
+        directory.
+    :type project_dir: str
+    """
+    contract_files = []
+    for dirpath, dirnames, filenames in os.walk(project_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in PROJECT_EXCLUDED_DIRS and not d.startswith("."))
+        contract_files.extend(os.path.join(dirpath, f) for f in sorted(filenames) if f.endswith(".sol"))
+    kwargs.setdefault("base_path", project_dir)
+    if kwargs.get("remappings") is None:
+        kwargs["remappings"] = load_remappings(project_dir)
+    return compile_files(contract_files, contract_names, root=project_dir, **kwargs)
+
+
 def decode_data(encoded_data: Union[HexBytes, HexStr], types: Iterable[str]) -> Union[Any, Tuple[Any]]:
     r"""The same as `abi.decode` in Solidity.
 
@@ -232,6 +434,44 @@ def encode_with_signature(signature: str, *args) -> HexStr:
     return HexStr(f"0x{(selector + parameters).hex()}")
 
 
+def recover_many(
+    message_hashes: Sequence[HexStr],
+    signatures: Sequence[Union[HexBytes, HexStr]],
+    workers: int = None,
+    chunk_size: int = 1000,
+) -> List[HexStr]:
+    """Recovers the addresses which signed the raw message hashes, in chunks
+    across worker processes.
+
+    Examples:
+
+        >>> recover_many([msg_hash], [sig.signature])
+        ['0x518C2143bDd79d3bc060BC4883d92D545D3E3bb0']
+
+    :param message_hashes: The hashes of the signed messages.
+    :type message_hashes: Sequence[HexStr]
+    :param signatures: The 65-byte signatures, in the order of the hashes.
+    :type signatures: Sequence[Union[~hexbytes.main.HexBytes, HexStr]]
+    :param workers: The number of worker processes, defaults to the number
+        of CPUs. If 1 or there is only one chunk, the addresses are recovered
+        in the current process.
+    :type workers: int
+    :param chunk_size: The number of signatures recovered by a worker at a
+        time, defaults to 1000.
+    :type chunk_size: int
+
+    :return: The addresses of the signers.
+    :rtype: List[HexStr]
+    """
+    if len(message_hashes) != len(signatures):
+        raise Exception("The numbers of message hashes and signatures do not match.")
+    items = [
+        (bytes(HexBytes(message_hash)), bytes(HexBytes(signature)))
+        for message_hash, signature in zip(message_hashes, signatures)
+    ]
+    return map_chunks(recover_hashes, items, (), workers, chunk_size)
+
+
 def calc_create_address(sender: HexStr, nonce: int) -> HexStr:
     """Calculates the address of the contract created by the given sender
     using the `CREATE` opcode with the given nonce.
@@ -248,6 +488,37 @@ def calc_create_address(sender: HexStr, nonce: int) -> HexStr:
     return Web3.to_checksum_address(Web3.keccak(rlp.encode([Web3.to_bytes(hexstr=sender), nonce]))[12:].hex())
 
 
+def calc_create_addresses(sender: HexStr, nonces: Iterable[int], checksum: bool = True) -> List[HexStr]:
+    """Calculates the addresses of the contracts created by the given sender
+    using the `CREATE` opcode with each of the given nonces. It is much faster
+    than calling :func:`calc_create_address` for each nonce.
+
+    Use :class:`CreateAddressIndex <cheb3.search.CreateAddressIndex>` to
+    find the sender and the nonce of an address.
+
+    Examples:
+
+        >>> calc_create_addresses("0x518C2143bDd79d3bc060BC4883d92D545D3E3bb0", range(1, 3))
+        ['0x53D144BcF44de3DeE630b1CFEabD91AC3d3caF5a', '0x799b11babBF998da7A2D849C8A55a2A3188c711d']
+
+    :param sender: The address of the sender.
+    :type sender: HexStr
+    :param nonces: The nonces, e.g. ``range(1000)``.
+    :type nonces: Iterable[int]
+    :param checksum: Returns the checksum addresses, defaults to :const:`True`.
+        Otherwise the addresses are in lowercase, which skips hashing them again.
+    :type checksum: bool
+
+    :return: The addresses in the order of the nonces.
+    :rtype: List[HexStr]
+    """
+    sender_bytes = bytes.fromhex(Web3.to_checksum_address(sender)[2:])
+    addresses = ["0x" + create_address(sender_bytes, nonce).hex() for nonce in nonces]
+    if checksum:
+        return [Web3.to_checksum_address(address) for address in addresses]
+    return addresses
+
+
 def calc_create2_address(sender: HexStr, salt: int, initcode: HexStr) -> HexStr:
     """Calculates the address of the contract created by the given sender
     using the `CREATE2` opcode with the given salt and contract bytecode.
@@ -273,3 +544,208 @@ def calc_create2_address(sender: HexStr, salt: int, initcode: HexStr) -> HexStr:
             ],
         )[12:].hex()
     )
+
+
+def _encode_mapping_key(key: Any, key_type: str) -> bytes:
+    # the key of a mapping is hashed with the slot, and padded to 32 bytes
+    # unless it is `bytes` or `string`
+    if key_type == "string":
+        return key.encode() if isinstance(key, str) else bytes(key)
+    if key_type == "bytes":
+        return bytes(HexBytes(key))
+    if key_type.startswith("address"):
+        return to_canonical_address(key).rjust(32, b"\0")
+    if key_type.startswith("uint"):
+        return key.to_bytes(32, "big")
+    return eth_abi.encode([TYPE_ALIAS.get(key_type, key_type)], [key])
+
+
+def calc_mapping_slot(slot: int, key: Any, key_type: Union[str, Sequence[str]] = "uint256") -> int:
+    """Calculates the storage slot of the value of a mapping, or of a nested
+    mapping with a key for each level.
+
+    Examples:
+
+        >>> # balances[holder] of `mapping(address => uint256) balances` at slot 3
+        >>> calc_mapping_slot(3, "0x518C2143bDd79d3bc060BC4883d92D545D3E3bb0", "address")
+        >>> # allowance[owner][spender] of `mapping(address => mapping(address => uint256)) allowance` at slot 4
+        >>> calc_mapping_slot(4, (owner, spender), ["address", "address"])
+
+    :param slot: The slot of the mapping.
+    :type slot: int
+    :param key: The key, or a sequence of keys for nested mappings.
+    :type key: Any
+    :param key_type: The type of the key, or a sequence of the key types
+        for nested mappings, defaults to `uint256`.
+    :type key_type: Union[str, Sequence[str]]
+
+    :return: The slot of the value.
+    :rtype: int
+    """
+    if isinstance(key_type, str):
+        key, key_type = [key], [key_type]
+    for k, t in zip(key, key_type):
+        slot = int.from_bytes(keccak(_encode_mapping_key(k, t) + slot.to_bytes(32, "big")), "big")
+    return slot
+
+
+def calc_mapping_slots(slot: int, keys: Iterable[Any], key_type: Union[str, Sequence[str]] = "uint256") -> List[int]:
+    """Calculates the storage slots of the values of a mapping for many keys.
+
+    Examples:
+
+        >>> calc_mapping_slots(3, holders, "address")
+
+    Check :func:`calc_mapping_slot` for the parameters.
+
+    :return: The slots in the order of the keys.
+    :rtype: List[int]
+    """
+    if isinstance(key_type, str):
+        # the slot bytes are the same for all keys
+        suffix = slot.to_bytes(32, "big")
+        return [int.from_bytes(keccak(_encode_mapping_key(key, key_type) + suffix), "big") for key in keys]
+    return [calc_mapping_slot(slot, key, key_type) for key in keys]
+
+
+def calc_array_slot(slot: int, index: int = 0, element_slots: int = 1) -> int:
+    """Calculates the storage slot of an element of a dynamic array, whose
+    elements start at `keccak256(slot)`. Use :func:`calc_array_slots` for
+    elements smaller than 16 bytes, which are packed.
+
+    :param slot: The slot of the array, where its length is stored.
+    :type slot: int
+    :param index: The index of the element, defaults to 0.
+    :type index: int
+    :param element_slots: The number of slots taken by each element, e.g.
+        of a struct, defaults to 1.
+    :type element_slots: int
+
+    :return: The slot of the element.
+    :rtype: int
+    """
+    return (int.from_bytes(keccak(slot.to_bytes(32, "big")), "big") + index * element_slots) % STORAGE_SLOTS
+
+
+def calc_array_slots(slot: int, indices: Iterable[int], element_size: int = 32) -> List[Tuple[int, int]]:
+    """Calculates the storage slots of many elements of a dynamic array.
+
+    Examples:
+
+        >>> # the 3rd and 4th elements of a `uint128[]` at slot 2, packed in the same slot
+        >>> [(s0, o0), (s1, o1)] = calc_array_slots(2, [2, 3], 16)
+        >>> s0 == s1, o0, o1
+        (True, 0, 16)
+
+    :param slot: The slot of the array, where its length is stored.
+    :type slot: int
+    :param indices: The indices of the elements.
+    :type indices: Iterable[int]
+    :param element_size: The size of each element in bytes, defaults to 32.
+        Elements of at most 16 bytes are packed in the same slot.
+    :type element_size: int
+
+    :return: The slot and the offset in bytes of each element.
+    :rtype: List[Tuple[int, int]]
+    """
+    start = int.from_bytes(keccak(slot.to_bytes(32, "big")), "big")
+    if element_size <= 16:
+        per_slot = 32 // element_size
+        return [((start + i // per_slot) % STORAGE_SLOTS, i % per_slot * element_size) for i in indices]
+    element_slots = (element_size + 31) // 32
+    return [((start + i * element_slots) % STORAGE_SLOTS, 0) for i in indices]
+
+
+def calc_struct_member_slot(slot: int, member_slot: int) -> int:
+    """Calculates the storage slot of a struct member. The slots of members
+    relative to the struct are in the `storageLayout` output of solc.
+
+    Examples:
+
+        >>> # users[holder].balance, where `balance` is the 2nd slot of the struct
+        >>> calc_struct_member_slot(calc_mapping_slot(5, holder, "address"), 1)
+
+    :param slot: The slot of the struct.
+    :type slot: int
+    :param member_slot: The slot of the member relative to the struct.
+    :type member_slot: int
+
+    :return: The slot of the member.
+    :rtype: int
+    """
+    return (slot + member_slot) % STORAGE_SLOTS
+
+
+def find_create2_salt(
+    sender: HexStr,
+    initcode: HexStr,
+    predicate: Callable[[bytes], bool] = None,
+    prefix: str = None,
+    start: int = 0,
+    stop: int = 2**256,
+    workers: int = None,
+    chunk_size: int = 2**16,
+    timeout: float = None,
+) -> SearchResult:
+    """Searches for a salt, with which the contract created by the given
+    sender using the `CREATE2` opcode has an address matching the predicate
+    or the prefix.
+
+    The hash of the contract bytecode is computed once, and the salts are
+    tried in chunks of `chunk_size` by `workers` processes.
+
+    Examples:
+
+        >>> result = find_create2_salt(factory_addr, initcode, prefix="0x0000")
+        >>> result.value, result.address, result.rate
+        (27133, '0x0000a4Fbe1b61bEcd6b7eDA3A7c0E6cD21F4bB57', 1803645.3)
+        >>> # an address with at least 3 zero bytes, resumed from a previous search
+        >>> find_create2_salt(factory_addr, initcode, has_three_zero_bytes, start=result.next_start)
+
+    :param sender: The address of the sender, e.g. the factory contract.
+    :type sender: HexStr
+    :param initcode: The contract bytecode.
+    :type initcode: HexStr
+    :param predicate: Called with the 20 bytes of each address. It must be
+        picklable, e.g. a module-level function, unless `workers` is 1.
+    :type predicate: Callable[[bytes], bool]
+    :param prefix: The hex prefix of the address, compared in lowercase.
+        Used if `predicate` is not given.
+    :type prefix: str
+    :param start: The first salt to try, defaults to 0.
+    :type start: int
+    :param stop: The salts below `stop` are tried, defaults to 2**256.
+    :type stop: int
+    :param workers: The number of worker processes, defaults to the number
+        of CPUs. If 1, the salts are tried in the current process.
+    :type workers: int
+    :param chunk_size: The number of salts tried by a worker at a time,
+        defaults to 2**16.
+    :type chunk_size: int
+    :param timeout: Stops the search after `timeout` seconds, defaults to :const:`None`.
+    :type timeout: float
+
+    :return: The salt found as `value`, the address, the number of salts
+        tried and the hashes per second, and `next_start` to resume the
+        search if no salt is found.
+    :rtype: :class:`SearchResult <cheb3.search.SearchResult>`
+    """
+    if predicate is None:
+        if prefix is None:
+            raise Exception("Either `predicate` or `prefix` is required.")
+        predicate = AddressPrefix(prefix)
+    sender_bytes = bytes.fromhex(Web3.to_checksum_address(sender)[2:])
+    init_hash = bytes(Web3.keccak(hexstr=initcode))
+    chunks = (
+        (sender_bytes, init_hash, i, min(i + chunk_size, stop), predicate) for i in range(start, stop, chunk_size)
+    )
+
+    started_at = time.monotonic()
+    found, attempts, completed = run_search(search_create2_salts, chunks, workers, timeout)
+    result = SearchResult(attempts=attempts, elapsed=time.monotonic() - started_at)
+    if found is not None:
+        result.value, result.address = found[0], Web3.to_checksum_address(found[1])
+    else:
+        result.next_start = min(start + completed * chunk_size, stop)
+    logger.info(f"Tried {result.attempts} salts in {result.elapsed:.2f}s ({result.rate:.0f} hashes/s)")
+    return result
@@ -0,0 +1,28 @@
+import pytest
+from web3 import EthereumTesterProvider
+
+from cheb3 import Connection
+from cheb3.helper import Web3Helper
+
+
+# For testing purposes
+class ConnectionMock(Connection):
+    def __init__(self, provider=None, **kwargs) -> None:
+        self.w3 = Web3Helper(provider or EthereumTesterProvider(), **kwargs)
+
+
+@pytest.fixture(scope="module")
+def connection_options():
+    # the provider and the keyword arguments of `Web3Helper`, overridden by the modules
+    return dict()
+
+
+@pytest.fixture(scope="module")
+def setup(connection_options):
+    return ConnectionMock(**connection_options)
+
+
+@pytest.fixture(scope="module")
+def account(setup):
+    pkey = setup.w3.provider.ethereum_tester.backend.account_keys[0]
+    return setup.account(pkey)
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from web3 import AsyncEthereumTesterProvider
+
+from cheb3 import AsyncConnection
+from cheb3.helper import AsyncWeb3Helper
+from cheb3.utils import compile_file
+
+
+# For testing purposes
+class AsyncConnectionMock(AsyncConnection):
+    def __init__(self) -> None:
+        self.w3 = AsyncWeb3Helper(AsyncEthereumTesterProvider())
+        self.max_concurrency = 4
+
+
+@pytest.fixture(scope="module")
+def setup():
+    return AsyncConnectionMock()
+
+
+@pytest.fixture(scope="module")
+def account(setup):
+    pkey = setup.w3.provider.ethereum_tester.backend.account_keys[0]
+    return setup.account(pkey)
+
+
+def test_async_get_balance(setup, account):
+    async def main():
+        return await setup.gather(setup.get_balance(account.address), account.get_balance())
+
+    balance, account_balance = asyncio.run(main())
+    assert balance == account_balance > 0
+
+
+def test_async_get_storage_range(setup, account):
+    values = asyncio.run(setup.get_storage_range(account.address, 0, 5))
+    assert [int.from_bytes(value, "big") for value in values] == [0] * 5
+
+
+def test_async_concurrent_send_transaction(setup, account):
+    receiver = setup.account()
+
+    async def main():
+        receipts = await setup.gather(*[account.send_transaction(receiver.address, value=1) for _ in range(10)])
+        return receipts, await receiver.get_balance()
+
+    receipts, balance = asyncio.run(main())
+    assert all(receipt.status for receipt in receipts)
+    assert len({receipt.transactionHash for receipt in receipts}) == 10
+    assert balance == 10
+
+
+def test_async_send_transactions(setup, account):
+    receiver = setup.account()
+
+    async def main():
+        report = await account.send_transactions([{"to": receiver.address, "value": 1}] * 5)
+        return report, await receiver.get_balance()
+
+    report, balance = asyncio.run(main())
+    assert report.succeeded == 5
+    assert balance == 5
+
+
+def test_async_gather_return_exceptions(setup):
+    async def fail():
+        raise ValueError("failed")
+
+    async def main():
+        return await setup.gather(fail(), setup.account().get_balance(), return_exceptions=True)
+
+    error, balance = asyncio.run(main())
+    assert isinstance(error, ValueError)
+    assert balance == 0
+
+
+def test_async_contract(setup, account):
+    abi, bytecode = compile_file("tests/integration/contracts/MockWETH.sol", solc_version="0.8.20")["MockWETH"]
+    contract = setup.contract(account, abi=abi, bytecode=bytecode)
+
+    async def main():
+        await contract.deploy()
+        await setup.gather(*[contract.functions.deposit().send_transaction(value=10) for _ in range(3)])
+        return await contract.caller.balanceOf(account.address), await contract.functions.totalSupply().call()
+
+    balance, total_supply = asyncio.run(main())
+    assert balance == total_supply == 30
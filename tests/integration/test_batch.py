@@ -0,0 +1,106 @@
+from contextvars import ContextVar
+from importlib.metadata import version
+
+import pytest
+from packaging.version import Version
+from web3.providers import JSONBaseProvider
+from web3.exceptions import BlockNotFound
+
+from cheb3.utils import compile_file, decode_data, encode_with_signature
+
+# set up the keyfile account with a known address
+KEYFILE_ACCOUNT_PKEY = "0x58d23b55bc9cdce1f18c2500f40ff4ab7245df9a89505e9b1fa4851f623d241d"
+KEYFILE_ACCOUNT_ADDRESS = "0xdC544d1AA88Ff8bbd2F2AeC754B1F1e99e1812fd"
+
+
+@pytest.fixture(scope="module")
+def setup(setup):
+    conn = setup
+    conn.w3.eth.default_account = conn.w3.eth.accounts[0]
+
+    conn.w3.provider.ethereum_tester.add_account(KEYFILE_ACCOUNT_PKEY)
+
+    # fund the account
+    conn.w3.eth.send_transaction(
+        {
+            "from": conn.w3.eth.default_account,
+            "to": KEYFILE_ACCOUNT_ADDRESS,
+            "value": conn.w3.to_wei(1, "ether"),
+            "gas": 21000,
+            "gasPrice": 10**9,
+        }
+    )
+    return conn
+
+
+@pytest.fixture(scope="module")
+def account(setup):
+    return setup.account(KEYFILE_ACCOUNT_PKEY)
+
+
+@pytest.fixture(scope="module")
+def token_contract(setup, account):
+    abi, bytecode = compile_file("tests/integration/contracts/MockWETH.sol", solc_version="0.8.20")["MockWETH"]
+    contract = setup.contract(account, abi=abi, bytecode=bytecode)
+    contract.deploy()
+    return contract
+
+
+def test_web3_batching_internals(setup):
+    # `cheb3.batch` relies on these internals of web3.py, which may change in a new major version
+    assert Version(version("web3")) < Version("8")
+    assert isinstance(setup.w3.provider._batching_context, ContextVar)
+    assert callable(JSONBaseProvider.batch_request_func)
+    assert callable(setup.w3.manager._format_batched_response)
+
+
+def test_batch_get_balance(setup, account):
+    with setup.batch():
+        balance = setup.get_balance(account.address)
+        account_balance = account.get_balance()
+        assert not balance.done()
+    assert balance.result() == 10**18
+    assert account_balance.result() == 10**18
+
+
+def test_batch_get_code(setup, account):
+    with setup.batch():
+        code = setup.get_code(account.address)
+    assert code.result().to_0x_hex() == "0x"
+
+
+def test_batch_per_request_error(setup, account):
+    with setup.batch() as batch:
+        block = batch.add(setup.w3.eth.get_block, 2**32)
+        balance = setup.get_balance(account.address)
+    assert isinstance(block.exception(), BlockNotFound)
+    with pytest.raises(BlockNotFound):
+        block.result()
+    assert balance.result() == 10**18
+
+
+def test_batch_execute_returns_results_in_order(setup, account):
+    with setup.batch(max_size=1) as batch:
+        setup.get_balance(account.address)
+        setup.get_code(account.address)
+        results = batch.execute()
+    assert [r.result() for r in results] == [10**18, b""]
+
+
+def test_batch_contract_reads(setup, account, token_contract):
+    with setup.batch():
+        supply = token_contract.caller.totalSupply()
+        balance = token_contract.functions.balanceOf(account.address).call()
+        decimals = token_contract.get_storage_at(2)
+        raw = account.call(token_contract.address, data=encode_with_signature("balanceOf(address)", account.address))
+    assert supply.result() == 0
+    assert balance.result() == 0
+    assert decode_data(decimals.result(), ["uint8"]) == 18
+    assert raw.result() == b"\x00" * 32
+
+
+def test_batch_result_before_execution(setup, account):
+    with setup.batch():
+        balance = setup.get_balance(account.address)
+        with pytest.raises(Exception):
+            balance.result()
@@ -0,0 +1,61 @@
+# creation code of a contract that returns 42 for any call
+BYTECODE = "0x600a600c600039600a6000f3" + "602a60005260206000f3"
+ABI = [
+    {"type": "function", "name": "poke", "inputs": [{"type": "uint256", "name": "x"}], "outputs": [], "stateMutability": "nonpayable"},
+]
+
+
+def test_broadcast(setup, account):
+    receiver = setup.account()
+    contract = setup.contract(account, abi=ABI, bytecode=BYTECODE)
+    contract.deploy()
+    bundle = setup.bundle()
+    gas_price = setup.w3.eth.gas_price
+    for _ in range(3):
+        bundle.add(account, receiver.address, 1, gas_limit=21000, gas_price=gas_price)
+    bundle.add_function(contract.functions.poke(1), gas_limit=50000, gas_price=gas_price)
+    nonce = setup.w3.eth.get_transaction_count(account.address)
+    assert [tx["nonce"] for tx in bundle.transactions] == list(range(nonce, nonce + 4))
+
+    report = bundle.broadcast()
+    assert report.succeeded == 4
+    assert [r.tx_hash for r in report] == [tx["hash"] for tx in bundle.transactions]
+    assert receiver.get_balance() == 3
+    # the nonces of the bundle are skipped by the following transactions
+    account.send_transaction(receiver.address, 1)
+    assert receiver.get_balance() == 4
+
+
+def test_save_and_load(setup, account, tmp_path):
+    receiver = setup.account()
+    bundle = setup.bundle()
+    nonce = setup.w3.eth.get_transaction_count(account.address)
+    bundle.add(account, receiver.address, 1, nonce=nonce, gas_limit=21000, gas_price=10**9)
+    # a used nonce fails without stopping the others
+    bundle.add(account, receiver.address, 1, nonce=0, gas_limit=21000, gas_price=10**9)
+    bundle.add(account, receiver.address, 1, nonce=nonce + 1, gas_limit=21000, gas_price=10**9)
+    bundle.save(tmp_path / "bundle.json")
+
+    report = setup.load_bundle(tmp_path / "bundle.json").broadcast()
+    assert [r.success for r in report] == [True, False, True]
+    assert report[1].tx_hash is None
+    assert receiver.get_balance() == 2
+
+
+def test_nonces_reserved(setup, account):
+    receiver = setup.account()
+    nonce = setup.w3.eth.get_transaction_count(account.address)
+    first, second = setup.bundle(), setup.bundle()
+    first.add(account, receiver.address, 1, gas_limit=21000, gas_price=10**9)
+    # the nonce of the first bundle is not taken by the others
+    second.add(account, receiver.address, 1, gas_limit=21000, gas_price=10**9)
+    assert [first.transactions[0]["nonce"], second.transactions[0]["nonce"]] == [nonce, nonce + 1]
+    assert first.broadcast().succeeded == 1 and second.broadcast().succeeded == 1
+
+    bundle = setup.bundle()
+    bundle.add(account, receiver.address, 1, gas_limit=21000, gas_price=10**9)
+    bundle.discard()
+    assert len(bundle) == 0
+    # the reserved nonce is given back
+    account.send_transaction(receiver.address, 1)
+    assert receiver.get_balance() == 3
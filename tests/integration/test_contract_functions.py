@@ -0,0 +1,89 @@
+import pytest
+from web3.contract.base_contract import NonExistentReceiveFunction
+from web3.exceptions import ABIFunctionNotFound
+
+from cheb3.contract import _ContractArtifacts
+
+# creation code of a contract that returns 42 for any call
+BYTECODE = "0x600a600c600039600a6000f3" + "602a60005260206000f3"
+OUTPUTS = [{"type": "uint256", "name": ""}]
+ABI = [
+    {"type": "function", "name": "answer", "inputs": [], "outputs": OUTPUTS, "stateMutability": "view"},
+    {
+        "type": "function",
+        "name": "answer",
+        "inputs": [{"type": "uint256", "name": "x"}],
+        "outputs": OUTPUTS,
+        "stateMutability": "view",
+    },
+    {"type": "function", "name": "poke", "inputs": [{"type": "uint256", "name": "x"}], "outputs": [], "stateMutability": "nonpayable"},
+    {"type": "fallback", "stateMutability": "payable"},
+]
+
+
+@pytest.fixture(scope="module")
+def contract(setup):
+    account = setup.account(setup.w3.provider.ethereum_tester.backend.account_keys[0])
+    contract = setup.contract(account, abi=ABI, bytecode=BYTECODE)
+    contract.deploy()
+    return contract
+
+
+def test_functions_built_on_access(setup, contract):
+    functions = setup.contract(address=contract.address, abi=ABI).functions
+    assert "poke" not in functions.__dict__
+    assert functions.poke is functions.poke
+    assert functions.poke is functions["poke(uint256)"] is getattr(functions, "_poke(uint256)")
+    assert [fn.abi_element_identifier for fn in functions] == ["answer()", "answer(uint256)", "poke(uint256)"]
+    with pytest.raises(ABIFunctionNotFound):
+        functions.missing
+
+
+def test_overloaded_functions(contract):
+    assert contract.functions.answer().call() == 42
+    assert contract.functions["answer(uint256)"](1).call() == 42
+    assert contract.functions.poke(1).send_transaction().status == 1
+
+
+def test_caller(contract):
+    assert contract.caller.answer() == 42
+    assert contract.caller.answer(1) == 42
+    assert contract.caller({"from": contract.account.address}).answer() == 42
+    with pytest.raises(ABIFunctionNotFound):
+        contract.caller.missing
+
+
+def test_fallback_and_receive(setup, contract):
+    assert contract.fallback.send_transaction(value=1).status == 1
+    assert isinstance(contract.receive, NonExistentReceiveFunction)
+    with pytest.raises(AttributeError):
+        setup.contract(contract.account, abi=ABI, bytecode=BYTECODE).fallback
+
+
+def test_shared_abi_artifacts(setup, contract):
+    other = setup.contract(address=setup.account().address, abi=[dict(element) for element in ABI])
+    assert other._artifacts is contract._artifacts
+    assert sorted(vars(other)) == ["_artifacts", "_kwargs", "account", "address", "signer"]
+    assert type(other.functions.poke) is type(contract.functions.poke)
+    assert other.functions.poke.address != contract.functions.poke.address
+
+
+def test_overload_keeps_signer(contract):
+    # `answer` resolves to `answer()` and is dispatched to `answer(uint256)` by the argument
+    function = contract.functions.answer(1)
+    assert function.abi_element_identifier == "answer(uint256)"
+    assert function.send_transaction().status == 1
+
+
+def test_abi_artifacts_cache(setup, monkeypatch):
+    abi = [dict(element) for element in ABI[:1]]
+    artifacts = setup.contract(address=setup.account().address, abi=abi)._artifacts
+    # the caller's ABI changes are not seen by the shared artifacts
+    abi[0]["name"] = "question"
+    assert setup.contract(address=setup.account().address, abi=abi)._artifacts is not artifacts
+    assert artifacts.abi[0]["name"] == "answer"
+
+    monkeypatch.setattr(_ContractArtifacts, "MAX_CACHED", 2)
+    for name in ("a", "b", "c"):
+        setup.contract(address=setup.account().address, abi=[{**ABI[0], "name": name}])
+    assert len(_ContractArtifacts._by_hash) == 2 and len(_ContractArtifacts._by_id) == 2
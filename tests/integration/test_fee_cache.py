@@ -0,0 +1,91 @@
+import pytest
+from web3 import EthereumTesterProvider
+
+from cheb3 import Connection
+from cheb3.helper import FeeOracle, Web3Helper
+
+
+# For testing purposes
+class ConnectionMock(Connection):
+    def __init__(self, fee_cache_ttl: float = None) -> None:
+        self.w3 = Web3Helper(EthereumTesterProvider(), fee_cache_ttl=fee_cache_ttl)
+
+
+def make_account(conn):
+    pkey = conn.w3.provider.ethereum_tester.backend.account_keys[0]
+    return conn.account(pkey)
+
+
+def test_fee_cache_disabled():
+    conn = ConnectionMock()
+    account = make_account(conn)
+    account.send_transaction(conn.account().address, 1)
+    assert conn.w3.fee_cache.values == {}
+    assert conn.w3._chain_id == conn.w3.eth.chain_id
+
+
+def test_fee_cache_reused_within_ttl():
+    conn = ConnectionMock(fee_cache_ttl=3600)
+    account = make_account(conn)
+    receiver = conn.account()
+    account.send_transaction(receiver.address, 1, max_priority_fee_per_gas=10**9)
+    block_number = conn.w3.fee_cache.block_number
+    base_fee = conn.w3.fee_cache.values["base_fee"]
+
+    account.send_transaction(receiver.address, 1, max_priority_fee_per_gas=10**9)
+    # a new block has been mined, but the head is not checked within the ttl
+    assert conn.w3.eth.block_number > block_number
+    assert conn.w3.fee_cache.block_number == block_number
+    assert conn.w3.fee_cache.values["base_fee"] == base_fee
+    assert receiver.get_balance() == 2
+
+
+def test_fee_cache_invalidated_on_new_head():
+    conn = ConnectionMock(fee_cache_ttl=0)
+    account = make_account(conn)
+    receiver = conn.account()
+    account.send_transaction(receiver.address, 1)
+    assert "gas_price" in conn.w3.fee_cache.values
+
+    account.send_transaction(receiver.address, 1, max_priority_fee_per_gas=10**9)
+    assert conn.w3.fee_cache.block_number == conn.w3.eth.block_number - 1
+    assert "gas_price" not in conn.w3.fee_cache.values
+    assert "base_fee" in conn.w3.fee_cache.values
+
+
+def test_explicit_fees_skip_lookups():
+    conn = ConnectionMock(fee_cache_ttl=3600)
+    tx = conn.w3._build_transaction(conn.w3.eth.accounts[0], {"gas_price": 10**9, "nonce": 0})
+    assert tx["gasPrice"] == 10**9
+    tx = conn.w3._build_transaction(
+        conn.w3.eth.accounts[0], {"max_fee_per_gas": 2 * 10**9, "max_priority_fee_per_gas": 10**9, "nonce": 0}
+    )
+    assert "gasPrice" not in tx
+    assert tx["maxFeePerGas"] == 2 * 10**9
+    assert conn.w3.fee_cache.values == {}
+
+
+def test_fee_strategy():
+    conn = ConnectionMock(fee_cache_ttl=3600)
+    account = make_account(conn)
+    account.send_transaction(conn.account().address, 1)
+    receipt = account.send_transaction(conn.account().address, 1, fee_strategy="fast")
+    tx = conn.w3.eth.get_transaction(receipt.transactionHash)
+    assert tx["type"] == 2
+    fee_history = conn.w3.fee_cache.values["fee_history"]
+    assert tx["maxFeePerGas"] == tx["maxPriorityFeePerGas"] + fee_history["baseFeePerGas"][-1] * 2
+
+    with pytest.raises(Exception, match="Unknown fee strategy"):
+        account.send_transaction(conn.account().address, 1, fee_strategy="instant")
+
+
+def test_fee_oracle_percentiles():
+    oracle = FeeOracle()
+    fee_history = {
+        "baseFeePerGas": [10, 12, 16],
+        "reward": [[1, 5, 9], [3, 7, 11]],
+    }
+    assert oracle.suggest(fee_history, "cheap") == (2, 18)
+    assert oracle.suggest(fee_history, "normal") == (6, 32)
+    assert oracle.suggest(fee_history, "fast") == (10, 32)
+    assert oracle.suggest({"baseFeePerGas": [10], "reward": []}, "normal") == (None, 20)
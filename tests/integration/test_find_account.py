@@ -0,0 +1,27 @@
+from cheb3.utils import calc_create_address
+
+
+def test_find_account(setup):
+    account = setup.find_account(prefix="0x0a", workers=1)
+    assert account.address.lower().startswith("0x0a")
+    assert setup.account(account.private_key).address == account.address
+
+    account = setup.find_account(lambda address: address[-1] == 0xBE, workers=1, chunk_size=2000)
+    assert account.address.lower().endswith("be")
+
+    account = setup.find_account(prefix="0xc0", nonce=1, workers=2, chunk_size=2000)
+    assert calc_create_address(account.address, 1).lower().startswith("0xc0")
+
+
+def test_find_account_result(setup):
+    result = setup.find_account(prefix="0xc0", nonce=1, workers=1, chunk_size=2000, return_result=True)
+    assert calc_create_address(result.value.address, 1) == result.address
+    assert result.address.lower().startswith("0xc0")
+    assert result.attempts > 0 and result.rate > 0
+
+
+def test_find_account_max_attempts(setup):
+    assert setup.find_account(prefix="0x" + "00" * 8, workers=1, chunk_size=1000, max_attempts=3000) is None
+    result = setup.find_account(prefix="0x" + "00" * 8, workers=1, chunk_size=1000, max_attempts=3000, return_result=True)
+    assert result.value is None and result.address is None
+    assert result.attempts == 3000
@@ -0,0 +1,57 @@
+import pytest
+from web3 import EthereumTesterProvider
+
+from cheb3.account import Account
+from cheb3.helper import GasEstimateCache, Web3Helper
+
+# creation code of a contract that returns 42 for any call
+BYTECODE = "0x600a600c600039600a6000f3" + "602a60005260206000f3"
+ABI = [
+    {"type": "function", "name": "poke", "inputs": [{"type": "uint256", "name": "x"}], "outputs": [], "stateMutability": "nonpayable"},
+]
+
+
+@pytest.fixture(scope="module")
+def connection_options():
+    return {"gas_estimate_cache": True}
+
+
+def test_repeated_calls_hit_cache(setup, account):
+    cache = setup.w3.gas_estimate_cache
+    receiver = setup.account()
+    hits, misses = cache.hits, cache.misses
+    receipts = [account.send_transaction(receiver.address, 1) for _ in range(3)]
+    assert (cache.hits - hits, cache.misses - misses) == (2, 1)
+    gas_limits = {setup.w3.eth.get_transaction(receipt.transactionHash)["gas"] for receipt in receipts}
+    assert gas_limits == {23100}
+
+
+def test_contract_function_gas_limit(setup, account):
+    contract = setup.contract(account, abi=ABI, bytecode=BYTECODE)
+    contract.deploy()
+    receipt = contract.functions.poke(1).send_transaction()
+    gas_limit = setup.w3.eth.get_transaction(receipt.transactionHash)["gas"]
+    assert receipt.gasUsed < gas_limit < 3000000
+
+
+def test_disabled_by_default():
+    w3 = Web3Helper(EthereumTesterProvider())
+    sender = Account.factory(w3)(w3.provider.ethereum_tester.backend.account_keys[0])
+    sender.send_transaction("0x" + "11" * 20, 1)
+    assert w3.gas_estimate_cache.hits == w3.gas_estimate_cache.misses == 0
+
+
+def test_learn_from_gas_used():
+    cache = GasEstimateCache(True, margin=0)
+    tx = {"to": "0x" + "11" * 20, "data": "0x12345678", "value": 0, "gas": 50000}
+    assert cache.get(tx) is None
+    assert cache.put(tx, 50000) == 50000
+    for i, gas_used in enumerate((60000, 60000)):
+        tx_hash = "0x" + f"{i:064x}"
+        cache.track(tx_hash, tx)
+        cache.observe({"transactionHash": tx_hash, "status": 1, "gasUsed": gas_used})
+    assert cache.get(tx) == 60000
+    # out of gas
+    cache.track("0x" + "ff" * 32, tx)
+    cache.observe({"transactionHash": "0x" + "ff" * 32, "status": 0, "gasUsed": 50000})
+    assert cache.get(tx) is None
@@ -0,0 +1,64 @@
+import pytest
+from web3.exceptions import ContractLogicError
+
+
+# creation code of a contract that returns 42 for any call
+ANSWER_BYTECODE = "0x600a600c600039600a6000f3" + "602a60005260206000f3"
+# creation code of a contract that reverts for any call
+REVERTER_BYTECODE = "0x6005600c60003960056000f3" + "60006000fd"
+OUTPUTS = [{"type": "uint256", "name": ""}]
+ABI = [
+    {"type": "function", "name": "answer", "inputs": [], "outputs": OUTPUTS, "stateMutability": "view"},
+    {
+        "type": "function",
+        "name": "answer",
+        "inputs": [{"type": "uint256", "name": "x"}],
+        "outputs": OUTPUTS,
+        "stateMutability": "view",
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def contracts(setup):
+    account = setup.account(setup.w3.provider.ethereum_tester.backend.account_keys[0])
+    answers = [setup.contract(account, abi=ABI, bytecode=ANSWER_BYTECODE) for _ in range(2)]
+    reverter = setup.contract(account, abi=ABI, bytecode=REVERTER_BYTECODE)
+    for contract in answers + [reverter]:
+        contract.deploy()
+    return answers, reverter
+
+
+def test_multicall(setup, contracts):
+    answers, _ = contracts
+    setup.reset_stats()
+    with setup.multicall() as multicall:
+        results = [answers[0].caller.answer(), answers[1].functions.answer(7).call(), answers[1].caller.answer(1)]
+        assert len(multicall) == 3 and not results[0].done()
+    assert [result.result() for result in results] == [42, 42, 42]
+    assert setup.stats()["rpc"]["eth_call"]["count"] == 1
+
+
+def test_allow_failure(setup, contracts):
+    answers, reverter = contracts
+    with setup.multicall() as multicall:
+        answer = answers[0].caller.answer()
+        failed = reverter.caller.answer()
+    assert answer.result() == 42
+    assert isinstance(failed.exception(), ContractLogicError)
+
+    with setup.multicall() as multicall:
+        answer = answers[0].caller.answer()
+        multicall.add_call(reverter.functions.answer(), allow_failure=False)
+    with pytest.raises(ContractLogicError):
+        answer.result()
+
+
+def test_only_contract_reads(setup, contracts):
+    answers, _ = contracts
+    with pytest.raises(Exception, match="Only contract reads"):
+        with setup.multicall():
+            setup.get_balance(answers[0].address)
+    with pytest.raises(Exception, match="cannot have their own"):
+        with setup.multicall():
+            answers[0].functions.answer().call(block_identifier=1)
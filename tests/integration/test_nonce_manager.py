@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+from eth_utils.exceptions import ValidationError
+
+
+def test_sequential_nonces_without_receipts(setup, account):
+    receiver = setup.account()
+    nonce = setup.w3.eth.get_transaction_count(account.address)
+    tx_hashes = [account.send_transaction(receiver.address, 1, wait_for_receipt=False) for _ in range(5)]
+    nonces = [setup.w3.eth.get_transaction(tx_hash)["nonce"] for tx_hash in tx_hashes]
+    assert nonces == list(range(nonce, nonce + 5))
+    assert receiver.get_balance() == 5
+
+
+def test_shared_by_threads(setup, account):
+    receiver = setup.account()
+
+    def send():
+        for _ in range(5):
+            account.send_transaction(receiver.address, 1, wait_for_receipt=False)
+
+    threads = [threading.Thread(target=send) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert receiver.get_balance() == 20
+
+
+def test_resync_after_external_transaction(setup, account):
+    receiver = setup.account()
+    account.send_transaction(receiver.address, 1)
+    # send a transaction with the same key bypassing the nonce manager
+    setup.w3.eth.send_transaction(
+        {
+            "from": account.address,
+            "to": receiver.address,
+            "value": 1,
+            "gas": 21000,
+        }
+    )
+    account.send_transaction(receiver.address, 1)
+    assert receiver.get_balance() == 3
+
+
+def test_accounts_with_same_key_share_nonces(setup, account):
+    receiver = setup.account()
+    other = setup.account(account.private_key)
+    account.send_transaction(receiver.address, 1)
+    other.send_transaction(receiver.address, 1)
+    assert setup.w3._get_nonce_manager(account.address) is setup.w3._get_nonce_manager(other.address)
+    assert setup.w3._get_nonce_manager(account.address).nonce == setup.w3.eth.get_transaction_count(account.address)
+
+
+def test_explicit_nonce_error_is_raised(setup, account):
+    # an explicit nonce is not replaced after the node rejects it
+    with pytest.raises(ValidationError, match="Invalid transaction nonce"):
+        account.send_transaction(setup.account().address, 1, nonce=0)
+
+
+def test_reset_nonce(setup, account):
+    account.reset_nonce()
+    assert setup.w3._get_nonce_manager(account.address).nonce is None
+    account.send_transaction(setup.account().address, 1)
+    assert setup.w3._get_nonce_manager(account.address).nonce == setup.w3.eth.get_transaction_count(account.address)
+
+
+def test_sign_authorization_waits_for_send(setup, account):
+    manager = setup.w3._get_nonce_manager(account.address)
+    authorizations = []
+    # a transaction of the account being sent holds the lock until its nonce is used
+    with manager.lock:
+        nonce = manager.nonce = setup.w3.eth.get_transaction_count(account.address)
+        thread = threading.Thread(target=lambda: authorizations.append(account.sign_authorization(account.address)))
+        thread.start()
+        thread.join(0.2)
+        assert not authorizations
+        manager.use(nonce)
+    thread.join()
+    assert authorizations[0].nonce == nonce + 2
+    manager.reset()
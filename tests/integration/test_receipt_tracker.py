@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted, Web3RPCError
+
+from cheb3.receipt import ReceiptTracker
+
+
+def test_wait_for_transaction_receipt(setup, account):
+    tx_hash = account.send_transaction(setup.account().address, 1, wait_for_receipt=False)
+    receipt = setup.wait_for_transaction_receipt(tx_hash)
+    assert receipt.status == 1
+    assert receipt.transactionHash.hex() == tx_hash
+
+
+def test_wait_for_transaction_receipts(setup, account):
+    receiver = setup.account()
+    tx_hashes = [account.send_transaction(receiver.address, 1, wait_for_receipt=False) for _ in range(5)]
+    missing = "0x" + "00" * 32
+    receipts = setup.wait_for_transaction_receipts([*tx_hashes, missing], timeout=0.5)
+    assert [receipt.transactionHash.hex() for receipt in receipts[:-1]] == tx_hashes
+    assert receipts[-1] is None
+
+
+def test_timeout(setup):
+    with pytest.raises(TimeExhausted):
+        setup.wait_for_transaction_receipt("0x" + "11" * 32, timeout=0.3)
+
+
+def test_shared_by_threads(setup, account):
+    receiver = setup.account()
+    receipts = []
+
+    def send():
+        for _ in range(3):
+            receipts.append(account.send_transaction(receiver.address, 1))
+
+    threads = [threading.Thread(target=send) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(receipts) == 12 and all(receipt.status for receipt in receipts)
+    assert receiver.get_balance() == 12
+    # receipts are dropped once no one is waiting for them
+    tracker = setup.w3.receipt_tracker
+    assert not tracker._waiters and not tracker._receipts and not tracker._pending
+
+
+def test_block_receipts_fallback(setup, account, monkeypatch):
+    tx_hash = account.send_transaction(setup.account().address, 1, wait_for_receipt=False)
+    tracker = ReceiptTracker(setup.w3)
+    tracker._block_number = setup.w3.eth.block_number - 1
+
+    def unsupported(block_numbers, pending):
+        raise Web3RPCError("{'code': -32602, 'message': 'invalid argument 0'}")
+
+    monkeypatch.setattr(tracker, "_fetch_block_receipts", unsupported)
+    # any RPC error of `eth_getBlockReceipts` falls back to the receipts of the hashes
+    head, found = tracker._poll(set(), {HexBytes(tx_hash)})
+    assert found[HexBytes(tx_hash)].status == 1
+    assert not tracker.block_receipts_supported
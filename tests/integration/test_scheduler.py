@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+from web3 import EthereumTesterProvider
+
+from cheb3.scheduler import TransactionScheduler
+
+
+# eth-tester is not thread-safe, while real nodes handle requests concurrently
+class LockedEthereumTesterProvider(EthereumTesterProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def make_request(self, method, params):
+        with self._lock:
+            return super().make_request(method, params)
+
+
+@pytest.fixture(scope="module")
+def connection_options():
+    return {"provider": LockedEthereumTesterProvider()}
+
+
+@pytest.fixture(scope="module")
+def accounts(setup):
+    return [setup.account(pkey) for pkey in setup.w3.provider.ethereum_tester.backend.account_keys[:4]]
+
+
+def test_run(setup, accounts):
+    receiver = setup.account()
+    report = TransactionScheduler(accounts, max_pending=2, queue_size=4).run(
+        [{"to": receiver.address, "value": 1} for _ in range(20)]
+    )
+    assert len(report) == 20 and report.succeeded == 20
+    assert set(report.txs_per_account) <= {account.address for account in accounts}
+    assert sum(report.txs_per_account.values()) == 20
+    assert report.tx_per_second > 0
+    assert receiver.get_balance() == 20
+
+
+def test_submit_and_retries(setup, accounts):
+    receiver = setup.account()
+    with TransactionScheduler(accounts, retries=2) as scheduler:
+        ok = scheduler.submit({"to": receiver.address, "value": 1})
+        failed = scheduler.submit({"to": receiver.address, "value": 2 ** 256})
+    assert ok.result().success
+    assert not failed.result().success and failed.result().attempts == 3
+    assert receiver.get_balance() == 1
+
+
+def test_reverted_not_retried(setup, accounts):
+    # the runtime code always reverts
+    reverter = setup.contract(accounts[0], abi=[], bytecode="0x6005600c60003960056000f360006000fd")
+    reverter.deploy()
+    scheduler = TransactionScheduler(accounts, retries=2)
+    assert len(scheduler.join()) == 0
+
+    report = scheduler.run([{"to": reverter.address, "gas_limit": 100000}])
+    assert not report[0].success and report[0].receipt.status == 0
+    assert report[0].attempts == 1 and report.retries == 0
+
+
+def test_stop_without_join(setup, accounts):
+    scheduler = TransactionScheduler(accounts, retries=5)
+    with pytest.raises(KeyboardInterrupt):
+        with scheduler:
+            futures = [scheduler.submit({"value": 2 ** 256}) for _ in range(4)]
+            raise KeyboardInterrupt
+    # the failed items are done instead of retried after the workers stopped
+    results = [future.result(timeout=10) for future in futures]
+    assert not any(result.success for result in results)
+    assert scheduler._outstanding == 0 and scheduler._queue.empty()
+    assert len(scheduler.join()) == 4
@@ -0,0 +1,30 @@
+# creation code of a contract that reverts on any call
+REVERTER_BYTECODE = "0x6005600c60003960056000f3" + "60006000fd"
+
+
+def test_send_transactions(setup, account):
+    receiver = setup.account()
+    nonce = setup.w3.eth.get_transaction_count(account.address)
+    report = account.send_transactions([{"to": receiver.address, "value": i} for i in range(1, 6)])
+    assert len(report) == 5 and report.succeeded == 5
+    assert [setup.w3.eth.get_transaction(r.tx_hash)["nonce"] for r in report] == list(range(nonce, nonce + 5))
+    assert sum(report.txs_per_block.values()) == 5
+    assert receiver.get_balance() == 15
+
+
+def test_failures_do_not_stop_others(setup, account):
+    receiver = setup.account()
+    receipt = account.send_transaction(None, data=REVERTER_BYTECODE)
+    reverter = receipt.contractAddress
+    report = account.send_transactions(
+        [
+            {"to": receiver.address, "value": 1},
+            {"to": reverter, "gas_limit": 100000},
+            {"to": receiver.address, "value": 2 ** 256},
+            ({"to": receiver.address, "value": 1}, {"gas_limit": 21000}),
+        ]
+    )
+    assert [r.success for r in report] == [True, False, False, True]
+    assert report[1].receipt.status == 0
+    assert report[2].tx_hash is None and report[2].error is not None
+    assert receiver.get_balance() == 2
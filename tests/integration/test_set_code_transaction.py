@@ -99,3 +99,26 @@ def test_other_set_code(setup, account1, account2, token_contract, delegate_cont
     )
 
     assert setup.get_code(account1.address).to_0x_hex() == f"0xef0100{delegate_contract.address[2:].lower()}"
+
+
+def test_sign_authorizations(setup, account1, account2):
+    # creation code of a contract that returns 42 for any call
+    target = setup.contract(account1, abi=[], bytecode="0x600a600c600039600a6000f3602a60005260206000f3")
+    target.deploy()
+    accounts = [setup.account() for _ in range(3)]
+
+    authorization_list = setup.sign_authorizations(accounts + [account2], target.address, sender=account2)
+    assert [auth.nonce for auth in authorization_list] == [0, 0, 0, setup.w3.eth.get_transaction_count(account2.address) + 1]
+    # signed across worker processes
+    assert setup.sign_authorizations(accounts, target.address, workers=2, chunk_size=2) == authorization_list[:3]
+
+    account2.send_transaction(account2.address, authorization_list=authorization_list)
+    for account in accounts + [account2]:
+        assert setup.get_code(account.address).to_0x_hex() == "0xef0100" + target.address[2:].lower()
+
+
+def test_sign_authorizations_chain_id(setup):
+    # the chain ID is read in the same batch as the nonces
+    setup.w3._chain_id = None
+    authorization_list = setup.sign_authorizations([setup.account()], setup.account().address)
+    assert authorization_list[0].chain_id == setup.w3._chain_id == setup.w3.eth.chain_id
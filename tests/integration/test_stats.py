@@ -0,0 +1,75 @@
+import pytest
+from web3 import EthereumTesterProvider
+
+from cheb3.account import Account
+from cheb3.helper import Web3Helper
+from cheb3.stats import StatsMiddleware
+
+
+@pytest.fixture(scope="module")
+def records():
+    return []
+
+
+@pytest.fixture(scope="module")
+def connection_options(records):
+    return {"stats_hook": records.append}
+
+
+def test_send_transaction_stats(setup, account, records):
+    setup.reset_stats()
+    account.send_transaction(setup.account().address, 1)
+    account.send_transaction(setup.account().address, 1)
+
+    operation = setup.stats()["operations"]["Account.send_transaction"]
+    assert operation["count"] == 2 and operation["errors"] == 0
+    assert set(operation["phases"]) == {"build", "estimate", "sign", "broadcast", "mined"}
+    assert sum(operation["phases"].values()) <= operation["elapsed"]
+    assert records[-1].name == "Account.send_transaction"
+    assert operation["rpc_calls"] == sum(record.rpc_calls for record in records[-2:])
+
+    rpc = setup.stats()["rpc"]
+    assert rpc["eth_sendRawTransaction"]["count"] == 2
+    assert rpc["eth_sendRawTransaction"]["buckets"]["+Inf"] == 2
+
+
+def test_failed_operation(setup, account, records):
+    with pytest.raises(Exception):
+        account.send_transaction(setup.account().address, 2**256)
+    assert records[-1].error is not None
+    assert setup.stats()["operations"]["Account.send_transaction"]["errors"] == 1
+
+
+def test_reads_outside_operations(setup, account, records):
+    count = len(records)
+    setup.reset_stats()
+    account.get_balance()
+    assert len(records) == count
+    assert setup.stats()["operations"] == {}
+    assert setup.stats()["rpc"]["eth_getBalance"]["count"] == 1
+
+
+def test_batch_recorded_per_method(setup):
+    setup.reset_stats()
+    make_batch_request = StatsMiddleware(setup.w3).wrap_make_batch_request(lambda requests_info: [{}] * len(requests_info))
+    make_batch_request([("eth_getBalance", []), ("eth_getBalance", []), ("eth_getCode", [])])
+    rpc = setup.stats()["rpc"]
+    assert rpc["eth_getBalance"]["count"] == 2
+    assert rpc["eth_getCode"]["count"] == 1
+    assert rpc["batch"]["count"] == 1
+
+
+def test_hook_error_is_not_raised():
+    def hook(record):
+        raise RuntimeError("exporter down")
+
+    w3 = Web3Helper(EthereumTesterProvider(), stats_hook=hook)
+    account = Account.factory(w3)(w3.provider.ethereum_tester.backend.account_keys[0])
+    receiver = "0x" + "11" * 20
+    assert account.send_transaction(receiver, 5).status == 1
+    assert w3.eth.get_balance(receiver) == 5
+    # the error of the operation is not hidden by the hook
+    with pytest.raises(Exception) as e:
+        account.send_transaction(receiver, 2**256)
+    assert not isinstance(e.value, RuntimeError)
+    assert w3.stats.snapshot()["operations"]["Account.send_transaction"]["errors"] == 1
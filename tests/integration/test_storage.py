@@ -0,0 +1,188 @@
+import pytest
+from eth_utils import keccak
+
+from cheb3.storage import STORAGE_READER_CODE, StorageLayout
+from cheb3.utils import calc_mapping_slot
+
+OWNER = "0x3032Ab3Fa8C01d786D29dAdE018d7f2017918e12"
+NAME = "Cheb3 storage layout test, longer than 31 bytes"
+
+
+def data_slot(slot: int) -> int:
+    return int.from_bytes(keccak(slot.to_bytes(32, "big")), "big")
+
+
+STORAGE = {
+    # uint8 decimals, bool paused, address owner
+    0: int(OWNER, 16) << 16 | 1 << 8 | 18,
+    # int16 delta
+    1: (1 << 16) - 2,
+    # uint128[] amounts
+    2: 3,
+    data_slot(2): 2 << 128 | 1,
+    data_slot(2) + 1: 3,
+    # string symbol, in the slot
+    3: int.from_bytes(b"CHEB3".ljust(31, b"\0") + bytes([len("CHEB3") * 2]), "big"),
+    # mapping(address => uint256) balances
+    4: 0,
+    calc_mapping_slot(4, OWNER, "address"): 100,
+    # mapping(uint256 => string) notes
+    7: 0,
+    calc_mapping_slot(7, 1): int.from_bytes(b"note".ljust(31, b"\0") + bytes([len("note") * 2]), "big"),
+    # Point {uint64 x; uint64 y;} point
+    5: 7 << 64 | 5,
+    # string name, out of the slot
+    6: len(NAME) * 2 + 1,
+    data_slot(6): int.from_bytes(NAME[:32].encode(), "big"),
+    data_slot(6) + 1: int.from_bytes(NAME[32:].encode().ljust(32, b"\0"), "big"),
+}
+
+LAYOUT = {
+    "storage": [
+        {"label": "decimals", "offset": 0, "slot": "0", "type": "t_uint8"},
+        {"label": "paused", "offset": 1, "slot": "0", "type": "t_bool"},
+        {"label": "owner", "offset": 2, "slot": "0", "type": "t_address"},
+        {"label": "delta", "offset": 0, "slot": "1", "type": "t_int16"},
+        {"label": "amounts", "offset": 0, "slot": "2", "type": "t_array(t_uint128)dyn_storage"},
+        {"label": "symbol", "offset": 0, "slot": "3", "type": "t_string_storage"},
+        {"label": "balances", "offset": 0, "slot": "4", "type": "t_mapping(t_address,t_uint256)"},
+        {"label": "point", "offset": 0, "slot": "5", "type": "t_struct(Point)1_storage"},
+        {"label": "name", "offset": 0, "slot": "6", "type": "t_string_storage"},
+    ],
+    "types": {
+        "t_address": {"encoding": "inplace", "label": "address", "numberOfBytes": "20"},
+        "t_array(t_uint128)dyn_storage": {
+            "base": "t_uint128",
+            "encoding": "dynamic_array",
+            "label": "uint128[]",
+            "numberOfBytes": "32",
+        },
+        "t_bool": {"encoding": "inplace", "label": "bool", "numberOfBytes": "1"},
+        "t_int16": {"encoding": "inplace", "label": "int16", "numberOfBytes": "2"},
+        "t_mapping(t_address,t_uint256)": {
+            "encoding": "mapping",
+            "key": "t_address",
+            "label": "mapping(address => uint256)",
+            "numberOfBytes": "32",
+            "value": "t_uint256",
+        },
+        "t_string_storage": {"encoding": "bytes", "label": "string", "numberOfBytes": "32"},
+        "t_struct(Point)1_storage": {
+            "encoding": "inplace",
+            "label": "struct Point",
+            "members": [
+                {"label": "x", "offset": 0, "slot": "0", "type": "t_uint64"},
+                {"label": "y", "offset": 8, "slot": "0", "type": "t_uint64"},
+            ],
+            "numberOfBytes": "32",
+        },
+        "t_uint128": {"encoding": "inplace", "label": "uint128", "numberOfBytes": "16"},
+        "t_uint256": {"encoding": "inplace", "label": "uint256", "numberOfBytes": "32"},
+        "t_uint64": {"encoding": "inplace", "label": "uint64", "numberOfBytes": "8"},
+        "t_uint8": {"encoding": "inplace", "label": "uint8", "numberOfBytes": "1"},
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def contract(setup):
+    # the constructor stores `STORAGE` and deploys empty code
+    bytecode = "0x"
+    for slot, value in STORAGE.items():
+        bytecode += "7f" + value.to_bytes(32, "big").hex() + "7f" + slot.to_bytes(32, "big").hex() + "55"
+    bytecode += "60006000f3"
+    account = setup.account(setup.w3.provider.ethereum_tester.backend.account_keys[0])
+    contract = setup.contract(account, abi=[], bytecode=bytecode)
+    contract.deploy()
+    return contract
+
+
+def test_get_storage_slots(setup, contract):
+    slots = [0, data_slot(2) + 1, 5, 100]
+    values = setup.get_storage_slots(contract.address, slots)
+    assert [int.from_bytes(value, "big") for value in values] == [STORAGE.get(slot, 0) for slot in slots]
+
+    values = contract.get_storage_range(0, 7)
+    assert [int.from_bytes(value, "big") for value in values] == [STORAGE[slot] for slot in range(7)]
+
+
+def test_dump_storage(setup, contract):
+    assert contract.dump_storage(LAYOUT) == {
+        "decimals": 18,
+        "paused": True,
+        "owner": OWNER,
+        "delta": -2,
+        "amounts": [1, 2, 3],
+        "symbol": "CHEB3",
+        "balances": 4,
+        "point": {"x": 5, "y": 7},
+        "name": NAME,
+    }
+
+
+def test_read_mapping(contract):
+    holders = [OWNER, "0x0000000000000000000000000000000000000001"]
+    assert contract.read_mapping(4, holders) == [100, 0]
+    assert contract.read_mapping(7, [1, 2], "string", "uint256") == ["note", ""]
+
+
+def test_storage_layout_rounds(setup, contract):
+    rounds = []
+
+    def read(slots):
+        rounds.append(slots)
+        return setup.get_storage_slots(contract.address, slots)
+
+    layout = StorageLayout(LAYOUT)
+    # the slot of the mapping is not read
+    assert layout.slots() == [0, 1, 2, 3, 5, 6]
+    assert layout.decode(read)["amounts"] == [1, 2, 3]
+    # the variables first, then the array elements and the long string
+    assert rounds == [[0, 1, 2, 3, 5, 6], sorted([data_slot(2), data_slot(2) + 1, data_slot(6), data_slot(6) + 1])]
+
+
+def test_storage_reader(setup, contract, monkeypatch):
+    # the reader is deployed with the storage, as eth-tester does not support state overrides
+    runtime = bytes.fromhex(STORAGE_READER_CODE[2:])
+    bytecode = b""
+    for slot, value in STORAGE.items():
+        bytecode += b"\x7f" + value.to_bytes(32, "big") + b"\x7f" + slot.to_bytes(32, "big") + b"\x55"
+    # CODECOPY the runtime code after the constructor and return it
+    offset = (len(bytecode) + 13).to_bytes(2, "big")
+    bytecode += bytes([0x60, len(runtime), 0x61, *offset, 0x60, 0, 0x39, 0x60, len(runtime), 0x60, 0, 0xF3]) + runtime
+    account = setup.account(setup.w3.provider.ethereum_tester.backend.account_keys[0])
+    reader = setup.contract(account, abi=[], bytecode="0x" + bytecode.hex())
+    reader.deploy()
+
+    slots = [0, data_slot(6) + 1, 5, 100, 3]
+    data = b"".join(slot.to_bytes(32, "big") for slot in slots)
+    return_data = setup.w3.eth.call({"to": reader.address, "data": "0x" + data.hex()})
+    assert [return_data[i: i + 32] for i in range(0, len(return_data), 32)] == setup.get_storage_slots(
+        contract.address, slots
+    )
+    assert setup.w3.eth.call({"to": reader.address}) == b""
+
+    # the state override is dropped, the reader already has the storage
+    call = setup.w3.eth.call
+    monkeypatch.setattr(setup.w3.eth, "call", lambda tx, block, override: call(tx, block))
+    values = setup.w3._get_storage_slots(reader.address, slots, state_override=True)
+    assert values == setup.get_storage_slots(contract.address, slots)
+
+
+def test_storage_layout_max_items():
+    layout = StorageLayout(
+        {
+            "storage": [{"label": "name", "offset": 0, "slot": "0", "type": "t_bytes_storage"}],
+            "types": {"t_bytes_storage": {"encoding": "bytes", "label": "bytes", "numberOfBytes": "32"}},
+        },
+        max_items=2,
+    )
+    reads = []
+
+    def read(slots):
+        reads.append(slots)
+        # a garbage length of 2**40 bytes
+        return [(2**41 + 1).to_bytes(32, "big") if slot == 0 else b"\x11" * 32 for slot in slots]
+
+    assert layout.decode(read)["name"] == b"\x11" * 64
+    assert len(reads[1]) == 2
@@ -0,0 +1,65 @@
+import json
+import os
+
+import pytest
+
+from cheb3.artifacts import ArtifactStore, read_artifact
+from cheb3.utils import load_compiled, load_storage_layout
+
+ABI = [{"type": "function", "name": "owner", "inputs": [], "outputs": [{"name": "", "type": "address"}]}]
+
+
+def write_artifact(path, bytecode, **fields):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    artifact = {"abi": ABI, "bytecode": {"object": bytecode, "sourceMap": ""}, **fields, "ast": {"nodes": [1] * 100}}
+    with open(path, "w") as f:
+        json.dump(artifact, f, indent=2)
+
+
+def test_read_artifact(tmp_path):
+    path = tmp_path / "A.json"
+    write_artifact(path, "0x6080", id=1234567)
+    expected = {"abi": ABI, "bytecode": {"object": "0x6080", "sourceMap": ""}, "id": 1234567}
+    # members cut off by the end of the chunks are read again
+    for chunk_size in (1, 7, 64, 2**20):
+        assert read_artifact(str(path), ["abi", "bytecode"], chunk_size) == {k: expected[k] for k in ("abi", "bytecode")}
+        assert read_artifact(str(path), ["id", "missing"], chunk_size) == {"id": 1234567}
+
+
+def test_artifact_store(tmp_path):
+    out = tmp_path / "out"
+    write_artifact(out / "Token.sol" / "Token.json", "0x01")
+    write_artifact(out / "Token.sol" / "IToken.json", "0x")
+    write_artifact(out / "Mock.sol" / "Token.json", "0x02", storageLayout={"storage": [], "types": None})
+    write_artifact(out / "Setup.sol" / "Setup.0.8.20.json", "0x03")
+    os.makedirs(out / "build-info")
+
+    store = ArtifactStore(str(out))
+    assert store.names() == ["IToken", "Setup", "Token"]
+    assert store.get("Setup") == (ABI, "0x03")
+    assert store.get("Mock.sol:Token") == (ABI, "0x02")
+    assert store.get("Token", "src/Token.sol") == (ABI, "0x01")
+    with pytest.raises(Exception, match="ambiguous"):
+        store.get("Token")
+    with pytest.raises(Exception, match="not found"):
+        store.get("Missing")
+    assert store.storage_layout("Mock.sol:Token") == {"storage": [], "types": None}
+    with pytest.raises(Exception, match="storage layout"):
+        store.storage_layout("IToken")
+
+    # new artifacts are found, and modified artifacts are decoded again
+    write_artifact(out / "Exploit.sol" / "Exploit.json", "0x04")
+    assert "Exploit" in store
+    write_artifact(out / "Setup.sol" / "Setup.0.8.20.json", "0x0304")
+    assert store.get("Setup") == (ABI, "0x0304")
+
+
+def test_load_compiled(tmp_path):
+    out = tmp_path / "out"
+    write_artifact(out / "Token.sol" / "Token.json", "0x01", storageLayout={"storage": [], "types": {}})
+    abi, _ = load_compiled("Token.sol", base_path=str(out))
+    assert abi == ABI
+    # the cached artifact is not changed by the caller
+    abi[0]["name"] = "changed"
+    assert load_compiled("Token.sol", base_path=str(out)) == (ABI, "0x01")
+    assert load_storage_layout("Token.sol", base_path=str(out)) == {"storage": [], "types": {}}
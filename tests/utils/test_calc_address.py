@@ -1,4 +1,5 @@
-from cheb3.utils import calc_create_address, calc_create2_address
+from cheb3.search import CreateAddressIndex
+from cheb3.utils import calc_create_address, calc_create_addresses, calc_create2_address, find_create2_salt
 
 addr = "0x518C2143bDd79d3bc060BC4883d92D545D3E3bb0"
 
@@ -18,3 +19,51 @@ def test_calc_create2_address():
 
     assert calc_create2_address(addr, salt, init_code) == target
     assert calc_create2_address(addr.lower(), salt, init_code) == target
+
+
+def test_find_create2_salt():
+    init_code = "0x6019600c60003960196000f36f06bc8d9e5e9d436617b88de704a9f30760005260206000f3"
+
+    result = find_create2_salt(addr, init_code, prefix="0x00a", workers=1)
+    assert result.found and result.address.lower().startswith("0x00a")
+    assert calc_create2_address(addr, result.value, init_code) == result.address
+
+    result = find_create2_salt(addr, init_code, lambda address: address[-1] == 0x42, workers=1)
+    assert calc_create2_address(addr, result.value, init_code).endswith("42")
+
+    result = find_create2_salt(addr, init_code, prefix="0x00", workers=2, chunk_size=64)
+    assert calc_create2_address(addr, result.value, init_code).startswith("0x00")
+
+
+def test_find_create2_salt_resume():
+    init_code = "0x6019600c60003960196000f36f06bc8d9e5e9d436617b88de704a9f30760005260206000f3"
+    first = find_create2_salt(addr, init_code, prefix="0x0000", stop=100, workers=1, chunk_size=30)
+    assert not first.found and first.attempts == 100 and first.next_start == 100
+
+    # the first salt matching the prefix is 2392
+    result = find_create2_salt(addr, init_code, prefix="0x0001", start=2000, workers=1, chunk_size=300)
+    assert result.value == 2392
+
+
+def test_calc_create_addresses():
+    nonces = [0, 1, 127, 128, 256, 70000]
+    addresses = calc_create_addresses(addr, nonces)
+    assert addresses == [calc_create_address(addr, nonce) for nonce in nonces]
+    assert calc_create_addresses(addr, nonces, checksum=False) == [address.lower() for address in addresses]
+
+
+def test_create_address_index(tmp_path):
+    index = CreateAddressIndex()
+    index.add(addr, range(200))
+    factory = calc_create_address(addr, 1)
+    index.add(factory, [1, 5])
+    assert len(index) == 202
+    assert index.lookup("0x53D144BcF44de3DeE630b1CFEabD91AC3d3caF5a") == (addr, 1)
+    assert index.lookup(calc_create_address(factory, 5).lower()) == (factory, 5)
+    assert index.lookup(addr) is None
+
+    index.save(tmp_path / "index.json")
+    loaded = CreateAddressIndex.load(tmp_path / "index.json")
+    assert len(loaded) == 202
+    assert loaded.lookup(calc_create_address(addr, 199)) == (addr, 199)
+    assert calc_create_address(factory, 5) in loaded
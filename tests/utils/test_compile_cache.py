@@ -0,0 +1,188 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from packaging.version import Version
+from solcx.exceptions import SolcNotInstalled
+
+from cheb3 import compiler, utils
+from cheb3.compiler import CompileCache, collect_imports
+from cheb3.utils import compile_sol
+
+SOURCE = """// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+import "lib/Base.sol";
+
+contract Child is Base {}
+"""
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def test_collect_imports(tmp_path):
+    write(tmp_path / "lib" / "Base.sol", 'import {Helper} from "./utils/Helper.sol";\ncontract Base {}')
+    write(tmp_path / "lib" / "utils" / "Helper.sol", "library Helper {}")
+
+    imports = collect_imports(SOURCE, str(tmp_path))
+    assert sorted(imports) == [str(tmp_path / "lib" / "Base.sol"), str(tmp_path / "lib" / "utils" / "Helper.sol")]
+    assert imports[str(tmp_path / "lib" / "utils" / "Helper.sol")] == "library Helper {}"
+
+
+def test_cache_key(tmp_path):
+    write(tmp_path / "lib" / "Base.sol", "contract Base {}")
+    cache = CompileCache(str(tmp_path / "cache"))
+
+    key = cache.key(SOURCE, "0.8.20", ["abi", "bin"], str(tmp_path))
+    assert key == cache.key(SOURCE, "0.8.20", ["bin", "abi"], str(tmp_path))
+    assert key != cache.key(SOURCE, "0.8.19", ["abi", "bin"], str(tmp_path))
+    assert key != cache.key(SOURCE, "0.8.20", ["abi", "bin", "storage-layout"], str(tmp_path))
+    # changing an imported file invalidates the cached output
+    write(tmp_path / "lib" / "Base.sol", "contract Base { uint256 x; }")
+    assert key != cache.key(SOURCE, "0.8.20", ["abi", "bin"], str(tmp_path))
+
+
+def test_compile_sol_cached(tmp_path):
+    write(tmp_path / "lib" / "Base.sol", "contract Base {}")
+    cache = CompileCache(str(tmp_path / "cache"))
+    key = cache.key(SOURCE, "0.8.20", ["abi", "bin"], str(tmp_path))
+    cache.put(key, {"Child": {"abi": [], "bin": "6080"}})
+
+    # the cached output is returned without running solc
+    assert compile_sol(SOURCE, "Child", "0.8.20", str(tmp_path), cache=cache) == {"Child": ([], "6080")}
+
+
+def test_cache_eviction(tmp_path):
+    cache = CompileCache(str(tmp_path), max_size=350)
+    for i in range(3):
+        cache.put(str(i), {"C": {"abi": [], "bin": "00" * 40}})
+        os.utime(tmp_path / f"{i}.json", (i, i))
+    # reading an entry makes it the most recently used
+    assert cache.get("0") is not None
+    cache.put("3", {"C": {"abi": [], "bin": "00" * 40}})
+
+    assert sorted(os.listdir(tmp_path)) == ["0.json", "2.json", "3.json"]
+    cache.clear()
+    assert os.listdir(tmp_path) == []
+
+
+def test_cache_concurrency(tmp_path):
+    # entries evicted by the other threads are misses, not errors
+    cache = CompileCache(str(tmp_path), max_size=250)
+    compiled = {"C": {"abi": [], "bin": "00" * 40}}
+
+    def run(i):
+        for j in range(50):
+            cache.put(str(j % 3), compiled)
+            assert cache.get(str((i + j) % 3)) in (None, compiled)
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(run, range(4)))
+    assert all(name.endswith(".json") for name in os.listdir(tmp_path))
+
+
+def test_resolve_solc_version(tmp_path, monkeypatch):
+    installed = [Version("0.8.24"), Version("0.8.20"), Version("0.7.6")]
+    monkeypatch.setattr(compiler, "get_installed_solc_versions", lambda: list(installed))
+
+    def offline():
+        raise AssertionError("network access")
+
+    monkeypatch.setattr(compiler, "get_installable_solc_versions", offline)
+
+    write(tmp_path / "lib" / "Base.sol", "pragma solidity >=0.7.0 <0.8.21;\ncontract Base {}")
+    assert compiler.resolve_solc_version(SOURCE, str(tmp_path)) == Version("0.8.20")
+    assert compiler.resolve_solc_version("pragma solidity ^0.7.0;") == Version("0.7.6")
+    assert compiler.resolve_solc_version("contract A {}") == Version("0.8.24")
+    with pytest.raises(SolcNotInstalled, match=r"allow_install=True.*solcx\.install_solc"):
+        compiler.resolve_solc_version("pragma solidity ^0.6.0;")
+
+
+def test_collect_sources(tmp_path):
+    write(tmp_path / "src" / "Setup.sol", 'import {Gate} from "./Gate.sol";\nimport "lib/Base.sol";\ncontract Setup {}')
+    write(tmp_path / "src" / "Gate.sol", "contract Gate {}")
+    write(tmp_path / "node_modules" / "lib" / "Base.sol", 'import "../lib/Math.sol";\ncontract Base {}')
+    write(tmp_path / "node_modules" / "lib" / "Math.sol", "library Math {}")
+
+    sources, imports = compiler.collect_sources(
+        [str(tmp_path / "src" / "Setup.sol")], str(tmp_path / "node_modules"), str(tmp_path)
+    )
+    assert sorted(sources) == ["lib/Base.sol", "lib/Math.sol", "src/Gate.sol", "src/Setup.sol"]
+    assert imports["src/Setup.sol"] == ["src/Gate.sol", "lib/Base.sol"]
+    assert compiler.source_closure("lib/Base.sol", imports) == {"lib/Base.sol", "lib/Math.sol"}
+
+
+def test_collect_sources_remapped(tmp_path):
+    write(tmp_path / "src" / "Setup.sol", 'import "forge-std/Test.sol";\nimport "@oz/token/ERC20.sol";\ncontract Setup {}')
+    write(tmp_path / "lib" / "forge-std" / "src" / "Test.sol", 'import "forge-std/Vm.sol";\ncontract Test {}')
+    write(tmp_path / "lib" / "forge-std" / "src" / "Vm.sol", "interface Vm {}")
+    write(tmp_path / "lib" / "oz" / "contracts" / "token" / "ERC20.sol", "contract ERC20 {}")
+    write(tmp_path / "remappings.txt", "# comment\n@oz/=lib/oz/contracts/\n")
+    write(tmp_path / "foundry.toml", '[profile.default]\nremappings = [\n    "@oz/=lib/other/",\n    "ds-test/=lib/ds-test/",\n]\n')
+
+    remappings = compiler.load_remappings(str(tmp_path))
+    # remappings.txt takes precedence over foundry.toml and the inferred ones
+    assert remappings == [
+        "@oz/=lib/oz/contracts/",
+        "ds-test/=lib/ds-test/",
+        "forge-std/=lib/forge-std/src/",
+        "oz/=lib/oz/",
+    ]
+
+    sources, imports = compiler.collect_sources([str(tmp_path / "src" / "Setup.sol")], None, str(tmp_path), remappings)
+    assert imports["src/Setup.sol"] == ["lib/forge-std/src/Test.sol", "lib/oz/contracts/token/ERC20.sol"]
+    assert imports["lib/forge-std/src/Test.sol"] == ["lib/forge-std/src/Vm.sol"]
+    assert sorted(sources) == [
+        "lib/forge-std/src/Test.sol",
+        "lib/forge-std/src/Vm.sol",
+        "lib/oz/contracts/token/ERC20.sol",
+        "src/Setup.sol",
+    ]
+
+    # the longest context wins
+    _, imports = compiler.collect_sources(
+        [str(tmp_path / "src" / "Setup.sol")], None, str(tmp_path), ["@oz/=lib/other/", "src/:@oz/=lib/oz/contracts/"]
+    )
+    assert imports["src/Setup.sol"][1] == "lib/oz/contracts/token/ERC20.sol"
+
+
+def test_compile_project(tmp_path, monkeypatch):
+    write(tmp_path / "src" / "A.sol", "pragma solidity ^0.8.0;\ncontract A {}\ncontract Token {}")
+    write(tmp_path / "src" / "B.sol", 'pragma solidity ^0.7.0;\nimport "./C.sol";\ncontract Token {}')
+    write(tmp_path / "src" / "C.sol", "pragma solidity >=0.7.0;\ncontract C {}")
+    write(tmp_path / "lib" / "D.sol", "contract D {}")
+
+    installed = [Version("0.8.20"), Version("0.7.6")]
+    monkeypatch.setattr(compiler, "get_installed_solc_versions", lambda: list(installed))
+    monkeypatch.setattr(utils, "get_installed_solc_versions", lambda: list(installed))
+    invocations = []
+
+    def compile_standard_json(sources, units, solc_version, output_values, remappings=None):
+        invocations.append((solc_version, sorted(sources), units))
+        return {
+            unit: {name: {"abi": [], "bin": f"{solc_version}"} for name in re.findall(r"contract (\w+)", sources[unit])}
+            for unit in units
+        }
+
+    monkeypatch.setattr(utils, "compile_standard_json", compile_standard_json)
+    contracts = utils.compile_project(str(tmp_path), cache=CompileCache(str(tmp_path / "cache")))
+    # one invocation per solc version, with the imported files, and `lib/` is skipped
+    assert sorted(invocations) == [
+        (Version("0.7.6"), ["src/B.sol", "src/C.sol"], ["src/B.sol"]),
+        (Version("0.8.20"), ["src/A.sol", "src/C.sol"], ["src/A.sol", "src/C.sol"]),
+    ]
+    assert contracts == {
+        "A": ([], "0.8.20"),
+        "src/A.sol:Token": ([], "0.8.20"),
+        "src/B.sol:Token": ([], "0.7.6"),
+        "C": ([], "0.8.20"),
+    }
+
+    # compiled again from the cache
+    assert utils.compile_project(str(tmp_path), "A", cache=CompileCache(str(tmp_path / "cache"))) == {"A": ([], "0.8.20")}
+    assert len(invocations) == 2
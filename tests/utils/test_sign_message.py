@@ -1,5 +1,6 @@
 from web3 import Web3, EthereumTesterProvider
 from cheb3 import Connection
+from cheb3.utils import recover_many
 
 # set up the keyfile account with a known address
 KEYFILE_ACCOUNT_PKEY = "0x58d23b55bc9cdce1f18c2500f40ff4ab7245df9a89505e9b1fa4851f623d241d"
@@ -19,3 +20,16 @@ def test_sign_raw_message_hash():
         account.sign_raw_message_hash(msg_hash).signature.hex()
         == "bacc1c7c0b353c261bb992549e9f8d030b46078ec31b4a8a83fbfcccd64788b1483d259536cab4408bcba2bae75f126d06483b39e7e46fa0c16c9fa6e21c527e1b"
     )
+
+
+def test_sign_raw_message_hashes():
+    conn = ConnectionMock()
+    account = conn.account(KEYFILE_ACCOUNT_PKEY)
+    msg_hashes = [Web3.solidity_keccak(["uint256"], [i]) for i in range(10)]
+    expected = [account.sign_raw_message_hash(msg_hash) for msg_hash in msg_hashes]
+    assert account.sign_raw_message_hashes(msg_hashes) == expected
+    assert account.sign_raw_message_hashes(msg_hashes, workers=2, chunk_size=3) == expected
+
+    signatures = [sig.signature for sig in expected]
+    assert recover_many(msg_hashes, signatures) == [KEYFILE_ACCOUNT_ADDRESS] * 10
+    assert recover_many(msg_hashes, signatures, workers=2, chunk_size=4) == [KEYFILE_ACCOUNT_ADDRESS] * 10
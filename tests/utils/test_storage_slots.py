@@ -0,0 +1,83 @@
+from web3 import Web3
+
+from cheb3.storage import StorageLayout
+from cheb3.utils import (
+    calc_array_slot,
+    calc_array_slots,
+    calc_mapping_slot,
+    calc_mapping_slots,
+    calc_struct_member_slot,
+)
+
+addr = "0x518C2143bDd79d3bc060BC4883d92D545D3E3bb0"
+
+
+def keccak_int(types, values):
+    return int.from_bytes(Web3.solidity_keccak(types, values), "big")
+
+
+def test_calc_mapping_slot():
+    assert calc_mapping_slot(3, addr, "address") == keccak_int(["uint256", "uint256"], [int(addr, 16), 3])
+    assert calc_mapping_slot(3, addr.lower(), "address") == calc_mapping_slot(3, addr, "address")
+    assert calc_mapping_slot(1, 7) == keccak_int(["uint256", "uint256"], [7, 1])
+    assert calc_mapping_slot(1, -1, "int256") == keccak_int(["int256", "uint256"], [-1, 1])
+    # `bytes` and `string` keys are not padded
+    assert calc_mapping_slot(2, "cheb3", "string") == keccak_int(["string", "uint256"], ["cheb3", 2])
+    assert calc_mapping_slot(2, "0x1234", "bytes") == keccak_int(["bytes", "uint256"], ["0x1234", 2])
+
+
+def test_calc_nested_mapping_slot():
+    inner = calc_mapping_slot(4, addr, "address")
+    assert calc_mapping_slot(4, (addr, 9), ["address", "uint256"]) == calc_mapping_slot(inner, 9)
+
+
+def test_calc_mapping_slots():
+    keys = [addr, "0x0000000000000000000000000000000000000001"]
+    assert calc_mapping_slots(3, keys, "address") == [calc_mapping_slot(3, key, "address") for key in keys]
+    nested = [(addr, 1), (addr, 2)]
+    assert calc_mapping_slots(4, nested, ["address", "uint256"]) == [
+        calc_mapping_slot(4, key, ["address", "uint256"]) for key in nested
+    ]
+
+
+def test_calc_array_slots():
+    start = keccak_int(["uint256"], [2])
+    assert calc_array_slot(2) == start
+    assert calc_array_slot(2, 3, 2) == start + 6
+    assert calc_array_slots(2, [0, 1, 2, 3], 16) == [(start, 0), (start, 16), (start + 1, 0), (start + 1, 16)]
+    assert calc_array_slots(2, [0, 1], 33) == [(start, 0), (start + 2, 0)]
+    assert calc_struct_member_slot(start, 1) == start + 1
+
+
+def test_slots_wrap_around():
+    # an array whose elements start near the last slot
+    slot = next(s for s in range(10000) if keccak_int(["uint256"], [s]) >> 248 == 0xFF)
+    start = keccak_int(["uint256"], [slot])
+    index = 2**248
+    assert start + index >= 2**256
+    assert calc_array_slot(slot, index) == start + index - 2**256
+    assert calc_array_slots(slot, [index], 64) == [(start + 2 * index - 2**256, 0)]
+    assert calc_array_slots(slot, [2 * index], 16) == [(start + index - 2**256, 0)]
+    assert calc_struct_member_slot(2**256 - 1, 2) == 1
+
+    # a struct whose members wrap around the last slot
+    layout = StorageLayout(
+        {
+            "storage": [{"label": "point", "offset": 0, "slot": str(2**256 - 1), "type": "t_struct(Point)"}],
+            "types": {
+                "t_struct(Point)": {
+                    "encoding": "inplace",
+                    "label": "struct Point",
+                    "numberOfBytes": "64",
+                    "members": [
+                        {"label": "x", "offset": 0, "slot": "0", "type": "t_uint256"},
+                        {"label": "y", "offset": 0, "slot": "1", "type": "t_uint256"},
+                    ],
+                },
+                "t_uint256": {"encoding": "inplace", "label": "uint256", "numberOfBytes": "32"},
+            },
+        }
+    )
+    assert layout.slots() == [0, 2**256 - 1]
+    storage = {0: (2).to_bytes(32, "big"), 2**256 - 1: (1).to_bytes(32, "big")}
+    assert layout.decode(lambda slots: [storage[slot] for slot in slots]) == {"point": {"x": 1, "y": 2}}